@@ -138,10 +138,22 @@ def status(ctx, all_profiles, timeout):
         else:
             workers_info = '--> No workers are running. Use `verdi daemon incr` to start some!\n'
 
+        tasks = []
+        for pid, worker_status in client.get_worker_status(int(pid) for pid in worker_response['info']).items():
+            for computer, task_types in sorted(worker_status.get('tasks', {}).items()):
+                for task_type, counts in sorted(task_types.items()):
+                    tasks.append([pid, computer, task_type, counts['running'], counts['waiting']])
+
+        if tasks:
+            headers = ['PID', 'Computer', 'Task', 'Running', 'Waiting']
+            tasks_info = f'Transport tasks:\n{tabulate(tasks, headers=headers, tablefmt="simple")}\n'
+        else:
+            tasks_info = ''
+
         start_time = format_local_time(daemon_response['info']['create_time'])
         echo.echo(
             f'Daemon is running as PID {daemon_response["info"]["pid"]} since {start_time}\n'
-            f'Active workers [{len(workers)}]:\n{workers_info}\n'
+            f'Active workers [{len(workers)}]:\n{workers_info}\n{tasks_info}'
             'Use `verdi daemon [incr | decr] [num]` to increase / decrease the number of workers'
         )
 
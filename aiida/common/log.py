@@ -232,6 +232,12 @@ def configure_logging(with_orm=False, daemon=False, daemon_log_file=None):
             'level': get_config_option('logging.db_loglevel'),
             'class': 'aiida.orm.utils.log.DBLogHandler'
         }
+        if get_config_option('logging.db_buffered'):
+            config['handlers']['db_logger'].update({
+                'class': 'aiida.orm.utils.log.BufferedDBLogHandler',
+                'flush_size': get_config_option('logging.db_buffer_size'),
+                'flush_interval': get_config_option('logging.db_flush_interval'),
+            })
         config['loggers']['aiida']['handlers'].append('db_logger')
 
     dictConfig(config)
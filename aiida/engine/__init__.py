@@ -39,6 +39,7 @@ __all__ = (
     'InputPort',
     'InterruptableFuture',
     'JobManager',
+    'JobSubmitter',
     'JobsList',
     'ObjectLoader',
     'OutputPort',
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import contextlib
 import enum
+import json
 import os
 import pathlib
 import shutil
@@ -174,6 +175,50 @@ class DaemonClient:  # pylint: disable=too-many-public-methods
     def daemon_pid_file(self) -> str:
         return self.profile.filepaths['daemon']['pid']
 
+    @property
+    def daemon_workers_directory(self) -> str:
+        return self.profile.filepaths['daemon']['workers']
+
+    def _get_worker_status_file(self, pid: int) -> pathlib.Path:
+        return pathlib.Path(self.daemon_workers_directory) / f'{pid}.json'
+
+    def write_worker_status(self, pid: int, status: dict[str, t.Any]) -> None:
+        """Write the status of a daemon worker, such that it can be read by ``get_worker_status``.
+
+        :param pid: the process id of the worker.
+        :param status: the JSON-serializable status of the worker.
+        """
+        filepath = self._get_worker_status_file(pid)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, such that readers never see a partially written file.
+        filepath_temp = filepath.with_suffix('.tmp')
+        filepath_temp.write_text(json.dumps(status), encoding='utf8')
+        filepath_temp.replace(filepath)
+
+    def delete_worker_status(self, pid: int) -> None:
+        """Delete the status of a daemon worker.
+
+        :param pid: the process id of the worker.
+        """
+        self._get_worker_status_file(pid).unlink(missing_ok=True)
+
+    def get_worker_status(self, pids: t.Iterable[int]) -> dict[int, dict[str, t.Any]]:
+        """Return the status that the given daemon workers last wrote with ``write_worker_status``.
+
+        :param pids: the process ids of the workers.
+        :return: dictionary with the status for each process id, for the workers whose status could be read.
+        """
+        statuses = {}
+
+        for pid in pids:
+            try:
+                statuses[pid] = json.loads(self._get_worker_status_file(pid).read_text(encoding='utf8'))
+            except (OSError, ValueError):
+                continue
+
+        return statuses
+
     def get_circus_port(self) -> int:
         """Retrieve the port for the circus controller, which should be written to the circus port file.
 
@@ -16,12 +16,17 @@ plugin-specific operations.
 from __future__ import annotations
 
 from collections.abc import Mapping
+import dataclasses
+import io
 from logging import LoggerAdapter
 import os
 import pathlib
 import shutil
+import tarfile
+import tempfile
 from tempfile import NamedTemporaryFile
-from typing import Any, List
+import time
+from typing import Any, Iterator, List
 from typing import Mapping as MappingType
 from typing import Optional, Tuple, Union
 
@@ -33,6 +38,8 @@ from aiida.engine.processes.exit_code import ExitCode
 from aiida.manage.configuration import get_config_option
 from aiida.orm import CalcJobNode, Code, FolderData, Node, PortableCode, RemoteData, load_node
 from aiida.orm.utils.log import get_dblogger_extra
+from aiida.repository import Repository
+from aiida.repository.backend import AbstractRepositoryBackend
 from aiida.repository.common import FileType
 from aiida.schedulers.datastructures import JobState
 from aiida.transports import Transport
@@ -42,6 +49,48 @@ REMOTE_WORK_DIRECTORY_LOST_FOUND = 'lost+found'
 EXEC_LOGGER = AIIDA_LOGGER.getChild('execmanager')
 
 
+def upload_archive(transport: Transport, folder: Optional[SandboxFolder], workdir: str, codes: List[Code]) -> None:
+    """Upload the files of the portable codes and the content of the sandbox folder as a single archive.
+
+    The archive is written to a temporary file and then unpacked in the remote working directory by
+    ``Transport.put_archive``, such that only a single remote command is needed instead of one put per file. The files
+    of the portable codes are added first, so they can be overwritten by files in the sandbox folder.
+
+    :param transport: an already opened transport that supports archive uploads.
+    :param folder: the sandbox folder whose content to upload, if any.
+    :param workdir: the remote working directory in which to unpack the archive.
+    :param codes: the codes of the calculation; the files of instances of ``PortableCode`` are added to the archive.
+    """
+    with tempfile.TemporaryFile() as handle:
+        with tarfile.open(fileobj=handle, mode='w:gz') as archive:
+            for code in codes:
+                if not isinstance(code, PortableCode):
+                    continue
+
+                for root, dirnames, filenames in code.base.repository.walk():
+                    for dirname in dirnames:
+                        tarinfo = tarfile.TarInfo(str(root / dirname))
+                        tarinfo.type = tarfile.DIRTYPE
+                        tarinfo.mode = 0o755
+                        tarinfo.mtime = int(time.time())
+                        archive.addfile(tarinfo)
+
+                    for filename in filenames:
+                        filepath = root / filename
+                        content = code.base.repository.get_object_content(filepath, mode='rb')
+                        tarinfo = tarfile.TarInfo(str(filepath))
+                        tarinfo.size = len(content)
+                        tarinfo.mode = 0o755 if filepath == pathlib.PurePosixPath(code.filepath_executable) else 0o644
+                        tarinfo.mtime = int(time.time())
+                        archive.addfile(tarinfo, io.BytesIO(content))
+
+            for filename in folder.get_content_list() if folder is not None else []:
+                archive.add(folder.get_abs_path(filename), arcname=filename)
+
+        handle.seek(0)
+        transport.put_archive(handle, workdir)
+
+
 def _find_data_node(inputs: MappingType[str, Any], uuid: str) -> Optional[Node]:
     """Find and return the node with the given UUID from a nested mapping of input nodes.
 
@@ -62,6 +111,27 @@ def _find_data_node(inputs: MappingType[str, Any], uuid: str) -> Optional[Node]:
     return data_node
 
 
+@dataclasses.dataclass
+class UploadInfo:
+    """The state of the upload of a calculation job that is passed from :func:`prepare_upload` to the next stages.
+
+    It does not reference any ORM entities, such that :func:`upload_files` can be called in a thread other than the one
+    of the event loop.
+    """
+
+    pk: int
+    folder: SandboxFolder
+    workdir: str
+    computer_uuid: str
+    computer_label: str
+    logger_extra: dict[str, Any]
+    provenance_exclude_list: List[str]
+    remote_copy_list: List[Tuple[str, str, str]]
+    remote_symlink_list: List[Tuple[str, str, str]]
+    archive_upload: bool = False
+    dry_run: bool = False
+
+
 def upload_calculation(
     node: CalcJobNode,
     transport: Transport,
@@ -72,11 +142,44 @@ def upload_calculation(
 ) -> None:
     """Upload a `CalcJob` instance
 
+    The upload consists of :func:`prepare_upload`, :func:`upload_files` and :func:`store_upload`, which can also be
+    called separately, for example to transfer the files in a thread other than the one of the event loop.
+
     :param node: the `CalcJobNode`.
     :param transport: an already opened transport to use to submit the calculation.
     :param calc_info: the calculation info datastructure returned by `CalcJob.presubmit`
     :param folder: temporary local file system folder containing the inputs written by `CalcJob.prepare_for_submission`
     """
+    upload_info = prepare_upload(node, transport, calc_info, folder, inputs, dry_run)
+
+    if upload_info is None:
+        return calc_info
+
+    upload_files(transport, upload_info)
+    store_upload(node, upload_info)
+
+
+def prepare_upload(
+    node: CalcJobNode,
+    transport: Transport,
+    calc_info: CalcInfo,
+    folder: SandboxFolder,
+    inputs: Optional[MappingType[str, Any]] = None,
+    dry_run: bool = False
+) -> Optional[UploadInfo]:
+    """Prepare the upload of a `CalcJob` instance.
+
+    This creates the remote working directory, uploads the files of the portable codes and copies the files of the
+    ``local_copy_list`` to the sandbox folder. The current working directory of the transport is changed to the remote
+    working directory.
+
+    :param node: the `CalcJobNode`.
+    :param transport: an already opened transport to use to submit the calculation.
+    :param calc_info: the calculation info datastructure returned by `CalcJob.presubmit`
+    :param folder: temporary local file system folder containing the inputs written by `CalcJob.prepare_for_submission`
+    :return: the state of the upload to pass to :func:`upload_files` and :func:`store_upload`, or ``None`` if the
+        calculation was already uploaded.
+    """
     # pylint: disable=too-many-locals,too-many-branches,too-many-statements
 
     # If the calculation already has a `remote_folder`, simply return. The upload was apparently already completed
@@ -85,7 +188,7 @@ def upload_calculation(
     link_label = 'remote_folder'
     if node.base.links.get_outgoing(RemoteData, link_label_filter=link_label).first():
         EXEC_LOGGER.warning(f'CalcJobNode<{node.pk}> already has a `{link_label}` output: skipping upload')
-        return calc_info
+        return None
 
     computer = node.computer
 
@@ -170,12 +273,19 @@ def upload_calculation(
         workdir = transport.getcwd()
         node.set_remote_workdir(workdir)
 
+    # If enabled and supported by the transport, all files are uploaded as a single archive once the sandbox is complete
+    archive_upload = not dry_run and transport.SUPPORTS_ARCHIVE_UPLOAD and get_config_option('transport.archive_upload')
+
     # I first create the code files, so that the code can put
     # default files to be overwritten by the plugin itself.
     # Still, beware! The code file itself could be overwritten...
     # But I checked for this earlier.
+    if archive_upload and any(isinstance(code, PortableCode) for code in input_codes):
+        logger.debug(f'[submission of calculation {node.pk}] uploading portable code files as a single archive...')
+        upload_archive(transport, None, workdir, input_codes)
+
     for code in input_codes:
-        if isinstance(code, PortableCode):
+        if isinstance(code, PortableCode) and not archive_upload:
             # Note: this will possibly overwrite files
             for root, dirnames, filenames in code.base.repository.walk():
                 # mkdir of root
@@ -238,54 +348,93 @@ def upload_calculation(
 
                 provenance_exclude_list.append(target)
 
+    return UploadInfo(
+        pk=node.pk,
+        folder=folder,
+        workdir=workdir,
+        computer_uuid=computer.uuid,
+        computer_label=computer.label,
+        logger_extra=logger_extra,
+        provenance_exclude_list=provenance_exclude_list,
+        remote_copy_list=remote_copy_list,
+        remote_symlink_list=remote_symlink_list,
+        archive_upload=archive_upload,
+        dry_run=dry_run,
+    )
+
+
+def upload_files(transport: Transport, upload_info: UploadInfo) -> None:
+    """Upload the content of the sandbox folder and perform the remote copies and symlinks of a `CalcJob` instance.
+
+    This function only operates on the transport and on plain data. The current working directory of the transport is
+    changed to the remote working directory first, so it is safe to call in a thread other than the one of the event
+    loop, provided no other thread uses the transport at the same time.
+
+    :param transport: an already opened transport to use to submit the calculation.
+    :param upload_info: the state of the upload returned by :func:`prepare_upload`.
+    """
+    logger = LoggerAdapter(logger=EXEC_LOGGER, extra=upload_info.logger_extra)
+    pk = upload_info.pk
+    folder = upload_info.folder
+    workdir = upload_info.workdir
+    remote_copy_list = upload_info.remote_copy_list
+    remote_symlink_list = upload_info.remote_symlink_list
+    computer_label = upload_info.computer_label
+
     # In a dry_run, the working directory is the raw input folder, which will already contain these resources
-    if not dry_run:
-        for filename in folder.get_content_list():
-            logger.debug(f'[submission of calculation {node.pk}] copying file/folder {filename}...')
-            transport.put(folder.get_abs_path(filename), filename)
+    if not upload_info.dry_run:
+        transport.chdir(workdir)
+
+        if upload_info.archive_upload:
+            logger.debug(f'[submission of calculation {pk}] uploading files/folders as a single archive...')
+            upload_archive(transport, folder, workdir, [])
+        else:
+            for filename in folder.get_content_list():
+                logger.debug(f'[submission of calculation {pk}] copying file/folder {filename}...')
+                transport.put(folder.get_abs_path(filename), filename)
 
         for (remote_computer_uuid, remote_abs_path, dest_rel_path) in remote_copy_list:
-            if remote_computer_uuid == computer.uuid:
+            if remote_computer_uuid == upload_info.computer_uuid:
                 logger.debug(
-                    f'[submission of calculation {node.pk}] copying {dest_rel_path} '
-                    f'remotely, directly on the machine {computer.label}'
+                    f'[submission of calculation {pk}] copying {dest_rel_path} '
+                    f'remotely, directly on the machine {computer_label}'
                 )
                 try:
                     transport.copy(remote_abs_path, dest_rel_path)
                 except FileNotFoundError:
                     logger.warning(
-                        f'[submission of calculation {node.pk}] Unable to copy remote '
+                        f'[submission of calculation {pk}] Unable to copy remote '
                         f'resource from {remote_abs_path} to {dest_rel_path}! NOT Stopping but just ignoring!.'
                     )
                 except (IOError, OSError):
                     logger.warning(
-                        f'[submission of calculation {node.pk}] Unable to copy remote '
+                        f'[submission of calculation {pk}] Unable to copy remote '
                         f'resource from {remote_abs_path} to {dest_rel_path}! Stopping.'
                     )
                     raise
             else:
                 raise NotImplementedError(
-                    f'[submission of calculation {node.pk}] Remote copy between two different machines is '
+                    f'[submission of calculation {pk}] Remote copy between two different machines is '
                     'not implemented yet'
                 )
 
         for (remote_computer_uuid, remote_abs_path, dest_rel_path) in remote_symlink_list:
-            if remote_computer_uuid == computer.uuid:
+            if remote_computer_uuid == upload_info.computer_uuid:
                 logger.debug(
-                    f'[submission of calculation {node.pk}] copying {dest_rel_path} remotely, '
-                    f'directly on the machine {computer.label}'
+                    f'[submission of calculation {pk}] copying {dest_rel_path} remotely, '
+                    f'directly on the machine {computer_label}'
                 )
                 try:
                     transport.symlink(remote_abs_path, dest_rel_path)
                 except (IOError, OSError):
                     logger.warning(
-                        f'[submission of calculation {node.pk}] Unable to create remote symlink '
+                        f'[submission of calculation {pk}] Unable to create remote symlink '
                         f'from {remote_abs_path} to {dest_rel_path}! Stopping.'
                     )
                     raise
             else:
                 raise IOError(
-                    f'It is not possible to create a symlink between two different machines for calculation {node.pk}'
+                    f'It is not possible to create a symlink between two different machines for calculation {pk}'
                 )
     else:
 
@@ -295,7 +444,7 @@ def upload_calculation(
                 for remote_computer_uuid, remote_abs_path, dest_rel_path in remote_copy_list:
                     handle.write(
                         f'would have copied {remote_abs_path} to {dest_rel_path} in working '
-                        f'directory on remote {computer.label}'
+                        f'directory on remote {computer_label}'
                     )
 
         if remote_symlink_list:
@@ -304,9 +453,18 @@ def upload_calculation(
                 for remote_computer_uuid, remote_abs_path, dest_rel_path in remote_symlink_list:
                     handle.write(
                         f'would have created symlinks from {remote_abs_path} to {dest_rel_path} in working'
-                        f'directory on remote {computer.label}'
+                        f'directory on remote {computer_label}'
                     )
 
+
+def store_upload(node: CalcJobNode, upload_info: UploadInfo) -> None:
+    """Store the input files of a `CalcJob` instance in its repository and attach the remote working directory.
+
+    :param node: the `CalcJobNode`.
+    :param upload_info: the state of the upload returned by :func:`prepare_upload`.
+    """
+    folder = upload_info.folder
+
     # Loop recursively over content of the sandbox folder copying all that are not in `provenance_exclude_list`. Note
     # that directories are not created explicitly. The `node.put_object_from_filelike` call will create intermediate
     # directories for nested files automatically when needed. This means though that empty folders in the sandbox or
@@ -316,7 +474,7 @@ def upload_calculation(
     # not to accidentally move files to the repository that should not go there at all cost. Note that all entries in
     # the provenance exclude list are normalized first, just as the paths that are in the sandbox folder, otherwise the
     # direct equality test may fail, e.g.: './path/file.txt' != 'path/file.txt' even though they reference the same file
-    provenance_exclude_list = [os.path.normpath(entry) for entry in provenance_exclude_list]
+    provenance_exclude_list = [os.path.normpath(entry) for entry in upload_info.provenance_exclude_list]
 
     for root, _, filenames in os.walk(folder.abspath):
         for filename in filenames:
@@ -342,13 +500,13 @@ def upload_calculation(
     # files, however, this means we have to manually update the node's repository metadata.
     node.base.repository._update_repository_metadata()  # pylint: disable=protected-access
 
-    if not dry_run:
+    if not upload_info.dry_run:
         # Make sure that attaching the `remote_folder` with a link is the last thing we do. This gives the biggest
         # chance of making this method idempotent. That is to say, if a runner gets interrupted during this action, it
         # will simply retry the upload, unless we got here and managed to link it up, in which case we move to the next
         # task. Because in that case, the check for the existence of this link at the top of this function will exit
         # early from this command.
-        remotedata = RemoteData(computer=computer, remote_path=workdir)
+        remotedata = RemoteData(computer=node.computer, remote_path=upload_info.workdir)
         remotedata.base.links.add_incoming(node, link_type=LinkType.CREATE, link_label='remote_folder')
         remotedata.store()
 
@@ -360,27 +518,68 @@ def submit_calculation(calculation: CalcJobNode, transport: Transport) -> str |
     :param transport: an already opened transport to use to submit the calculation.
     :return: the job id as returned by the scheduler `submit_from_script` call
     """
-    job_id = calculation.get_job_id()
+    result = _submit_calculations([calculation], transport, batched=False)[0]
+    assert not isinstance(result, Exception)
+    return result
 
-    # If the `job_id` attribute is already set, that means this function was already executed once and the scheduler
-    # submit command was successful as the job id it returned was set on the node. This scenario can happen when the
-    # daemon runner gets shutdown right after accomplishing the submission task, but before it gets the chance to
-    # finalize the state transition of the `CalcJob` to the `UPDATE` transport task. Since the job is already submitted
-    # we do not want to submit it a second time, so we simply return the existing job id here.
-    if job_id is not None:
-        return job_id
 
-    scheduler = calculation.computer.get_scheduler()
-    scheduler.set_transport(transport)
+def submit_calculations(calculations: List[CalcJobNode], transport: Transport) -> List[str | ExitCode | Exception]:
+    """Submit previously uploaded `CalcJob` instances of the same computer to the scheduler with a single command.
 
-    submit_script_filename = calculation.get_option('submit_script_filename')
-    workdir = calculation.get_remote_workdir()
-    result = scheduler.submit_from_script(workdir, submit_script_filename)
+    The jobs are submitted with the scheduler `submit_from_scripts` call. Like :func:`submit_calculation`, the job of a
+    calculation that already has a job id is not submitted again.
 
-    if isinstance(result, str):
-        calculation.set_job_id(result)
+    :param calculations: the instances of CalcJobNode to submit.
+    :param transport: an already opened transport to use to submit the calculations.
+    :return: list with for each calculation, in the same order, the job id or ``ExitCode`` as returned by the scheduler,
+        or the exception that was raised while parsing the output of its submit command.
+    """
+    return _submit_calculations(calculations, transport, batched=True)
 
-    return result
+
+def _submit_calculations(calculations: List[CalcJobNode], transport: Transport,
+                         batched: bool) -> List[str | ExitCode | Exception]:
+    """Submit previously uploaded `CalcJob` instances of the same computer to the scheduler.
+
+    :param calculations: the instances of CalcJobNode to submit.
+    :param transport: an already opened transport to use to submit the calculations.
+    :param batched: whether to submit the jobs with a single `submit_from_scripts` call instead of a `submit_from_script`
+        call for each of them.
+    :return: list with for each calculation, in the same order, the job id or ``ExitCode`` as returned by the scheduler,
+        or the exception that was raised while parsing the output of its submit command.
+    """
+    results: dict[int, str | ExitCode | Exception] = {}
+    submissions: dict[int, Tuple[str, str]] = {}
+
+    for index, calculation in enumerate(calculations):
+        job_id = calculation.get_job_id()
+
+        # If the `job_id` attribute is already set, that means this function was already executed once and the
+        # scheduler submit command was successful as the job id it returned was set on the node. This scenario can
+        # happen when the daemon runner gets shutdown right after accomplishing the submission task, but before it gets
+        # the chance to finalize the state transition of the `CalcJob` to the `UPDATE` transport task. Since the job is
+        # already submitted we do not want to submit it a second time, so we simply return the existing job id here.
+        if job_id is not None:
+            results[index] = job_id
+        else:
+            submissions[index] = (calculation.get_remote_workdir(), calculation.get_option('submit_script_filename'))
+
+    if submissions:
+        scheduler = calculations[next(iter(submissions))].computer.get_scheduler()
+        scheduler.set_transport(transport)
+
+        if batched:
+            submitted = scheduler.submit_from_scripts(list(submissions.values()))
+        else:
+            submitted = [scheduler.submit_from_script(*submission) for submission in submissions.values()]
+
+        for index, result in zip(submissions, submitted):
+            if isinstance(result, str):
+                calculations[index].set_job_id(result)
+
+            results[index] = result
+
+    return [results[index] for index in range(len(calculations))]
 
 
 def stash_calculation(calculation: CalcJobNode, transport: Transport) -> None:
@@ -460,55 +659,204 @@ def retrieve_calculation(calculation: CalcJobNode, transport: Transport, retriev
     :param retrieved_temporary_folder: the absolute path to a directory in which to store the files
         listed, if any, in the `retrieved_temporary_folder` of the jobs CalcInfo
     """
-    logger_extra = get_dblogger_extra(calculation)
-    workdir = calculation.get_remote_workdir()
     filepath_sandbox = get_config_option('storage.sandbox') or None
 
-    EXEC_LOGGER.debug(f'Retrieving calc {calculation.pk}', extra=logger_extra)
-    EXEC_LOGGER.debug(f'[retrieval of calc {calculation.pk}] chdir {workdir}', extra=logger_extra)
+    if is_retrieved(calculation):
+        return
+
+    if get_config_option('transport.stream_retrieved_files'):
+        with transport:
+            stream_retrieved_calculation(calculation, transport, retrieved_temporary_folder)
+        return
+
+    with SandboxFolder(filepath_sandbox) as folder:
+        with transport:
+            download_calculation(
+                transport,
+                calculation.get_remote_workdir(),
+                folder.abspath,
+                calculation.get_retrieve_list(),
+                retrieved_temporary_folder,
+                calculation.get_retrieve_temporary_list(),
+                label=f'calc {calculation.pk}',
+            )
+        store_retrieved_calculation(calculation, folder.abspath, retrieved_temporary_folder)
+
+
+def is_retrieved(calculation: CalcJobNode) -> bool:
+    """Return whether the files of the calculation were already retrieved.
 
-    # If the calculation already has a `retrieved` folder, simply return. The retrieval was apparently already completed
-    # before, which can happen if the daemon is restarted and it shuts down after retrieving but before getting the
-    # chance to perform the state transition. Upon reloading this calculation, it will re-attempt the retrieval.
+    If the calculation already has a `retrieved` folder, the retrieval was apparently already completed before, which
+    can happen if the daemon is restarted and it shuts down after retrieving but before getting the chance to perform
+    the state transition. Upon reloading this calculation, it will re-attempt the retrieval, which should be skipped.
+
+    :param calculation: the instance of CalcJobNode.
+    :return: ``True`` if the calculation already has a `retrieved` output folder.
+    """
     link_label = calculation.link_label_retrieved
     if calculation.base.links.get_outgoing(FolderData, link_label_filter=link_label).first():
         EXEC_LOGGER.warning(
             f'CalcJobNode<{calculation.pk}> already has a `{link_label}` output folder: skipping retrieval'
         )
-        return
+        return True
+
+    return False
+
+
+def download_calculation(
+    transport: Transport,
+    workdir: str,
+    folder: str,
+    retrieve_list: List[Union[str, Tuple[str, str, int], list]],
+    retrieved_temporary_folder: Optional[str] = None,
+    retrieve_temporary_list: Optional[List[Union[str, Tuple[str, str, int], list]]] = None,
+    label: str = '',
+) -> None:
+    """Download the files of the retrieve lists of a completed job calculation to local folders.
+
+    This function only operates on the transport and on plain data, and resolves all relative remote paths with respect
+    to ``workdir`` instead of the current working directory of the transport. It is therefore safe to call in a thread
+    other than the one of the event loop, provided no other thread uses the transport at the same time.
+
+    :param transport: an already opened transport to use for the retrieval.
+    :param workdir: the absolute path of the remote working directory of the calculation.
+    :param folder: an absolute path to a local folder in which to store the files of the ``retrieve_list``.
+    :param retrieve_list: the list of files to retrieve.
+    :param retrieved_temporary_folder: an absolute path to a local folder in which to store the files of the
+        ``retrieve_temporary_list``.
+    :param retrieve_temporary_list: the list of files to retrieve temporarily.
+    :param label: label of the calculation used in log messages.
+    """
+    EXEC_LOGGER.debug(f'[retrieval of {label}] retrieving files from {workdir}')
+
+    _retrieve_files_from_list(transport, folder, retrieve_list, workdir, label)
+
+    if retrieve_temporary_list and retrieved_temporary_folder is not None:
+        _retrieve_files_from_list(transport, retrieved_temporary_folder, retrieve_temporary_list, workdir, label)
+
 
+def store_retrieved_calculation(calculation: CalcJobNode, folder: str, retrieved_temporary_folder: str) -> None:
+    """Store the retrieved files of a completed job calculation in a `FolderData` and attach it as an output.
+
+    :param calculation: the instance of CalcJobNode to update.
+    :param folder: an absolute path to a local folder with the files of the ``retrieve_list`` of the calculation.
+    :param retrieved_temporary_folder: the absolute path to the directory with the files of the
+        ``retrieve_temporary_list`` of the calculation.
+    """
     # Create the FolderData node into which to store the files that are to be retrieved
     retrieved_files = FolderData()
+    retrieved_files.base.repository.put_object_from_tree(folder)
 
-    with transport:
-        transport.chdir(workdir)
+    _store_retrieved_files(calculation, retrieved_files, retrieved_temporary_folder)
 
-        # First, retrieve the files of folderdata
-        retrieve_list = calculation.get_retrieve_list()
-        retrieve_temporary_list = calculation.get_retrieve_temporary_list()
-
-        with SandboxFolder(filepath_sandbox) as folder:
-            retrieve_files_from_list(calculation, transport, folder.abspath, retrieve_list)
-            # Here I retrieved everything; now I store them inside the calculation
-            retrieved_files.base.repository.put_object_from_tree(folder.abspath)
-
-        # Retrieve the temporary files in the retrieved_temporary_folder if any files were
-        # specified in the 'retrieve_temporary_list' key
-        if retrieve_temporary_list:
-            retrieve_files_from_list(calculation, transport, retrieved_temporary_folder, retrieve_temporary_list)
-
-            # Log the files that were retrieved in the temporary folder
-            for filename in os.listdir(retrieved_temporary_folder):
-                EXEC_LOGGER.debug(
-                    f"[retrieval of calc {calculation.pk}] Retrieved temporary file or folder '{filename}'",
-                    extra=logger_extra
-                )
 
-        # Store everything
-        EXEC_LOGGER.debug(
-            f'[retrieval of calc {calculation.pk}] Storing retrieved_files={retrieved_files.pk}', extra=logger_extra
-        )
-        retrieved_files.store()
+def stream_retrieved_calculation(
+    calculation: CalcJobNode, transport: Transport, retrieved_temporary_folder: str
+) -> None:
+    """Retrieve the files of a completed job calculation by streaming them directly into the file repository.
+
+    Contrary to :func:`retrieve_calculation`, the files of the ``retrieve_list`` are not first downloaded to a local
+    sandbox folder and then copied into the repository. See :func:`stream_calculation` for details.
+
+    :param calculation: the instance of CalcJobNode to update.
+    :param transport: an already opened transport to use for the retrieval.
+    :param retrieved_temporary_folder: the absolute path to a directory in which to store the files
+        listed, if any, in the `retrieved_temporary_folder` of the jobs CalcInfo
+    """
+    serialized = stream_calculation(
+        transport,
+        calculation.backend.get_repository(),
+        calculation.get_remote_workdir(),
+        calculation.get_retrieve_list(),
+        retrieved_temporary_folder,
+        calculation.get_retrieve_temporary_list(),
+        label=f'calc {calculation.pk}',
+    )
+    store_streamed_calculation(calculation, serialized, retrieved_temporary_folder)
+
+
+def stream_calculation(
+    transport: Transport,
+    repository_backend: AbstractRepositoryBackend,
+    workdir: str,
+    retrieve_list: List[Union[str, Tuple[str, str, int], list]],
+    retrieved_temporary_folder: Optional[str] = None,
+    retrieve_temporary_list: Optional[List[Union[str, Tuple[str, str, int], list]]] = None,
+    label: str = '',
+) -> dict[str, Any]:
+    """Stream the files of the retrieve lists of a completed job calculation directly into a repository backend.
+
+    The content of each remote file of the ``retrieve_list`` is written directly to the repository backend, and only the
+    files of the ``retrieve_temporary_list`` are downloaded to a local folder. The written objects are not attached to
+    any node: this is done by :func:`store_streamed_calculation` with the returned metadata, once all files were written.
+
+    Like :func:`download_calculation`, this function only operates on the transport and on plain data, so it is safe to
+    call in a thread other than the one of the event loop, provided no other thread uses the transport or the repository
+    backend instance at the same time.
+
+    :param transport: an already opened transport to use for the retrieval.
+    :param repository_backend: the repository backend of the profile in which to write the content of the files.
+    :param workdir: the absolute path of the remote working directory of the calculation.
+    :param retrieve_list: the list of files to retrieve.
+    :param retrieved_temporary_folder: an absolute path to a local folder in which to store the files of the
+        ``retrieve_temporary_list``.
+    :param retrieve_temporary_list: the list of files to retrieve temporarily.
+    :param label: label of the calculation used in log messages.
+    :return: the serialized metadata of the file hierarchy with the keys of the written objects.
+    """
+    EXEC_LOGGER.debug(f'[retrieval of {label}] streaming files from {workdir}')
+
+    repository = Repository(backend=repository_backend)
+    _stream_files_from_list(transport, repository, retrieve_list, workdir, label)
+
+    if retrieve_temporary_list and retrieved_temporary_folder is not None:
+        _retrieve_files_from_list(transport, retrieved_temporary_folder, retrieve_temporary_list, workdir, label)
+
+    return repository.serialize()
+
+
+def store_streamed_calculation(
+    calculation: CalcJobNode, serialized: dict[str, Any], retrieved_temporary_folder: str
+) -> None:
+    """Store the files streamed by :func:`stream_calculation` in a `FolderData` and attach it as an output.
+
+    :param calculation: the instance of CalcJobNode to update.
+    :param serialized: the serialized metadata of the files of the ``retrieve_list`` returned by
+        :func:`stream_calculation`.
+    :param retrieved_temporary_folder: the absolute path to the directory with the files of the
+        ``retrieve_temporary_list`` of the calculation.
+    """
+    retrieved_files = FolderData()
+    retrieved_files.base.repository.put_objects_from_serialized(serialized)
+
+    _store_retrieved_files(calculation, retrieved_files, retrieved_temporary_folder)
+
+
+def _store_retrieved_files(
+    calculation: CalcJobNode, retrieved_files: FolderData, retrieved_temporary_folder: str
+) -> None:
+    """Store the `FolderData` with the retrieved files of a completed job calculation and attach it as an output.
+
+    :param calculation: the instance of CalcJobNode to update.
+    :param retrieved_files: the unstored `FolderData` containing the files of the ``retrieve_list``.
+    :param retrieved_temporary_folder: the absolute path to the directory with the files of the
+        ``retrieve_temporary_list`` of the calculation.
+    """
+    logger_extra = get_dblogger_extra(calculation)
+
+    # Log the files that were retrieved in the temporary folder
+    if calculation.get_retrieve_temporary_list():
+        for filename in os.listdir(retrieved_temporary_folder):
+            EXEC_LOGGER.debug(
+                f"[retrieval of calc {calculation.pk}] Retrieved temporary file or folder '{filename}'",
+                extra=logger_extra
+            )
+
+    # Store everything
+    retrieved_files.store()
+    EXEC_LOGGER.debug(
+        f'[retrieval of calc {calculation.pk}] Stored retrieved_files={retrieved_files.pk}', extra=logger_extra
+    )
 
     # Make sure that attaching the `retrieved` folder with a link is the last thing we do. This gives the biggest chance
     # of making this method idempotent. That is to say, if a runner gets interrupted during this action, it will simply
@@ -580,37 +928,158 @@ def retrieve_files_from_list(
     :param folder: an absolute path to a folder that contains the files to copy.
     :param retrieve_list: the list of files to retrieve.
     """
-    # pylint: disable=too-many-branches
-    for item in retrieve_list:
+    _retrieve_files_from_list(transport, folder, retrieve_list, label=f'calc {calculation.pk}')
+
+
+def _retrieve_files_from_list(
+    transport: Transport,
+    folder: str,
+    retrieve_list: List[Union[str, Tuple[str, str, int], list]],
+    workdir: Optional[str] = None,
+    label: str = '',
+) -> None:
+    """Retrieve all the files in the retrieve_list from the remote into the local folder through the transport.
+
+    See :func:`retrieve_files_from_list` for the format of the ``retrieve_list``.
+
+    :param transport: the Transport instance.
+    :param folder: an absolute path to a folder that contains the files to copy.
+    :param retrieve_list: the list of files to retrieve.
+    :param workdir: optional absolute remote path with respect to which relative remote paths are resolved. If not
+        specified, they are resolved with respect to the current working directory of the transport.
+    :param label: label of the calculation used in log messages.
+    """
+    for remote_name, local_name, create_parent, is_dir in _iterate_retrieve_list(transport, retrieve_list, workdir):
+        if create_parent:  # create directories in the folder, if needed
+            new_folder = os.path.join(folder, os.path.split(local_name)[0])
+            if not os.path.exists(new_folder):
+                os.makedirs(new_folder)
+
+        remotepath = os.path.join(workdir, remote_name) if workdir is not None else remote_name
+        localpath = os.path.join(folder, local_name)
+        transport.logger.debug(f"[retrieval of {label}] Trying to retrieve remote item '{remote_name}'")
+
+        # Since the remote items were already resolved, the files and folders are downloaded directly instead of through
+        # ``Transport.get``, which would check their existence and type once more for each item.
+        if is_dir:
+            transport.gettree(remotepath, localpath)
+        else:
+            if os.path.isdir(localpath):
+                localpath = os.path.join(localpath, os.path.split(remote_name)[1])
+            transport.getfile(remotepath, localpath)
+
+
+def _stream_files_from_list(
+    transport: Transport,
+    repository: Repository,
+    retrieve_list: List[Union[str, Tuple[str, str, int], list]],
+    workdir: str,
+    label: str = '',
+) -> None:
+    """Stream all the files in the retrieve_list from the remote directly into a file repository.
+
+    See :func:`retrieve_files_from_list` for the format of the ``retrieve_list``. The files end up at the same relative
+    paths in the repository as they would in the local folder with :func:`_retrieve_files_from_list`.
+
+    :param transport: the Transport instance.
+    :param repository: the file repository in which to write the content of the files.
+    :param retrieve_list: the list of files to retrieve.
+    :param workdir: absolute remote path with respect to which relative remote paths are resolved.
+    :param label: label of the calculation used in log messages.
+    """
+    for remote_name, local_name, _, is_dir in _iterate_retrieve_list(transport, retrieve_list, workdir):
+        remotepath = os.path.join(workdir, remote_name)
+        transport.logger.debug(f"[retrieval of {label}] Trying to stream remote item '{remote_name}'")
+
+        # Like ``Transport.get``, an item whose target is an existing directory is copied inside of that directory
+        path = pathlib.PurePosixPath(os.path.normpath(local_name))
+        if repository.has_object(path) and repository.get_object(path).file_type == FileType.DIRECTORY:
+            path = path / os.path.basename(os.path.normpath(remote_name))
+
+        _stream_object(transport, repository, remotepath, path, is_dir)
+
+
+def _stream_object(
+    transport: Transport,
+    repository: Repository,
+    remotepath: str,
+    path: pathlib.PurePosixPath,
+    is_dir: Optional[bool] = None
+) -> None:
+    """Stream a remote file or, recursively, the content of a remote directory into a file repository.
+
+    :param transport: the Transport instance.
+    :param repository: the file repository in which to write the content.
+    :param remotepath: the absolute remote path of the file or directory.
+    :param path: the relative path in the repository at which to write the file or directory.
+    :param is_dir: whether the remote path is a directory, if already known.
+    """
+    if is_dir is None:
+        is_dir = transport.isdir(remotepath)
+
+    if is_dir:
+        repository.create_directory(path)
+        for name in transport.listdir(remotepath):
+            _stream_object(transport, repository, os.path.join(remotepath, name), path / name)
+    else:
+        with transport.get_object_stream(remotepath) as handle:
+            repository.put_object_from_filelike(handle, path)
+
+
+def _iterate_retrieve_list(
+    transport: Transport,
+    retrieve_list: List[Union[str, Tuple[str, str, int], list]],
+    workdir: Optional[str] = None,
+) -> Iterator[Tuple[str, str, bool, bool]]:
+    """Yield the remote and local names of all the existing remote items in the retrieve_list.
+
+    The items of the list are resolved on the remote all at once by ``Transport.expand_paths``, which expands wildcards
+    and determines which of the matching paths are folders. Items that do not exist on the remote are skipped. See
+    :func:`retrieve_files_from_list` for the format of the ``retrieve_list``.
+
+    :param transport: the Transport instance.
+    :param retrieve_list: the list of files to retrieve.
+    :param workdir: optional absolute remote path with respect to which relative remote paths are resolved. If not
+        specified, they are resolved with respect to the current working directory of the transport.
+    :return: iterator over tuples of the remote name, the local name relative to the target folder, whether the parent
+        directory of the local name should be created and whether the remote item is a folder.
+    """
+
+    def resolve(path: str) -> str:
+        return os.path.join(workdir, path) if workdir is not None else path
+
+    def relativize(path: str, pattern: str) -> str:
+        return os.path.relpath(path, workdir) if workdir is not None and not os.path.isabs(pattern) else path
+
+    patterns = [item[0] if isinstance(item, (list, tuple)) else item for item in retrieve_list]
+    expanded = transport.expand_paths({resolve(pattern) for pattern in patterns})
+
+    for item, pattern in zip(retrieve_list, patterns):
+        matches = [(relativize(path, pattern), is_dir) for path, is_dir in expanded[resolve(pattern)]]
+        create_parent = False
+
         if isinstance(item, (list, tuple)):
             tmp_rname, tmp_lname, depth = item
             # if there are more than one file I do something differently
             if transport.has_magic(tmp_rname):
-                remote_names = transport.glob(tmp_rname)
                 local_names = []
-                for rem in remote_names:
+                for rem, _ in matches:
                     if depth is None:
                         local_names.append(os.path.join(tmp_lname, rem))
                     else:
                         to_append = rem.split(os.path.sep)[-depth:] if depth > 0 else []
                         local_names.append(os.path.sep.join([tmp_lname] + to_append))
             else:
-                remote_names = [tmp_rname]
+                matches = [(tmp_rname, is_dir) for _, is_dir in matches]
                 to_append = tmp_rname.split(os.path.sep)[-depth:] if depth > 0 else []
-                local_names = [os.path.sep.join([tmp_lname] + to_append)]
-            if depth is None or depth > 1:  # create directories in the folder, if needed
-                for this_local_file in local_names:
-                    new_folder = os.path.join(folder, os.path.split(this_local_file)[0])
-                    if not os.path.exists(new_folder):
-                        os.makedirs(new_folder)
+                local_names = [os.path.sep.join([tmp_lname] + to_append)] * len(matches)
+            create_parent = depth is None or depth > 1
         else:  # it is a string
             if transport.has_magic(item):
-                remote_names = transport.glob(item)
-                local_names = [os.path.split(rem)[1] for rem in remote_names]
+                local_names = [os.path.split(rem)[1] for rem, _ in matches]
             else:
-                remote_names = [item]
-                local_names = [os.path.split(item)[1]]
+                matches = [(item, is_dir) for _, is_dir in matches]
+                local_names = [os.path.split(item)[1]] * len(matches)
 
-        for rem, loc in zip(remote_names, local_names):
-            transport.logger.debug(f"[retrieval of calc {calculation.pk}] Trying to retrieve remote item '{rem}'")
-            transport.get(rem, os.path.join(folder, loc), ignore_nonexisting=True)
+        for (rem, is_dir), loc in zip(matches, local_names):
+            yield rem, loc, create_parent, is_dir
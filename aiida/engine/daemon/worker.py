@@ -10,6 +10,7 @@
 """Function that starts a daemon worker."""
 import asyncio
 import logging
+import os
 import signal
 import sys
 
@@ -17,9 +18,13 @@ from aiida.common.log import configure_logging
 from aiida.engine.daemon.client import get_daemon_client
 from aiida.engine.runners import Runner
 from aiida.manage import get_config_option, get_manager
+from aiida.orm.utils.log import flush_db_log_handlers
 
 LOGGER = logging.getLogger(__name__)
 
+# Interval in seconds between writes of the status of the worker, that is reported by ``verdi daemon status``
+WORKER_STATUS_INTERVAL = 10
+
 
 async def shutdown_worker(runner: Runner) -> None:
     """Cleanup tasks tied to the service's shutdown."""
@@ -33,10 +38,22 @@ async def shutdown_worker(runner: Runner) -> None:
 
     await asyncio.gather(*tasks, return_exceptions=True)
     runner.close()
+    flush_db_log_handlers()
+    get_daemon_client().delete_worker_status(os.getpid())
 
     LOGGER.info('Daemon worker stopped')
 
 
+def write_worker_status(runner: Runner) -> None:
+    """Write the status of the task queues of the worker and schedule the next write."""
+    try:
+        get_daemon_client().write_worker_status(os.getpid(), {'tasks': runner.task_scheduler.get_statistics()})
+    except OSError:
+        LOGGER.exception('failed to write the status of the daemon worker')
+
+    runner.loop.call_later(WORKER_STATUS_INTERVAL, write_worker_status, runner)
+
+
 def start_daemon_worker() -> None:
     """Start a daemon worker for the currently configured profile."""
     daemon_client = get_daemon_client()
@@ -58,6 +75,8 @@ def start_daemon_worker() -> None:
     for s in signals:  # pylint: disable=invalid-name
         runner.loop.add_signal_handler(s, lambda s=s: asyncio.create_task(shutdown_worker(runner)))
 
+    write_worker_status(runner)
+
     try:
         LOGGER.info('Starting a daemon worker')
         runner.start()
@@ -10,10 +10,14 @@
 # pylint: disable=global-statement
 """Definition of AiiDA's process persister and the necessary object loaders."""
 
+import base64
+import hashlib
 import importlib
 import logging
+import time
 import traceback
-from typing import TYPE_CHECKING, Any, Hashable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional
+import zlib
 
 from plumpy.exceptions import PersistenceError
 import plumpy.loaders
@@ -29,6 +33,9 @@ __all__ = ('AiiDAPersister', 'ObjectLoader', 'get_object_loader')
 LOGGER = logging.getLogger(__name__)
 OBJECT_LOADER = None
 
+#: Prefix of checkpoints that are stored as a zlib compressed and base64 encoded yaml dump.
+COMPRESSED_CHECKPOINT_PREFIX = 'zlib:'
+
 
 class ObjectLoader(plumpy.loaders.DefaultObjectLoader):
     """Custom object loader for `aiida-core`."""
@@ -67,9 +74,71 @@ def get_object_loader() -> ObjectLoader:
     return OBJECT_LOADER
 
 
+def encode_checkpoint(bundle: plumpy.persistence.Bundle, compress: bool = False) -> str:
+    """Serialize a process bundle into a checkpoint that can be stored in the attributes of the process node.
+
+    :param bundle: the bundle with the process state.
+    :param compress: if ``True``, the yaml dump is compressed with zlib and base64 encoded, which typically reduces its
+        size by an order of magnitude, and marked with the ``COMPRESSED_CHECKPOINT_PREFIX``.
+    :return: the checkpoint.
+    """
+    if not compress:
+        return serialize.serialize(bundle)
+
+    compressed = zlib.compress(serialize.serialize(bundle, encoding='utf-8'))
+    return COMPRESSED_CHECKPOINT_PREFIX + base64.b64encode(compressed).decode('ascii')
+
+
+def decode_checkpoint(checkpoint: str) -> plumpy.persistence.Bundle:
+    """Deserialize a checkpoint created by :func:`encode_checkpoint` into a process bundle.
+
+    .. note:: A plain checkpoint is a yaml dump of a tagged bundle, which can never start with the prefix of compressed
+        checkpoints, so both formats can be distinguished unambiguously.
+
+    :param checkpoint: the checkpoint.
+    :return: the bundle with the process state.
+    """
+    if checkpoint.startswith(COMPRESSED_CHECKPOINT_PREFIX):
+        encoded = checkpoint[len(COMPRESSED_CHECKPOINT_PREFIX):]
+        checkpoint = zlib.decompress(base64.b64decode(encoded)).decode('utf-8')
+
+    return serialize.deserialize_unsafe(checkpoint)
+
+
 class AiiDAPersister(plumpy.persistence.Persister):
     """Persister to take saved process instance states and persisting them to the database."""
 
+    def __init__(self, compress: Optional[bool] = None, skip_unchanged: Optional[bool] = None) -> None:
+        """Construct a new persister.
+
+        :param compress: whether checkpoints are stored compressed, see :func:`encode_checkpoint`. Defaults to the
+            ``runner.checkpoint.compress`` configuration option.
+        :param skip_unchanged: whether writing a checkpoint is skipped if it is identical to the last checkpoint that
+            this persister wrote for the same process. Defaults to the ``runner.checkpoint.skip_unchanged``
+            configuration option.
+        """
+        from aiida.manage import get_config_option
+
+        if compress is None:
+            compress = get_config_option('runner.checkpoint.compress')
+
+        if skip_unchanged is None:
+            skip_unchanged = get_config_option('runner.checkpoint.skip_unchanged')
+
+        self._compress = compress
+        self._skip_unchanged = skip_unchanged
+        self._checkpoint_digests: Dict[Hashable, str] = {}
+        self._statistics: Dict[str, float] = {'saved': 0, 'skipped': 0, 'size_last': 0, 'size_total': 0, 'time_total': 0.}
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return the statistics of the checkpoints saved by this persister.
+
+        :return: dictionary with the number of checkpoints that were saved and that were skipped because they were
+            unchanged, the size in bytes of the last and of all saved checkpoints, and the total time in seconds spent
+            serializing the checkpoints.
+        """
+        return dict(self._statistics)
+
     def save_checkpoint(self, process: 'Process', tag: Optional[str] = None):  # type: ignore[override]
         """Persist a Process instance.
 
@@ -89,10 +158,29 @@ class AiiDAPersister(plumpy.persistence.Persister):
             raise PersistenceError(f"Failed to create a bundle for '{process}': {traceback.format_exc()}")
 
         try:
-            process.node.set_checkpoint(serialize.serialize(bundle))
+            time_start = time.perf_counter()
+            checkpoint = encode_checkpoint(bundle, compress=self._compress)
+            time_elapsed = time.perf_counter() - time_start
+            self._statistics['time_total'] += time_elapsed
+
+            if self._skip_unchanged:
+                digest = hashlib.sha256(checkpoint.encode('utf-8')).hexdigest()
+                if self._checkpoint_digests.get(process.pid) == digest and process.node.checkpoint is not None:
+                    LOGGER.debug('Checkpoint of process<%d> is unchanged, skipping', process.pid)
+                    self._statistics['skipped'] += 1
+                    return bundle
+                self._checkpoint_digests[process.pid] = digest
+
+            process.node.set_checkpoint(checkpoint)
         except Exception:
             raise PersistenceError(f"Failed to store a checkpoint for '{process}': {traceback.format_exc()}")
 
+        self._statistics['saved'] += 1
+        self._statistics['size_last'] = len(checkpoint)
+        self._statistics['size_total'] += len(checkpoint)
+        LOGGER.debug('Saved checkpoint of process<%d>: %d bytes serialized in %.4f s', process.pid, len(checkpoint),
+                     time_elapsed)
+
         return bundle
 
     def load_checkpoint(self, pid: Hashable, tag: Optional[str] = None) -> plumpy.persistence.Bundle:
@@ -121,7 +209,7 @@ class AiiDAPersister(plumpy.persistence.Persister):
             raise PersistenceError(f'Calculation<{calculation.pk}> does not have a saved checkpoint')
 
         try:
-            bundle = serialize.deserialize_unsafe(checkpoint)
+            bundle = decode_checkpoint(checkpoint)
         except Exception:
             raise PersistenceError(f'Failed to load the checkpoint for process<{pid}>: {traceback.format_exc()}')
 
@@ -148,6 +236,7 @@ class AiiDAPersister(plumpy.persistence.Persister):
         """
         from aiida.orm import load_node
 
+        self._checkpoint_digests.pop(pid, None)
         calc = load_node(pid)
         calc.delete_checkpoint()
 
@@ -38,6 +38,7 @@ __all__ = (
     'FunctionProcess',
     'InputPort',
     'JobManager',
+    'JobSubmitter',
     'JobsList',
     'OutputPort',
     'PORT_NAMESPACE_SEPARATOR',
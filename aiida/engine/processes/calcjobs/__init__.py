@@ -22,6 +22,7 @@ __all__ = (
     'CalcJob',
     'CalcJobImporter',
     'JobManager',
+    'JobSubmitter',
     'JobsList',
 )
 
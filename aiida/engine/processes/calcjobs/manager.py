@@ -11,18 +11,117 @@
 import asyncio
 import contextlib
 import contextvars
+import dataclasses
+import inspect
 import logging
 import time
-from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Hashable, Iterator, List, Optional, Tuple
 
 from aiida.common import lang
+from aiida.engine.daemon import execmanager
 from aiida.orm import AuthInfo
+from aiida.schedulers.datastructures import JobState
 
 if TYPE_CHECKING:
     from aiida.engine.transports import TransportQueue
+    from aiida.orm import CalcJobNode
+    from aiida.schedulers import Scheduler
     from aiida.schedulers.datastructures import JobInfo
 
-__all__ = ('JobsList', 'JobManager')
+__all__ = ('JobsList', 'JobManager', 'JobSubmitter')
+
+
+def _accepts_filter_jobs(scheduler: 'Scheduler') -> bool:
+    """Return whether the ``get_jobs`` method of the scheduler accepts the ``filter_jobs`` argument.
+
+    Scheduler plugins that override ``get_jobs`` with the signature from before the argument was added do not.
+    """
+    parameters = inspect.signature(scheduler.get_jobs).parameters.values()
+    return any(parameter.name == 'filter_jobs' or parameter.kind is parameter.VAR_KEYWORD for parameter in parameters)
+
+
+@dataclasses.dataclass
+class _JobPollState:
+    """The state of a job as seen by the polls of a ``JobsList``, used to determine when the job is next due."""
+
+    last_changed: float
+    """The time at which the job was last seen to change state, or was first requested, as given by ``time.time()``."""
+    max_wallclock_seconds: Optional[float] = None
+    """The maximum wallclock time requested for the job, as known by the calculation job."""
+    job_info: Optional['JobInfo'] = None
+    """The job info returned by the last poll of the scheduler, or ``None`` if the job has not been polled yet."""
+    last_polled: Optional[float] = None
+    """The time at which the job was last polled, as produced by ``time.time()``."""
+
+    @property
+    def wallclock_seconds(self) -> Optional[float]:
+        """Return the wallclock time of the job, as reported by the scheduler or otherwise as requested."""
+        if self.job_info is not None and self.job_info.requested_wallclock_time_seconds is not None:
+            return self.job_info.requested_wallclock_time_seconds
+        return self.max_wallclock_seconds
+
+    def get_running_seconds(self, now: float) -> float:
+        """Return the time that the job has been running, as reported by the scheduler or otherwise as observed.
+
+        :param now: the current time as produced by ``time.time()``.
+        """
+        if self.job_info is not None and self.job_info.wallclock_time_seconds is not None:
+            assert self.last_polled is not None
+            return self.job_info.wallclock_time_seconds + now - self.last_polled
+        return now - self.last_changed
+
+
+@dataclasses.dataclass
+class AdaptivePollPolicy:
+    """Policy that adapts the interval between scheduler updates of a job to the expected time until it changes state.
+
+    Jobs that have been queued for a long time, or that are expected to keep running for a long time, are polled less
+    often, whereas jobs that were just submitted, or whose wallclock time is about to run out, are polled as often as
+    the minimum polling interval of the computer allows.
+
+    For a running job whose wallclock time is known, the interval is the ``backoff_factor`` times its remaining
+    wallclock time. For any other job it is the ``backoff_factor`` times the time since it last changed state. The
+    interval never exceeds the ``maximum_interval``.
+    """
+
+    maximum_interval: float = 600.
+    """The maximum interval in seconds between updates of a job."""
+    backoff_factor: float = 0.1
+    """The fraction of the expected time until the job changes state to wait before the next update."""
+
+    @classmethod
+    def from_config(cls) -> Optional['AdaptivePollPolicy']:
+        """Return the policy as configured by the ``runner.job_poll.*`` options, or ``None`` if it is disabled."""
+        from aiida.manage import get_config_option
+
+        if not get_config_option('runner.job_poll.adaptive'):
+            return None
+
+        return cls(
+            maximum_interval=get_config_option('runner.job_poll.maximum_interval'),
+            backoff_factor=get_config_option('runner.job_poll.backoff_factor'),
+        )
+
+    def get_poll_interval(self, job: _JobPollState, now: float) -> float:
+        """Return the interval between the last and the next update of the given job.
+
+        The minimum polling interval of the computer is guaranteed by the ``JobsList`` and is not accounted for here.
+
+        :param job: the poll state of the job.
+        :param now: the current time as produced by ``time.time()``.
+        :return: the interval in seconds
+        """
+        if job.job_info is None:
+            return 0.
+
+        wallclock_seconds = job.wallclock_seconds
+
+        if job.job_info.job_state == JobState.RUNNING and wallclock_seconds is not None:
+            interval = self.backoff_factor * max(wallclock_seconds - job.get_running_seconds(now), 0.)
+        else:
+            interval = self.backoff_factor * (now - job.last_changed)
+
+        return min(interval, self.maximum_interval)
 
 
 class JobsList:
@@ -35,19 +134,34 @@ class JobsList:
     is configured, can define a minimum polling interval. This class will guarantee that the time between update calls
     to the scheduler is larger or equal to that minimum interval.
 
-    Note that since each instance operates on a specific authinfo, the guarantees of batching scheduler update calls
-    and the limiting of number of calls per unit time, through the minimum polling interval, is only applicable for jobs
-    launched with that particular authinfo. If multiple authinfo instances with the same computer, have active jobs
-    these limitations are not respected between them, since there is no communication between ``JobsList`` instances.
-    See the :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` for example usage.
+    The scheduler is queried through a :py:class:`~aiida.engine.processes.calcjobs.manager.JobsPoller`. By default each
+    instance has its own poller, in which case the guarantees of batching scheduler update calls and the limiting of
+    number of calls per unit time, through the minimum polling interval, is only applicable for jobs launched with that
+    particular authinfo. The :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` shares a single poller
+    between all instances whose authinfos give access to the same scheduler queue, such that these guarantees hold
+    across them. See the :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` for example usage.
+
+    Optionally, an :py:class:`~aiida.engine.processes.calcjobs.manager.AdaptivePollPolicy` can be specified, in which
+    case the scheduler is only queried once the first of the requested jobs is due according to that policy, instead of
+    as soon as the minimum polling interval allows.
     """
 
-    def __init__(self, authinfo: AuthInfo, transport_queue: 'TransportQueue', last_updated: Optional[float] = None):
+    def __init__(
+        self,
+        authinfo: AuthInfo,
+        transport_queue: 'TransportQueue',
+        last_updated: Optional[float] = None,
+        poller: Optional['JobsPoller'] = None,
+        poll_policy: Optional[AdaptivePollPolicy] = None,
+    ):
         """Construct an instance for the given authinfo and transport queue.
 
         :param authinfo: The authinfo used to check the jobs list
         :param transport_queue: A transport queue
         :param last_updated: initialize the last updated timestamp
+        :param poller: the poller through which to query the scheduler, a new one is created if not specified
+        :param poll_policy: the policy that determines when each job is due for an update, by default all jobs are
+            updated as often as the minimum polling interval allows
 
         """
         lang.type_check(last_updated, float, allow_none=True)
@@ -59,8 +173,22 @@ class JobsList:
 
         self._jobs_cache: Dict[Hashable, 'JobInfo'] = {}
         self._job_update_requests: Dict[Hashable, asyncio.Future] = {}  # Mapping: {job_id: Future}
+        self._last_requested: Optional[float] = None
         self._last_updated = last_updated
         self._update_handle: Optional[asyncio.TimerHandle] = None
+        self._poll_policy = poll_policy
+        self._job_poll_states: Dict[Hashable, _JobPollState] = {}
+
+        self._poller = poller if poller is not None else JobsPoller(transport_queue)
+        self._poller.add_jobs_list(self)
+
+    @property
+    def authinfo(self) -> AuthInfo:
+        """Return the authinfo of this instance.
+
+        :return: the authinfo
+        """
+        return self._authinfo
 
     @property
     def logger(self) -> logging.Logger:
@@ -90,33 +218,19 @@ class JobsList:
     async def _get_jobs_from_scheduler(self) -> Dict[Hashable, 'JobInfo']:
         """Get the current jobs list from the scheduler.
 
+        The result is obtained from the poller, which guarantees that the scheduler was queried after the last update
+        request was made, but it may be shared with the jobs lists of other authinfos.
+
         :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
 
         """
-        with self._transport_queue.request_transport(self._authinfo) as request:
-            self.logger.info('waiting for transport')
-            transport = await request
-
-            scheduler = self._authinfo.computer.get_scheduler()
-            scheduler.set_transport(transport)
-
-            kwargs: Dict[str, Any] = {'as_dict': True}
-            if scheduler.get_feature('can_query_by_user'):
-                kwargs['user'] = '$USER'
-            else:
-                kwargs['jobs'] = self._get_jobs_with_scheduler()
-
-            scheduler_response = scheduler.get_jobs(**kwargs)
-
-            # Update the last update time and clear the jobs cache
-            self._last_updated = time.time()
-            jobs_cache = {}
-            self.logger.info(f'AuthInfo<{self._authinfo.pk}>: successfully retrieved status of active jobs')
+        since = self._last_requested if self._last_requested is not None else time.time()
+        jobs_cache = await self._poller.get_jobs(self, since)
 
-            for job_id, job_info in scheduler_response.items():
-                jobs_cache[job_id] = job_info
+        # Update the last update time
+        self._last_updated = time.time()
 
-            return jobs_cache
+        return dict(jobs_cache)
 
     async def _update_job_info(self) -> None:
         """Update all of the job information objects.
@@ -144,25 +258,63 @@ class JobsList:
 
             raise
         else:
+            if self._poll_policy is not None:
+                self._update_job_poll_states()
+
             for job_id, future in self._job_update_requests.items():
                 if not future.done():
                     future.set_result(self._jobs_cache.get(job_id, None))
         finally:
             self._job_update_requests = {}
 
+    def _update_job_poll_states(self) -> None:
+        """Update the poll states of the requested jobs with the job info of the last update.
+
+        Jobs that are done, that are no longer known by the scheduler or whose request was cancelled are no longer
+        tracked.
+        """
+        now = self._last_updated if self._last_updated is not None else time.time()
+
+        for job_id, request in self._job_update_requests.items():
+            job_info = self._jobs_cache.get(job_id, None)
+            job = self._job_poll_states.get(job_id, None)
+
+            if job is None:
+                continue
+
+            if request.cancelled() or job_info is None or job_info.job_state == JobState.DONE:
+                del self._job_poll_states[job_id]
+                continue
+
+            if job.job_info is not None and self._has_job_state_changed(job.job_info, job_info):
+                job.last_changed = now
+
+            job.job_info = job_info
+            job.last_polled = now
+
     @contextlib.contextmanager
-    def request_job_info_update(self, job_id: Hashable) -> Iterator['asyncio.Future[JobInfo]']:
+    def request_job_info_update(self,
+                                job_id: Hashable,
+                                max_wallclock_seconds: Optional[float] = None) -> Iterator['asyncio.Future[JobInfo]']:
         """Request job info about a job when the job next changes state.
 
         If the job is not found in the jobs list at the update, the future will resolve to `None`.
 
         :param job_id: job identifier
+        :param max_wallclock_seconds: the maximum wallclock time requested for the job, used by the poll policy to
+            estimate when a running job will finish if the scheduler does not report it
         :return: future that will resolve to a `JobInfo` object when the job changes state
         """
         # Get or create the future
         request = self._job_update_requests.setdefault(job_id, asyncio.Future())
+        self._last_requested = time.time()
         assert not request.done(), 'Expected pending job info future, found in done state.'
 
+        if self._poll_policy is not None:
+            job = self._job_poll_states.setdefault(job_id, _JobPollState(last_changed=self._last_requested))
+            if max_wallclock_seconds is not None:
+                job.max_wallclock_seconds = max_wallclock_seconds
+
         try:
             self._ensure_updating()
             yield request
@@ -172,7 +324,8 @@ class JobsList:
     def _ensure_updating(self) -> None:
         """Ensure that we are updating the job list from the remote resource.
 
-        This will automatically stop if there are no outstanding requests.
+        This will automatically stop if there are no outstanding requests. If a poll policy is defined and the next
+        update is scheduled later than the request that was just made is due, the update is rescheduled.
         """
 
         async def updating():
@@ -180,24 +333,28 @@ class JobsList:
             await self._update_job_info()
             # Any outstanding requests?
             if self._update_requests_outstanding():
-                self._update_handle = self._loop.call_later(
-                    self._get_next_update_delay(),
-                    asyncio.ensure_future,
-                    updating(),
-                    context=contextvars.Context(),  #  type: ignore[call-arg]
-                )
+                schedule_update()
             else:
                 self._update_handle = None
 
-        # Check if we're already updating
-        if self._update_handle is None:
+        def schedule_update():
+            # The coroutine is only created once the timer fires, such that a cancelled timer leaves no coroutine that
+            # is never awaited
             self._update_handle = self._loop.call_later(
                 self._get_next_update_delay(),
-                asyncio.ensure_future,
-                updating(),
+                lambda: asyncio.ensure_future(updating()),
                 context=contextvars.Context(),  #  type: ignore[call-arg]
             )
 
+        # Check if we're already updating
+        if self._update_handle is None:
+            schedule_update()
+        elif self._poll_policy is not None and self._update_handle.when() > self._loop.time():
+            # The update has not started yet, so reschedule it if it is due earlier
+            if self._loop.time() + self._get_next_update_delay() < self._update_handle.when():
+                self._update_handle.cancel()
+                schedule_update()
+
     @staticmethod
     def _has_job_state_changed(old: Optional['JobInfo'], new: Optional['JobInfo']) -> bool:
         """Return whether the states `old` and `new` are different.
@@ -217,7 +374,8 @@ class JobsList:
         """Calculate when we are next allowed to poll the scheduler.
 
         This delay is calculated as the minimum polling interval defined by the authentication info for this instance,
-        minus time elapsed since the last update.
+        minus time elapsed since the last update. If a poll policy is defined, the delay is at least the time until the
+        first of the requested jobs is due according to that policy.
 
         :return: delay (in seconds) after which the scheduler may be polled again
 
@@ -228,12 +386,38 @@ class JobsList:
 
         # Make sure to actually 'get' the minimum interval here, in case the user changed since last time
         minimum_interval = self.get_minimum_update_interval()
-        elapsed = time.time() - self.last_updated
+        now = time.time()
+        elapsed = now - self.last_updated
 
         delay = max(minimum_interval - elapsed, 0.)
 
+        if self._poll_policy is not None:
+            delay = max(delay, self._get_next_job_due_delay(now))
+
         return delay
 
+    def _get_next_job_due_delay(self, now: float) -> float:
+        """Return the time until the first of the requested jobs is due for an update according to the poll policy.
+
+        :param now: the current time as produced by ``time.time()``.
+        :return: delay (in seconds), which is zero if any of the requested jobs has not been polled yet.
+        """
+        assert self._poll_policy is not None
+        delays = []
+
+        for job_id, request in self._job_update_requests.items():
+            if request.done():
+                continue
+
+            job = self._job_poll_states.get(job_id, None)
+
+            if job is None or job.last_polled is None:
+                return 0.
+
+            delays.append(job.last_polled + self._poll_policy.get_poll_interval(job, now) - now)
+
+        return max(min(delays, default=0.), 0.)
+
     def _update_requests_outstanding(self) -> bool:
         return any(not request.done() for request in self._job_update_requests.values())
 
@@ -246,6 +430,354 @@ class JobsList:
         return [str(job_id) for job_id, _ in self._job_update_requests.items()]
 
 
+@dataclasses.dataclass
+class _Poll:
+    """A single query of the scheduler for the status of jobs, that is either in progress or completed."""
+
+    started: float
+    """The time at which the query was started, as produced by ``time.time()``."""
+    job_ids: FrozenSet[str]
+    """The ids of the jobs whose information is returned by the query."""
+    future: 'asyncio.Future[Dict[Hashable, JobInfo]]'
+    """The future that resolves to the mapping of job ids to job info returned by the scheduler."""
+
+    def satisfies(self, since: float, job_ids: List[str]) -> bool:
+        """Return whether the result of this poll can be used for a request of the given jobs made at ``since``.
+
+        :param since: the time at which the most recent update request was made.
+        :param job_ids: the ids of the jobs for which the update is requested.
+        """
+        if self.started < since:
+            return False
+
+        if not self.job_ids.issuperset(job_ids):
+            return False
+
+        return not self.future.done() or (not self.future.cancelled() and self.future.exception() is None)
+
+
+class JobsPoller:
+    """Poller of the scheduler that can be shared between the ``JobsList`` instances of multiple authinfos.
+
+    Multiple :py:class:`~aiida.orm.authinfos.AuthInfo` instances can give access to the exact same scheduler queue, for
+    example when multiple AiiDA users share the same account on a cluster. Each of those authinfos has its own
+    ``JobsList``, but when they share a poller, the scheduler is queried with a single ``get_jobs`` call whose result
+    is distributed to all of them. In addition, the minimum polling interval of the computers is guaranteed between
+    the queries of all jobs lists that share the poller.
+
+    A request for the jobs is a *hit* if it can be served by a query that is in progress or was completed after the
+    last update request of the jobs list was made, and it is a *miss* if the scheduler needs to be queried.
+    """
+
+    def __init__(self, transport_queue: 'TransportQueue') -> None:
+        """Construct a new poller.
+
+        :param transport_queue: the transport queue to request transports from.
+        """
+        self._transport_queue = transport_queue
+        self._logger = logging.getLogger(__name__)
+        self._jobs_lists: List[JobsList] = []
+        self._poll: Optional[_Poll] = None
+        self._last_updated: Optional[float] = None
+        self._hits = 0
+        self._misses = 0
+        self._latency_last: Optional[float] = None
+        self._latency_total = 0.
+
+    @property
+    def logger(self) -> logging.Logger:
+        """Return the logger configured for this instance.
+
+        :return: the logger
+        """
+        return self._logger
+
+    @property
+    def last_updated(self) -> Optional[float]:
+        """Get the timestamp of when the scheduler was last successfully queried as produced by `time.time()`
+
+        :return: The last update point
+        """
+        return self._last_updated
+
+    def add_jobs_list(self, jobs_list: JobsList) -> None:
+        """Add a jobs list to the lists that share this poller.
+
+        :param jobs_list: the jobs list.
+        """
+        self._jobs_lists.append(jobs_list)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return the statistics of this poller.
+
+        :return: dictionary with the number of hits and misses and the latency in seconds of the last query of the
+            scheduler and the average latency of all queries.
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'latency_last': self._latency_last,
+            'latency_average': self._latency_total / self._misses if self._misses else None,
+        }
+
+    async def get_jobs(self, jobs_list: JobsList, since: float) -> Dict[Hashable, 'JobInfo']:
+        """Return the current jobs of the scheduler for the given jobs list.
+
+        The result of a query that is in progress, or that was completed, is reused if it was started no earlier than
+        ``since`` and it included the jobs of the jobs list. Otherwise, the scheduler is queried through the authinfo of
+        the given jobs list, once the minimum polling interval since the last query has passed.
+
+        :param jobs_list: the jobs list that requests the jobs.
+        :param since: the time at which the most recent update request of the jobs list was made.
+        :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
+        """
+        job_ids = jobs_list._get_jobs_with_scheduler()  # pylint: disable=protected-access
+
+        while True:
+            poll = self._poll
+
+            if poll is not None and poll.satisfies(since, job_ids):
+                self._hits += 1
+                return await asyncio.shield(poll.future)
+
+            if poll is not None and not poll.future.done():
+                # Never query the scheduler concurrently, but wait for the query in progress to finish.
+                await asyncio.wait([poll.future])
+                continue
+
+            delay = self._get_next_poll_delay()
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            break
+
+        self._misses += 1
+        poll = self._start_poll(jobs_list.authinfo)
+
+        return await asyncio.shield(poll.future)
+
+    def _get_next_poll_delay(self) -> float:
+        """Calculate when the scheduler may next be queried.
+
+        This is the largest minimum polling interval of the computers of the jobs lists that share this poller, minus
+        the time elapsed since the last query.
+
+        :return: delay (in seconds) after which the scheduler may be polled again
+        """
+        if self._last_updated is None:
+            return 0.
+
+        minimum_interval = max(jobs_list.get_minimum_update_interval() for jobs_list in self._jobs_lists)
+        elapsed = time.time() - self._last_updated
+
+        return max(minimum_interval - elapsed, 0.)
+
+    def _start_poll(self, authinfo: AuthInfo) -> _Poll:
+        """Start a new query of the scheduler through the given authinfo.
+
+        If the scheduler cannot be queried for all jobs of the user, the jobs of all jobs lists that share this poller
+        are queried. Otherwise all jobs of the user are queried, but only the jobs of the jobs lists are parsed.
+
+        :param authinfo: the authinfo to use to query the scheduler.
+        :return: the poll that was started.
+        """
+        job_ids = frozenset(
+            job_id for jobs_list in self._jobs_lists
+            for job_id in jobs_list._get_jobs_with_scheduler()  # pylint: disable=protected-access
+        )
+        query_by_user = authinfo.computer.get_scheduler().get_feature('can_query_by_user')
+
+        future = asyncio.ensure_future(self._get_jobs_from_scheduler(authinfo, job_ids, query_by_user))
+        # The exception is propagated to all the requesters, this callback merely prevents warnings if there are none
+        future.add_done_callback(lambda future: future.cancelled() or future.exception())
+        self._poll = _Poll(started=time.time(), job_ids=job_ids, future=future)
+
+        return self._poll
+
+    async def _get_jobs_from_scheduler(self, authinfo: AuthInfo, job_ids: FrozenSet[str],
+                                       query_by_user: bool) -> Dict[Hashable, 'JobInfo']:
+        """Get the current jobs list from the scheduler.
+
+        :param authinfo: the authinfo to use to query the scheduler.
+        :param job_ids: the ids of the jobs to return.
+        :param query_by_user: whether to query all jobs of the user instead of only the jobs with the given ids.
+        :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
+        """
+        with self._transport_queue.request_transport(authinfo) as request:
+            self.logger.info('waiting for transport')
+            transport = await request
+
+            from aiida.manage import get_config_option
+
+            scheduler = authinfo.computer.get_scheduler()
+            scheduler.set_transport(transport)
+            scheduler.set_structured_output(get_config_option('runner.job_poll.structured_output'))
+
+            kwargs: Dict[str, Any] = {'as_dict': True}
+            if _accepts_filter_jobs(scheduler):
+                kwargs['filter_jobs'] = job_ids
+            if query_by_user:
+                kwargs['user'] = '$USER'
+            else:
+                kwargs['jobs'] = sorted(job_ids)
+
+            time_start = time.time()
+            scheduler_response = await self._transport_queue.run_in_executor(authinfo, scheduler.get_jobs, **kwargs)
+
+            # Update the last update time and the latency statistics
+            self._last_updated = time.time()
+            self._latency_last = self._last_updated - time_start
+            self._latency_total += self._latency_last
+            self.logger.info(f'AuthInfo<{authinfo.pk}>: successfully retrieved status of active jobs')
+
+            # Plugins that do not accept ``filter_jobs`` may return other jobs, for example when querying by user
+            return {job_id: job_info for job_id, job_info in scheduler_response.items() if job_id in job_ids}
+
+
+class JobSubmitter:
+    """Submitter of calculation jobs to the scheduler in batches, for a specific ``AuthInfo``.
+
+    Submission requests are collected for ``batch_delay`` seconds after which up to ``batch_size`` of them are submitted
+    by :py:func:`~aiida.engine.daemon.execmanager.submit_calculations` with a single call to
+    :py:meth:`~aiida.schedulers.scheduler.Scheduler.submit_from_scripts`, such that submitting many jobs to the same
+    computer only requires a single remote command per batch instead of one for each job. Any remaining requests are
+    submitted in the next batch. Like for the submission of a single job, the transport is used in the event loop while
+    holding its lock.
+
+    The job id returned by the scheduler is set on the node as soon as the batch is submitted, even if the request was
+    cancelled in the meantime, such that the job will not be submitted a second time.
+    """
+
+    def __init__(
+        self, authinfo: AuthInfo, transport_queue: 'TransportQueue', batch_size: int, batch_delay: float
+    ) -> None:
+        """Construct an instance for the given authinfo and transport queue.
+
+        :param authinfo: the authinfo used to submit the jobs.
+        :param transport_queue: the transport queue to request transports from.
+        :param batch_size: the maximum number of jobs submitted with a single remote command.
+        :param batch_delay: the time in seconds to collect submission requests before submitting them.
+        """
+        self._authinfo = authinfo
+        self._transport_queue = transport_queue
+        self._loop = transport_queue.loop
+        self._logger = logging.getLogger(__name__)
+        self._batch_size = batch_size
+        self._batch_delay = batch_delay
+        self._submission_requests: Dict[int, 'asyncio.Future[Any]'] = {}
+        self._nodes: Dict[int, 'CalcJobNode'] = {}
+        self._submit_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def logger(self) -> logging.Logger:
+        """Return the logger configured for this instance.
+
+        :return: the logger
+        """
+        return self._logger
+
+    @contextlib.contextmanager
+    def request_submission(self, node: 'CalcJobNode') -> Iterator['asyncio.Future[Any]']:
+        """Request the submission of the job of the given calculation job node with the next batch.
+
+        :param node: the calculation job node whose job has been uploaded but not yet submitted.
+        :return: future that will resolve to the job id or ``ExitCode`` returned by the scheduler, or to the exception
+            that was raised while submitting the job.
+        """
+        request = self._submission_requests.get(node.pk, None)
+
+        if request is None or request.done():
+            request = self._submission_requests[node.pk] = asyncio.Future()
+            self._nodes[node.pk] = node
+
+        try:
+            self._ensure_submitting()
+            yield request
+        finally:
+            pass
+
+    def _ensure_submitting(self) -> None:
+        """Ensure that the pending submission requests are submitted, stopping when there are no requests left."""
+
+        async def submitting():
+            """Submit the next batch, and schedule the next one if there are requests left."""
+            try:
+                await self._submit_pending()
+            finally:
+                if self._submission_requests_outstanding():
+                    schedule_submit()
+                else:
+                    self._submission_requests.clear()
+                    self._nodes.clear()
+                    self._submit_handle = None
+
+        def schedule_submit():
+            self._submit_handle = self._loop.call_later(
+                self._batch_delay,
+                lambda: asyncio.ensure_future(submitting()),
+                context=contextvars.Context(),  #  type: ignore[call-arg]
+            )
+
+        if self._submit_handle is None:
+            schedule_submit()
+
+    async def _submit_pending(self) -> None:
+        """Submit up to ``batch_size`` of the pending submission requests with a single scheduler call."""
+        requests = self._pop_pending_requests()
+
+        if not requests:
+            return
+
+        try:
+            with self._transport_queue.request_transport(self._authinfo) as request:
+                transport = await request
+
+                self.logger.info(f'AuthInfo<{self._authinfo.pk}>: submitting batch of {len(requests)} jobs')
+
+                async with self._transport_queue.get_transport_lock(self._authinfo):
+                    results = execmanager.submit_calculations([node for node, _ in requests], transport)
+        except Exception as exception:  # pylint: disable=broad-except
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(exception)
+            return
+
+        for (_, future), result in zip(requests, results):
+            if future.done():
+                continue
+
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _pop_pending_requests(self) -> List[Tuple['CalcJobNode', 'asyncio.Future[Any]']]:
+        """Remove and return up to ``batch_size`` of the requests that are still pending.
+
+        Requests that were cancelled are discarded.
+        """
+        requests = []
+
+        for pk in list(self._submission_requests):
+            if len(requests) >= self._batch_size:
+                break
+
+            future = self._submission_requests.pop(pk)
+            node = self._nodes.pop(pk)
+
+            if future.done():
+                continue
+
+            requests.append((node, future))
+
+        return requests
+
+    def _submission_requests_outstanding(self) -> bool:
+        return any(not request.done() for request in self._submission_requests.values())
+
+
 class JobManager:
     """A manager for :py:class:`~aiida.engine.processes.calcjobs.calcjob.CalcJob` submitted to ``Computer`` instances.
 
@@ -255,15 +787,57 @@ class JobManager:
     for each authinfo that has active calculation jobs. These jobslist instances are then responsible for bundling
     scheduler updates for all the jobs they maintain (i.e. that all share the same authinfo) and update their status.
 
+    Authinfos that give access to the same scheduler queue, i.e. that are configured for the same host and scheduler
+    and log in with the same username, share a single :py:class:`~aiida.engine.processes.calcjobs.manager.JobsPoller`.
+    This way, the jobs lists of all these authinfos are updated with a single scheduler query and the minimum polling
+    interval is respected between them. The number of queries that were saved in this way, can be inspected through
+    the ``get_polling_statistics`` method.
+
     As long as a :py:class:`~aiida.engine.runners.Runner` will create a single ``JobManager`` instance and use that for
     its lifetime, the guarantees made by the ``JobsList`` about respecting the minimum polling interval of the scheduler
     will be maintained. Note, however, that since each ``Runner`` will create its own job manager, these guarantees
     only hold per runner.
+
+    If adaptive job polling is enabled through the ``runner.job_poll.adaptive`` configuration option, or a poll policy
+    is passed explicitly, the jobs lists only query the scheduler once the first of their jobs is due according to the
+    :py:class:`~aiida.engine.processes.calcjobs.manager.AdaptivePollPolicy`.
+
+    If the ``runner.submit.batch_size`` configuration option is larger than one, the jobs of calculation jobs that use
+    the same authinfo can be submitted in batches through a
+    :py:class:`~aiida.engine.processes.calcjobs.manager.JobSubmitter`.
     """
 
-    def __init__(self, transport_queue: 'TransportQueue') -> None:
+    def __init__(self, transport_queue: 'TransportQueue', poll_policy: Optional[AdaptivePollPolicy] = None) -> None:
         self._transport_queue = transport_queue
-        self._job_lists: Dict[Hashable, 'JobInfo'] = {}
+        self._job_lists: Dict[Hashable, JobsList] = {}
+        self._pollers: Dict[Hashable, JobsPoller] = {}
+        self._poll_policy = poll_policy if poll_policy is not None else AdaptivePollPolicy.from_config()
+        self._job_submitters: Dict[Hashable, JobSubmitter] = {}
+
+    @property
+    def submit_batch_size(self) -> int:
+        """Return the maximum number of jobs that are submitted to the scheduler with a single remote command.
+
+        :return: the value of the ``runner.submit.batch_size`` configuration option.
+        """
+        from aiida.manage import get_config_option
+
+        return get_config_option('runner.submit.batch_size')
+
+    @staticmethod
+    def get_poller_key(authinfo: AuthInfo) -> Hashable:
+        """Return the key that identifies the scheduler queue that is accessed through the given authinfo.
+
+        If the authinfo does not define a username, for example because it is taken from the SSH configuration, it is
+        not known which account is used, so the authinfo gets a queue of its own.
+
+        :param authinfo: the `AuthInfo`
+        :return: tuple of the hostname and scheduler type of the computer and the username of the authinfo, or its pk
+            if it does not define a username.
+        """
+        computer = authinfo.computer
+        username = authinfo.get_auth_params().get('username', None)
+        return (computer.hostname, computer.scheduler_type, username if username else ('authinfo', authinfo.pk))
 
     def get_jobs_list(self, authinfo: AuthInfo) -> JobsList:
         """Get or create a new `JobLists` instance for the given authinfo.
@@ -272,18 +846,70 @@ class JobManager:
         :return: a `JobsList` instance
         """
         if authinfo.pk not in self._job_lists:
-            self._job_lists[authinfo.pk] = JobsList(authinfo, self._transport_queue)
+            key = self.get_poller_key(authinfo)
+
+            if key not in self._pollers:
+                self._pollers[key] = JobsPoller(self._transport_queue)
+
+            self._job_lists[authinfo.pk] = JobsList(
+                authinfo, self._transport_queue, poller=self._pollers[key], poll_policy=self._poll_policy
+            )
 
         return self._job_lists[authinfo.pk]
 
+    def get_job_submitter(self, authinfo: AuthInfo) -> JobSubmitter:
+        """Get or create a new `JobSubmitter` instance for the given authinfo.
+
+        :param authinfo: the `AuthInfo`
+        :return: a `JobSubmitter` instance
+        """
+        from aiida.manage import get_config_option
+
+        if authinfo.pk not in self._job_submitters:
+            self._job_submitters[authinfo.pk] = JobSubmitter(
+                authinfo,
+                self._transport_queue,
+                batch_size=self.submit_batch_size,
+                batch_delay=get_config_option('runner.submit.batch_delay'),
+            )
+
+        return self._job_submitters[authinfo.pk]
+
+    def get_polling_statistics(self) -> Dict[Hashable, Dict[str, Any]]:
+        """Return the statistics of the scheduler pollers.
+
+        :return: mapping of the poller key, as returned by ``get_poller_key``, onto the statistics of the poller.
+        """
+        return {key: poller.get_statistics() for key, poller in self._pollers.items()}
+
     @contextlib.contextmanager
-    def request_job_info_update(self, authinfo: AuthInfo, job_id: Hashable) -> Iterator['asyncio.Future[JobInfo]']:
+    def request_job_info_update(
+        self,
+        authinfo: AuthInfo,
+        job_id: Hashable,
+        max_wallclock_seconds: Optional[float] = None
+    ) -> Iterator['asyncio.Future[JobInfo]']:
         """Get a future that will resolve to information about a given job.
 
         This is a context manager so that if the user leaves the context the request is automatically cancelled.
 
         """
-        with self.get_jobs_list(authinfo).request_job_info_update(job_id) as request:
+        with self.get_jobs_list(authinfo).request_job_info_update(job_id, max_wallclock_seconds) as request:
+            try:
+                yield request
+            finally:
+                if not request.done():
+                    request.cancel()
+
+    @contextlib.contextmanager
+    def request_submission(self, authinfo: AuthInfo, node: 'CalcJobNode') -> Iterator['asyncio.Future[Any]']:
+        """Get a future that will resolve to the result of submitting the job of the given calculation job node.
+
+        The job is submitted together with those of other requests for the same authinfo, see the ``JobSubmitter``.
+        This is a context manager so that if the user leaves the context the request is automatically cancelled.
+
+        """
+        with self.get_job_submitter(authinfo).request_submission(node) as request:
             try:
                 yield request
             finally:
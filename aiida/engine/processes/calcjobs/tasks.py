@@ -11,10 +11,15 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import collections
+import contextlib
+import dataclasses
 import functools
+import itertools
 import logging
 import tempfile
-from typing import TYPE_CHECKING, Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Optional
 
 import plumpy
 import plumpy.futures
@@ -36,7 +41,10 @@ from ..process import ProcessState
 from .monitors import CalcJobMonitorAction, CalcJobMonitorResult, CalcJobMonitors
 
 if TYPE_CHECKING:
+    from aiida.orm import AuthInfo, Computer
+
     from .calcjob import CalcJob
+    from .manager import JobManager
 
 UPLOAD_COMMAND = 'upload'
 SUBMIT_COMMAND = 'submit'
@@ -45,9 +53,25 @@ RETRIEVE_COMMAND = 'retrieve'
 STASH_COMMAND = 'stash'
 KILL_COMMAND = 'kill'
 
+MONITOR_TASK = 'monitor'
+
 RETRY_INTERVAL_OPTION = 'transport.task_retry_initial_interval'
 MAX_ATTEMPTS_OPTION = 'transport.task_maximum_attempts'
 
+# The priority of the types of tasks when waiting for a slot of the ``TaskScheduler``, where lower values go first, such
+# that tasks that finish calculation jobs take precedence over the tasks that start new ones.
+TASK_PRIORITIES = {
+    KILL_COMMAND: 0,
+    RETRIEVE_COMMAND: 1,
+    STASH_COMMAND: 2,
+    MONITOR_TASK: 3,
+    SUBMIT_COMMAND: 4,
+    UPLOAD_COMMAND: 5,
+}
+
+# The types of tasks whose concurrency can be limited through the ``transport.task_concurrency.<type>`` options
+LIMITED_TASK_TYPES = (UPLOAD_COMMAND, SUBMIT_COMMAND, RETRIEVE_COMMAND, STASH_COMMAND)
+
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 
@@ -55,7 +79,167 @@ class PreSubmitException(Exception):
     """Raise in the `do_upload` coroutine when an exception is raised in `CalcJob.presubmit`."""
 
 
-async def task_upload_job(process: 'CalcJob', transport_queue: TransportQueue, cancellable: InterruptableFuture):
+@dataclasses.dataclass(order=True)
+class _SlotRequest:
+    """A request for a slot of the ``TaskScheduler``, which are ordered by priority and then by order of request."""
+
+    priority: int
+    sequence: int
+    computer: str = dataclasses.field(compare=False)
+    task_type: str = dataclasses.field(compare=False)
+    future: asyncio.Future = dataclasses.field(compare=False)
+    granted: bool = dataclasses.field(default=False, compare=False)
+
+
+class TaskScheduler:
+    """Scheduler of the transport tasks of calculation jobs that are run concurrently by a daemon worker.
+
+    The number of tasks that run concurrently can be limited for each computer, counting all types of tasks, and for
+    each type of task, counting the tasks for all computers, for example to prevent a burst of retrievals from
+    saturating the local disk. A limit of zero means no limit. Tasks that would exceed a limit wait for a slot, which
+    are granted in order of the ``TASK_PRIORITIES`` of their type and then in order of request. A waiting task does
+    not hold back tasks with a lower priority that are not subject to the same limit.
+
+    The number of running and waiting tasks for each computer and type of task can be inspected through the
+    ``get_statistics`` method.
+    """
+
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        computer_limit: Optional[int] = None,
+        task_limits: Optional[Dict[str, int]] = None,
+    ):
+        """Construct a new task scheduler.
+
+        :param loop: the event loop in which the tasks run.
+        :param computer_limit: the maximum number of tasks that run concurrently for each computer. If not specified,
+            the value of the ``transport.task_concurrency.per_computer`` configuration option is used.
+        :param task_limits: the maximum number of tasks of each type that run concurrently. If not specified, the
+            values of the ``transport.task_concurrency.<type>`` configuration options are used.
+        """
+        if computer_limit is None:
+            computer_limit = get_config_option('transport.task_concurrency.per_computer')
+
+        if task_limits is None:
+            task_limits = {
+                task_type: get_config_option(f'transport.task_concurrency.{task_type}')
+                for task_type in LIMITED_TASK_TYPES
+            }
+
+        self._loop = loop if loop is not None else asyncio.get_event_loop()
+        self._computer_limit = computer_limit
+        self._task_limits = task_limits
+        self._sequence = itertools.count()
+        self._waiting: List[_SlotRequest] = []
+        self._running: Dict[str, Dict[str, int]] = collections.defaultdict(collections.Counter)
+        self._running_per_task_type: Dict[str, int] = collections.Counter()
+
+    @contextlib.contextmanager
+    def request_slot(self, computer: 'Computer', task_type: str) -> Iterator['asyncio.Future[bool]']:
+        """Request a slot to run a task of the given type for the given computer.
+
+        The future that is yielded resolves once the slot is granted, after which the task should run. The slot is
+        released, or the request withdrawn if it was not yet granted, when the context is exited.
+
+        :param computer: the computer of the calculation job of the task.
+        :param task_type: the type of the task, which should be one of the keys of ``TASK_PRIORITIES``.
+        :return: a future that resolves once the slot is granted.
+        """
+        request = _SlotRequest(
+            priority=TASK_PRIORITIES.get(task_type, len(TASK_PRIORITIES)),
+            sequence=next(self._sequence),
+            computer=computer.label,
+            task_type=task_type,
+            future=self._loop.create_future(),
+        )
+        bisect.insort(self._waiting, request)
+        self._grant_slots()
+
+        try:
+            yield request.future
+        finally:
+            if request.granted:
+                self._running[request.computer][request.task_type] -= 1
+                self._running_per_task_type[request.task_type] -= 1
+                self._grant_slots()
+            else:
+                self._waiting.remove(request)
+                request.future.cancel()
+
+    def get_statistics(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Return the number of running and waiting tasks.
+
+        :return: dictionary with for each computer label a dictionary with for each type of task the number of
+            ``running`` and ``waiting`` tasks. Only computers and types of tasks with any tasks are included.
+        """
+        statistics: Dict[str, Dict[str, Dict[str, int]]] = {}
+
+        for computer, running in self._running.items():
+            for task_type, count in running.items():
+                if count:
+                    statistics.setdefault(computer, {})[task_type] = {'running': count, 'waiting': 0}
+
+        for request in self._waiting:
+            counts = statistics.setdefault(request.computer, {}).setdefault(request.task_type, {'running': 0})
+            counts['waiting'] = counts.get('waiting', 0) + 1
+
+        return statistics
+
+    def _has_capacity(self, computer: str, task_type: str) -> bool:
+        """Return whether a task of the given type for the given computer can be run without exceeding the limits."""
+        if self._computer_limit and sum(self._running[computer].values()) >= self._computer_limit:
+            return False
+
+        task_limit = self._task_limits.get(task_type, 0)
+
+        return not task_limit or self._running_per_task_type[task_type] < task_limit
+
+    def _grant_slots(self) -> None:
+        """Grant the slots to the waiting requests in order of priority, as long as the limits are not exceeded."""
+        for request in list(self._waiting):
+            if not self._has_capacity(request.computer, request.task_type):
+                continue
+
+            self._waiting.remove(request)
+            self._running[request.computer][request.task_type] += 1
+            self._running_per_task_type[request.task_type] += 1
+            request.granted = True
+            request.future.set_result(True)
+
+
+def _in_task_slot(
+    fct: Callable[[], Awaitable[Any]],
+    task_scheduler: Optional[TaskScheduler],
+    authinfo: 'AuthInfo',
+    task_type: str,
+    cancellable: InterruptableFuture,
+) -> Callable[[], Awaitable[Any]]:
+    """Return the coroutine function wrapped such that each call first waits for a slot of the task scheduler.
+
+    :param fct: the coroutine function that performs a single attempt of the task.
+    :param task_scheduler: the task scheduler, or ``None`` in which case the coroutine function is returned as is.
+    :param authinfo: the authinfo of the calculation job of the task.
+    :param task_type: the type of the task.
+    :param cancellable: the cancelled flag that interrupts the wait for the slot.
+    """
+    if task_scheduler is None:
+        return fct
+
+    async def run_in_slot():
+        with task_scheduler.request_slot(authinfo.computer, task_type) as request:
+            await cancellable.with_interrupt(request)
+            return await fct()
+
+    return run_in_slot
+
+
+async def task_upload_job(
+    process: 'CalcJob',
+    transport_queue: TransportQueue,
+    cancellable: InterruptableFuture,
+    task_scheduler: Optional[TaskScheduler] = None,
+):
     """Transport task that will attempt to upload the files of a job calculation to the remote.
 
     The task will first request a transport from the queue. Once the transport is yielded, the relevant execmanager
@@ -66,6 +250,7 @@ async def task_upload_job(process: 'CalcJob', transport_queue: TransportQueue, c
     :param process: the job calculation
     :param transport_queue: the TransportQueue from which to request a Transport
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
+    :param task_scheduler: the task scheduler that limits the number of tasks that run concurrently, if any
 
     :raises: TransportTaskException if after the maximum number of retries the transport task still excepted
     """
@@ -92,7 +277,17 @@ async def task_upload_job(process: 'CalcJob', transport_queue: TransportQueue, c
                 except Exception as exception:  # pylint: disable=broad-except
                     raise PreSubmitException('exception occurred in presubmit call') from exception
                 else:
-                    execmanager.upload_calculation(node, transport, calc_info, folder)
+                    # The files are transferred outside of the event loop, while the stages before and after it are
+                    # performed in the event loop since they require the ORM.
+                    async with transport_queue.get_transport_lock(authinfo):
+                        upload_info = execmanager.prepare_upload(node, transport, calc_info, folder)
+
+                    if upload_info is not None:
+                        await transport_queue.run_in_executor(
+                            authinfo, execmanager.upload_files, transport, upload_info
+                        )
+                        execmanager.store_upload(node, upload_info)
+
                     skip_submit = calc_info.skip_submit or False
 
             return skip_submit
@@ -101,7 +296,11 @@ async def task_upload_job(process: 'CalcJob', transport_queue: TransportQueue, c
         logger.info(f'scheduled request to upload CalcJob<{node.pk}>')
         ignore_exceptions = (plumpy.futures.CancelledError, PreSubmitException, plumpy.process_states.Interruption)
         skip_submit = await exponential_backoff_retry(
-            do_upload, initial_interval, max_attempts, logger=node.logger, ignore_exceptions=ignore_exceptions
+            _in_task_slot(do_upload, task_scheduler, authinfo, UPLOAD_COMMAND, cancellable),
+            initial_interval,
+            max_attempts,
+            logger=node.logger,
+            ignore_exceptions=ignore_exceptions
         )
     except PreSubmitException:
         raise
@@ -116,7 +315,13 @@ async def task_upload_job(process: 'CalcJob', transport_queue: TransportQueue, c
         return skip_submit
 
 
-async def task_submit_job(node: CalcJobNode, transport_queue: TransportQueue, cancellable: InterruptableFuture):
+async def task_submit_job(
+    node: CalcJobNode,
+    transport_queue: TransportQueue,
+    cancellable: InterruptableFuture,
+    job_manager: Optional[JobManager] = None,
+    task_scheduler: Optional[TaskScheduler] = None,
+):
     """Transport task that will attempt to submit a job calculation.
 
     The task will first request a transport from the queue. Once the transport is yielded, the relevant execmanager
@@ -124,9 +329,15 @@ async def task_submit_job(node: CalcJobNode, transport_queue: TransportQueue, ca
     retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
     If all retries fail, the task will raise a TransportTaskException
 
+    If a job manager is passed and batched submission is enabled, the submission is instead requested from the job
+    manager, which submits the jobs of multiple calculation jobs for the same computer with a single remote command. In
+    that case, the task does not wait for a slot of the task scheduler.
+
     :param node: the node that represents the job calculation
     :param transport_queue: the TransportQueue from which to request a Transport
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
+    :param job_manager: the job manager through which to submit the job if batched submission is enabled
+    :param task_scheduler: the task scheduler that limits the number of tasks that run concurrently, if any
 
     :raises: TransportTaskException if after the maximum number of retries the transport task still excepted
     """
@@ -143,13 +354,35 @@ async def task_submit_job(node: CalcJobNode, transport_queue: TransportQueue, ca
     async def do_submit():
         with transport_queue.request_transport(authinfo) as request:
             transport = await cancellable.with_interrupt(request)
-            return execmanager.submit_calculation(node, transport)
+
+            async with transport_queue.get_transport_lock(authinfo):
+                return execmanager.submit_calculation(node, transport)
+
+    async def do_submit_batched():
+        job_id = node.get_job_id()
+        if job_id is not None:
+            return job_id
+
+        assert job_manager is not None
+        with job_manager.request_submission(authinfo, node) as request:
+            return await cancellable.with_interrupt(request)
+
+    # A batched submission does not take a slot of the task scheduler, since it mostly waits for the batch to be
+    # collected and a slot for each job would limit the number of jobs in a batch to the limits of the task scheduler.
+    if job_manager is not None and job_manager.submit_batch_size > 1:
+        submit = do_submit_batched
+    else:
+        submit = _in_task_slot(do_submit, task_scheduler, authinfo, SUBMIT_COMMAND, cancellable)
 
     try:
         logger.info(f'scheduled request to submit CalcJob<{node.pk}>')
         ignore_exceptions = (plumpy.futures.CancelledError, plumpy.process_states.Interruption)
         result = await exponential_backoff_retry(
-            do_submit, initial_interval, max_attempts, logger=node.logger, ignore_exceptions=ignore_exceptions
+            submit,
+            initial_interval,
+            max_attempts,
+            logger=node.logger,
+            ignore_exceptions=ignore_exceptions
         )
     except (plumpy.futures.CancelledError, plumpy.process_states.Interruption):  # pylint: disable=try-except-raise
         raise
@@ -189,7 +422,9 @@ async def task_update_job(node: CalcJobNode, job_manager, cancellable: Interrupt
 
     async def do_update():
         # Get the update request
-        with job_manager.request_job_info_update(authinfo, job_id) as update_request:
+        max_wallclock_seconds = node.get_option('max_wallclock_seconds')
+
+        with job_manager.request_job_info_update(authinfo, job_id, max_wallclock_seconds) as update_request:
             job_info = await cancellable.with_interrupt(update_request)
 
         if job_info is None:
@@ -223,7 +458,11 @@ async def task_update_job(node: CalcJobNode, job_manager, cancellable: Interrupt
 
 
 async def task_monitor_job(
-    node: CalcJobNode, transport_queue: TransportQueue, cancellable: InterruptableFuture, monitors: CalcJobMonitors
+    node: CalcJobNode,
+    transport_queue: TransportQueue,
+    cancellable: InterruptableFuture,
+    monitors: CalcJobMonitors,
+    task_scheduler: Optional[TaskScheduler] = None,
 ):
     """Transport task that will monitor the job calculation if any monitors have been defined.
 
@@ -236,6 +475,7 @@ async def task_monitor_job(
     :param transport_queue: the TransportQueue from which to request a Transport
     :param cancellable: A cancel flag
     :param monitors: An instance of ``CalcJobMonitors`` holding the collection of monitors to process.
+    :param task_scheduler: the task scheduler that limits the number of tasks that run concurrently, if any
     :return: True if the tasks was successfully completed, False otherwise
     """
     state = node.get_state()
@@ -252,14 +492,20 @@ async def task_monitor_job(
 
         with transport_queue.request_transport(authinfo) as request:
             transport = await cancellable.with_interrupt(request)
-            transport.chdir(node.get_remote_workdir())
-            return monitors.process(node, transport)
+
+            async with transport_queue.get_transport_lock(authinfo):
+                transport.chdir(node.get_remote_workdir())
+                return monitors.process(node, transport)
 
     try:
         logger.info(f'scheduled request to monitor CalcJob<{node.pk}>')
         ignore_exceptions = (plumpy.futures.CancelledError, plumpy.process_states.Interruption)
         monitor_result = await exponential_backoff_retry(
-            do_monitor, initial_interval, max_attempts, logger=node.logger, ignore_exceptions=ignore_exceptions
+            _in_task_slot(do_monitor, task_scheduler, authinfo, MONITOR_TASK, cancellable),
+            initial_interval,
+            max_attempts,
+            logger=node.logger,
+            ignore_exceptions=ignore_exceptions
         )
     except (plumpy.futures.CancelledError, plumpy.process_states.Interruption):  # pylint: disable=try-except-raise
         raise
@@ -272,8 +518,11 @@ async def task_monitor_job(
 
 
 async def task_retrieve_job(
-    node: CalcJobNode, transport_queue: TransportQueue, retrieved_temporary_folder: str,
-    cancellable: InterruptableFuture
+    node: CalcJobNode,
+    transport_queue: TransportQueue,
+    retrieved_temporary_folder: str,
+    cancellable: InterruptableFuture,
+    task_scheduler: Optional[TaskScheduler] = None,
 ):
     """Transport task that will attempt to retrieve all files of a completed job calculation.
 
@@ -286,6 +535,7 @@ async def task_retrieve_job(
     :param transport_queue: the TransportQueue from which to request a Transport
     :param retrieved_temporary_folder: the absolute path to a directory to store files
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
+    :param task_scheduler: the task scheduler that limits the number of tasks that run concurrently, if any
 
     :raises: TransportTaskException if after the maximum number of retries the transport task still excepted
     """
@@ -295,6 +545,8 @@ async def task_retrieve_job(
 
     initial_interval = get_config_option(RETRY_INTERVAL_OPTION)
     max_attempts = get_config_option(MAX_ATTEMPTS_OPTION)
+    filepath_sandbox = get_config_option('storage.sandbox') or None
+    stream_retrieved_files = get_config_option('transport.stream_retrieved_files')
 
     authinfo = node.get_authinfo()
 
@@ -310,23 +562,62 @@ async def task_retrieve_job(
 
             if node.get_job_id() is None:
                 logger.warning(f'there is no job id for CalcJobNoe<{node.pk}>: skipping `get_detailed_job_info`')
-                return execmanager.retrieve_calculation(node, transport, retrieved_temporary_folder)
-
-            try:
-                detailed_job_info = scheduler.get_detailed_job_info(node.get_job_id())
-            except FeatureNotAvailable:
-                logger.info(f'detailed job info not available for scheduler of CalcJob<{node.pk}>')
-                node.set_detailed_job_info(None)
             else:
-                node.set_detailed_job_info(detailed_job_info)
-
-            return execmanager.retrieve_calculation(node, transport, retrieved_temporary_folder)
+                try:
+                    detailed_job_info = await transport_queue.run_in_executor(
+                        authinfo, scheduler.get_detailed_job_info, node.get_job_id()
+                    )
+                except FeatureNotAvailable:
+                    logger.info(f'detailed job info not available for scheduler of CalcJob<{node.pk}>')
+                    node.set_detailed_job_info(None)
+                else:
+                    node.set_detailed_job_info(detailed_job_info)
+
+            if execmanager.is_retrieved(node):
+                return None
+
+            # The files are streamed to a dedicated instance of the repository backend outside of the event loop, while
+            # holding the lock of the transport such that no other task uses it in the meantime, after which they are
+            # attached to the output node in the event loop since that requires the ORM.
+            if stream_retrieved_files:
+                serialized = await transport_queue.run_in_executor(
+                    authinfo,
+                    execmanager.stream_calculation,
+                    transport,
+                    node.backend.get_repository(),
+                    node.get_remote_workdir(),
+                    node.get_retrieve_list(),
+                    retrieved_temporary_folder,
+                    node.get_retrieve_temporary_list(),
+                    label=f'calc {node.pk}',
+                )
+                return execmanager.store_streamed_calculation(node, serialized, retrieved_temporary_folder)
+
+            # The files are downloaded outside of the event loop, after which they are stored in the event loop since
+            # that requires the ORM.
+            with SandboxFolder(filepath_sandbox) as folder:
+                await transport_queue.run_in_executor(
+                    authinfo,
+                    execmanager.download_calculation,
+                    transport,
+                    node.get_remote_workdir(),
+                    folder.abspath,
+                    node.get_retrieve_list(),
+                    retrieved_temporary_folder,
+                    node.get_retrieve_temporary_list(),
+                    label=f'calc {node.pk}',
+                )
+                return execmanager.store_retrieved_calculation(node, folder.abspath, retrieved_temporary_folder)
 
     try:
         logger.info(f'scheduled request to retrieve CalcJob<{node.pk}>')
         ignore_exceptions = (plumpy.futures.CancelledError, plumpy.process_states.Interruption)
         result = await exponential_backoff_retry(
-            do_retrieve, initial_interval, max_attempts, logger=node.logger, ignore_exceptions=ignore_exceptions
+            _in_task_slot(do_retrieve, task_scheduler, authinfo, RETRIEVE_COMMAND, cancellable),
+            initial_interval,
+            max_attempts,
+            logger=node.logger,
+            ignore_exceptions=ignore_exceptions
         )
     except (plumpy.futures.CancelledError, plumpy.process_states.Interruption):  # pylint: disable=try-except-raise
         raise
@@ -339,7 +630,12 @@ async def task_retrieve_job(
         return result
 
 
-async def task_stash_job(node: CalcJobNode, transport_queue: TransportQueue, cancellable: InterruptableFuture):
+async def task_stash_job(
+    node: CalcJobNode,
+    transport_queue: TransportQueue,
+    cancellable: InterruptableFuture,
+    task_scheduler: Optional[TaskScheduler] = None,
+):
     """Transport task that will optionally stash files of a completed job calculation on the remote.
 
     The task will first request a transport from the queue. Once the transport is yielded, the relevant execmanager
@@ -350,6 +646,7 @@ async def task_stash_job(node: CalcJobNode, transport_queue: TransportQueue, can
     :param node: the node that represents the job calculation
     :param transport_queue: the TransportQueue from which to request a Transport
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
+    :param task_scheduler: the task scheduler that limits the number of tasks that run concurrently, if any
     :raises: Return if the tasks was successfully completed
     :raises: TransportTaskException if after the maximum number of retries the transport task still excepted
     """
@@ -367,11 +664,13 @@ async def task_stash_job(node: CalcJobNode, transport_queue: TransportQueue, can
             transport = await cancellable.with_interrupt(request)
 
             logger.info(f'stashing calculation<{node.pk}>')
-            return execmanager.stash_calculation(node, transport)
+
+            async with transport_queue.get_transport_lock(authinfo):
+                return execmanager.stash_calculation(node, transport)
 
     try:
         await exponential_backoff_retry(
-            do_stash,
+            _in_task_slot(do_stash, task_scheduler, authinfo, STASH_COMMAND, cancellable),
             initial_interval,
             max_attempts,
             logger=node.logger,
@@ -388,7 +687,12 @@ async def task_stash_job(node: CalcJobNode, transport_queue: TransportQueue, can
         return
 
 
-async def task_kill_job(node: CalcJobNode, transport_queue: TransportQueue, cancellable: InterruptableFuture):
+async def task_kill_job(
+    node: CalcJobNode,
+    transport_queue: TransportQueue,
+    cancellable: InterruptableFuture,
+    task_scheduler: Optional[TaskScheduler] = None,
+):
     """Transport task that will attempt to kill a job calculation.
 
     The task will first request a transport from the queue. Once the transport is yielded, the relevant execmanager
@@ -414,11 +718,18 @@ async def task_kill_job(node: CalcJobNode, transport_queue: TransportQueue, canc
     async def do_kill():
         with transport_queue.request_transport(authinfo) as request:
             transport = await cancellable.with_interrupt(request)
-            return execmanager.kill_calculation(node, transport)
+
+            async with transport_queue.get_transport_lock(authinfo):
+                return execmanager.kill_calculation(node, transport)
 
     try:
         logger.info(f'scheduled request to kill CalcJob<{node.pk}>')
-        result = await exponential_backoff_retry(do_kill, initial_interval, max_attempts, logger=node.logger)
+        result = await exponential_backoff_retry(
+            _in_task_slot(do_kill, task_scheduler, authinfo, KILL_COMMAND, cancellable),
+            initial_interval,
+            max_attempts,
+            logger=node.logger
+        )
     except plumpy.process_states.Interruption:
         raise
     except Exception as exception:
@@ -488,6 +799,7 @@ class Waiting(plumpy.process_states.Waiting):
         # pylint: disable=too-many-branches,too-many-statements,too-many-nested-blocks
         node = self.process.node
         transport_queue = self.process.runner.transport
+        task_scheduler = self.process.runner.task_scheduler
         result: plumpy.process_states.State = self
 
         process_status = f'Waiting for transport task: {self._command}'
@@ -496,14 +808,22 @@ class Waiting(plumpy.process_states.Waiting):
         try:
 
             if self._command == UPLOAD_COMMAND:
-                skip_submit = await self._launch_task(task_upload_job, self.process, transport_queue)
+                skip_submit = await self._launch_task(
+                    task_upload_job, self.process, transport_queue, task_scheduler=task_scheduler
+                )
                 if skip_submit:
                     result = self.retrieve(monitor_result=self._monitor_result)
                 else:
                     result = self.submit()
 
             elif self._command == SUBMIT_COMMAND:
-                result = await self._launch_task(task_submit_job, node, transport_queue)
+                result = await self._launch_task(
+                    task_submit_job,
+                    node,
+                    transport_queue,
+                    job_manager=self.process.runner.job_manager,
+                    task_scheduler=task_scheduler
+                )
 
                 if isinstance(result, ExitCode):
                     # The scheduler plugin returned an exit code from ``Scheduler.submit_from_script`` indicating the
@@ -537,12 +857,14 @@ class Waiting(plumpy.process_states.Waiting):
 
             elif self._command == STASH_COMMAND:
                 if node.get_option('stash') is not None:
-                    await self._launch_task(task_stash_job, node, transport_queue)
+                    await self._launch_task(task_stash_job, node, transport_queue, task_scheduler=task_scheduler)
                 result = self.retrieve(monitor_result=self._monitor_result)
 
             elif self._command == RETRIEVE_COMMAND:
                 temp_folder = tempfile.mkdtemp()
-                await self._launch_task(task_retrieve_job, node, transport_queue, temp_folder)
+                await self._launch_task(
+                    task_retrieve_job, node, transport_queue, temp_folder, task_scheduler=task_scheduler
+                )
 
                 if not self._monitor_result:
                     result = self.parse(temp_folder)
@@ -590,7 +912,13 @@ class Waiting(plumpy.process_states.Waiting):
         if self._monitor_result and self._monitor_result.action == CalcJobMonitorAction.DISABLE_ALL:
             return None
 
-        monitor_result = await self._launch_task(task_monitor_job, node, transport_queue, monitors=monitors)
+        monitor_result = await self._launch_task(
+            task_monitor_job,
+            node,
+            transport_queue,
+            monitors=monitors,
+            task_scheduler=self.process.runner.task_scheduler,
+        )
 
         if monitor_result and monitor_result.action == CalcJobMonitorAction.DISABLE_SELF:
             monitors.monitors[monitor_result.key].disabled = True
@@ -602,7 +930,7 @@ class Waiting(plumpy.process_states.Waiting):
 
     async def _kill_job(self, node, transport_queue) -> None:
         """Kill the job."""
-        await self._launch_task(task_kill_job, node, transport_queue)
+        await self._launch_task(task_kill_job, node, transport_queue, task_scheduler=self.process.runner.task_scheduler)
         if self._killing is not None:
             self._killing.set_result(True)
         else:
@@ -12,6 +12,7 @@
 import asyncio
 import collections
 from collections.abc import Mapping
+import contextlib
 import copy
 import enum
 import inspect
@@ -51,6 +52,7 @@ from aiida.common.links import LinkType
 from aiida.common.log import LOG_LEVEL_REPORT
 from aiida.orm.implementation.utils import clean_value
 from aiida.orm.utils import serialize
+from aiida.orm.utils.log import flush_db_log_handlers
 
 from .builder import ProcessBuilder
 from .exit_code import ExitCode, ExitCodesNamespace
@@ -256,6 +258,16 @@ class Process(plumpy.processes.Process):
         except (AssertionError, AttributeError):
             return AttributeDict()
 
+    @contextlib.contextmanager
+    def _node_transaction(self) -> Iterator[None]:
+        """Return a context manager in which the changes to the process node are written in a single transaction.
+
+        The changed attributes are written in a single operation and are committed together with the checkpoint, which
+        the storage may keep separately from the attributes.
+        """
+        with self.node.backend.transaction(), self.node.base.attributes.batch():
+            yield
+
     def _save_checkpoint(self) -> None:
         """
         Save the current state in a chechpoint if persistence is enabled and the process state is not terminal
@@ -422,16 +434,18 @@ class Process(plumpy.processes.Process):
         # is the risk that certain outputs do not get attached before the process reaches a terminal state. Nevertheless
         # we need to guarantee that the process state gets updated even if the ``update_outputs`` call excepts, for
         # example if the process implementation attaches an invalid output through ``Process.out``, and so we call the
-        # ``ProcessNode.set_process_state`` in the finally-clause. This way the state gets properly set on the node even
-        # if the process is transitioning to the terminal excepted state.
+        # ``ProcessNode.set_process_state`` before reraising. This way the state gets properly set on the node even if
+        # the process is transitioning to the terminal excepted state.
         try:
             self.update_outputs()
-        except ValueError:  # pylint: disable=try-except-raise
+        except BaseException:
+            self.node.set_process_state(self._state.LABEL)  # type: ignore
             raise
-        finally:
+
+        with self._node_transaction():
             self.node.set_process_state(self._state.LABEL)  # type: ignore
+            self._save_checkpoint()
 
-        self._save_checkpoint()
         set_process_state_change_timestamp(self)
         super().on_entered(from_state)
 
@@ -451,6 +465,9 @@ class Process(plumpy.processes.Process):
         except exceptions.ModificationNotAllowed:
             pass
 
+        # Make sure that all log records of the process are written to the database if they are being buffered
+        flush_db_log_handlers()
+
     @override
     def on_except(self, exc_info: Tuple[Any, Exception, TracebackType]) -> None:
         """
@@ -482,8 +499,9 @@ class Process(plumpy.processes.Process):
         if isinstance(result, int):
             self.node.set_exit_status(result)
         elif isinstance(result, ExitCode):
-            self.node.set_exit_status(result.status)
-            self.node.set_exit_message(result.message)
+            with self.node.base.attributes.batch():
+                self.node.set_exit_status(result.status)
+                self.node.set_exit_message(result.message)
         else:
             raise ValueError(
                 f'the result should be an integer, ExitCode or None, got {type(result)} {result} {self.pid}'
@@ -498,8 +516,10 @@ class Process(plumpy.processes.Process):
 
         """
         super().on_paused(msg)
-        self._save_checkpoint()
-        self.node.pause()
+
+        with self._node_transaction():
+            self._save_checkpoint()
+            self.node.pause()
 
     @override
     def on_playing(self) -> None:
@@ -29,7 +29,7 @@ from aiida.plugins.utils import PluginVersionProvider
 
 from . import transports, utils
 from .processes import Process, ProcessBuilder, ProcessState, futures
-from .processes.calcjobs import manager
+from .processes.calcjobs import manager, tasks
 
 __all__ = ('Runner',)
 
@@ -85,6 +85,7 @@ class Runner:  # pylint: disable=too-many-public-methods
         self._rmq_submit = rmq_submit
         self._transport = transports.TransportQueue(self._loop)
         self._job_manager = manager.JobManager(self._transport)
+        self._task_scheduler = tasks.TaskScheduler(self._loop)
         self._persister = persister
         self._plugin_version_provider = PluginVersionProvider()
 
@@ -128,6 +129,10 @@ class Runner:  # pylint: disable=too-many-public-methods
     def job_manager(self) -> manager.JobManager:
         return self._job_manager
 
+    @property
+    def task_scheduler(self) -> tasks.TaskScheduler:
+        return self._task_scheduler
+
     @property
     def controller(self) -> Optional[RemoteProcessThreadController]:
         """Get the controller used by this runner."""
@@ -161,6 +166,7 @@ class Runner:  # pylint: disable=too-many-public-methods
         """Close the runner by stopping the loop."""
         assert not self._closed
         self.stop()
+        self._transport.close()
         reset_event_loop_policy()
         self._closed = True
 
@@ -9,17 +9,22 @@
 ###########################################################################
 """A transport queue to batch process multiple tasks that require a Transport."""
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 import contextvars
+import functools
 import logging
+import time
 import traceback
-from typing import Awaitable, Dict, Hashable, Iterator, Optional
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional, TypeVar
 
 from aiida.orm import AuthInfo
 from aiida.transports import Transport
 
 _LOGGER = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 class TransportRequest:
     """ Information kept about request for a transport object """
@@ -28,6 +33,10 @@ class TransportRequest:
         super().__init__()
         self.future: asyncio.Future = asyncio.Future()
         self.count = 0
+        self.open_task: Optional[asyncio.Future] = None
+        self.opened: Optional[float] = None
+        self.cwd: Optional[str] = None
+        self.close_handle: Optional[asyncio.TimerHandle] = None
 
 
 class TransportQueue:
@@ -40,20 +49,202 @@ class TransportQueue:
     it will open the transport and give it to all the clients that asked for it
     up to that point.  This way opening of transports (a costly operation) can
     be minimised.
+
+    Optionally, a transport that is no longer used is kept open for a ``keep_alive`` time, such that it can be reused
+    by the clients that ask for it in the meantime, as long as it is still alive and was opened less than
+    ``max_lifetime`` seconds ago. The number of transports that were opened and reused for each computer can be
+    inspected through the ``get_statistics`` method.
+
+    Blocking transport operations can be run in a thread pool through ``run_in_executor``. Since the clients share the
+    same transport, all its uses are serialized by a lock per authinfo: ``run_in_executor`` holds it while the operation
+    runs, and clients that use the transport directly in the event loop should hold the lock returned by
+    ``get_transport_lock`` while doing so.
     """
 
-    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        executor_concurrency: Optional[int] = None,
+        keep_alive: Optional[float] = None,
+        max_lifetime: Optional[float] = None,
+    ):
         """
         :param loop: An asyncio event, will use `asyncio.get_event_loop()` if not supplied
+        :param executor_concurrency: The number of threads of the pool in which `run_in_executor` runs blocking
+            transport operations. Operations on the same transport are run one at a time. If zero, the operations are
+            run directly in the event loop. Defaults to the ``transport.executor_concurrency`` configuration option.
+        :param keep_alive: The time in seconds that a transport is kept open after its last client released it. If
+            zero, it is closed immediately. Defaults to the ``transport.keep_alive`` configuration option.
+        :param max_lifetime: The time in seconds after it was opened that a transport is no longer kept open or reused.
+            If zero, there is no limit. Defaults to the ``transport.max_lifetime`` configuration option.
         """
+        from aiida.manage import get_config_option
+
         self._loop = loop if loop is not None else asyncio.get_event_loop()
         self._transport_requests: Dict[Hashable, TransportRequest] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._transport_locks: Dict[Hashable, asyncio.Lock] = {}
+        self._executor_concurrency = executor_concurrency if executor_concurrency is not None else get_config_option(
+            'transport.executor_concurrency'
+        )
+        self._keep_alive = keep_alive if keep_alive is not None else get_config_option('transport.keep_alive')
+        self._max_lifetime = max_lifetime if max_lifetime is not None else get_config_option('transport.max_lifetime')
+        self._statistics: Dict[str, Dict[str, int]] = {}
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
         """ Get the loop being used by this transport queue """
         return self._loop
 
+    def close(self) -> None:
+        """Close the transports that are kept open and shut down the thread pool used to run transport operations."""
+        for key, transport_request in list(self._transport_requests.items()):
+            if transport_request.count == 0 and transport_request.close_handle is not None:
+                self._close_idle_transport(key, transport_request)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_statistics(self) -> Dict[str, Dict[str, int]]:
+        """Return the number of transports that were opened and the number of times an open transport was reused.
+
+        A transport is reused if it is requested while it is kept open after its previous clients released it.
+
+        :return: mapping of the computer label onto a dictionary with the number of transports that were ``opened`` and
+            the number of times they were ``reused``.
+        """
+        return {label: dict(statistics) for label, statistics in self._statistics.items()}
+
+    def _get_statistics(self, authinfo: AuthInfo) -> Dict[str, int]:
+        """Return the mutable statistics of the computer of the given authinfo."""
+        return self._statistics.setdefault(authinfo.computer.label, {'opened': 0, 'reused': 0})
+
+    def _is_reusable(self, transport_request: TransportRequest) -> bool:
+        """Return whether the open transport of the given request can be used by new clients.
+
+        :param transport_request: a request whose future resolved to an open transport.
+        """
+        if self._max_lifetime and transport_request.opened is not None:
+            if time.monotonic() - transport_request.opened >= self._max_lifetime:
+                return False
+
+        return transport_request.future.result().is_alive()
+
+    @staticmethod
+    def _reset_cwd(transport_request: TransportRequest) -> bool:
+        """Change the working directory of the open transport of the given request back to the one it was opened in.
+
+        The previous clients of a transport that is kept open may have changed its working directory, which may no
+        longer exist by the time the transport is reused. Some transports run remote commands in that directory.
+
+        :param transport_request: a request whose future resolved to an open transport.
+        :return: whether the working directory was restored, or did not have to be.
+        """
+        transport = transport_request.future.result()
+
+        if transport_request.cwd is None or transport.getcwd() == transport_request.cwd:
+            return True
+
+        try:
+            transport.chdir(transport_request.cwd)
+        except Exception as exception:  # pylint: disable=broad-except
+            _LOGGER.debug('failed to restore the working directory of the transport: %s', exception)
+            return False
+
+        return True
+
+    def _should_keep_alive(self, transport_request: TransportRequest) -> bool:
+        """Return whether the transport of the given request should be kept open after its last client released it.
+
+        :param transport_request: a request whose future is done.
+        """
+        return bool(self._keep_alive) and transport_request.future.exception() is None and self._is_reusable(
+            transport_request
+        )
+
+    def _close_idle_transport(self, key: Hashable, transport_request: TransportRequest) -> None:
+        """Close the transport of a request that no longer has any clients and forget about the request.
+
+        :param key: the key of the request, i.e. the pk of the authinfo.
+        :param transport_request: the request, whose future resolved to an open transport.
+        """
+        if transport_request.close_handle is not None:
+            transport_request.close_handle.cancel()
+            transport_request.close_handle = None
+
+        if self._transport_requests.get(key, None) is transport_request:
+            self._transport_requests.pop(key, None)
+
+        transport = transport_request.future.result()
+
+        try:
+            transport.close()
+        except Exception as exception:  # pylint: disable=broad-except
+            # The transport may already have been closed, for example because the connection was lost
+            _LOGGER.warning('exception occurred while trying to close idle transport: %s', exception)
+
+    def get_transport_lock(self, authinfo: AuthInfo) -> asyncio.Lock:
+        """Return the lock that serializes the use of the transport of the given authinfo.
+
+        The lock is held by ``run_in_executor`` while an operation runs in the thread pool. Clients that use the
+        transport directly in the event loop should hold it while doing so, such that they do not use the transport at
+        the same time as such an operation::
+
+            async with transport_queue.get_transport_lock(authinfo):
+                transport.listdir()
+
+        The lock is not reentrant, so ``run_in_executor`` should not be called while holding it.
+
+        :param authinfo: The authinfo of the transport.
+        :return: The lock of the transport.
+        """
+        if authinfo.pk not in self._transport_locks:
+            self._transport_locks[authinfo.pk] = asyncio.Lock()
+
+        return self._transport_locks[authinfo.pk]
+
+    async def run_in_executor(self, authinfo: AuthInfo, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking transport operation in a thread pool, such that it does not block the event loop.
+
+        The operation is run while holding the lock of the transport of the given authinfo, see ``get_transport_lock``,
+        so operations on the same transport are run one at a time. Since the operation runs outside of the event loop,
+        it should only perform operations on the transport and plain data: it should not use the ORM.
+
+        The thread cannot be interrupted, so if the calling task is cancelled, the cancellation is only propagated once
+        the operation has finished. This guarantees that the transport and any resources passed to the operation are
+        no longer in use when the caller releases them.
+
+        :param authinfo: The authinfo of the transport that the operation uses.
+        :param func: The callable that performs the operation.
+        :param args: Positional arguments passed to ``func``.
+        :param kwargs: Keyword arguments passed to ``func``.
+        :return: The return value of ``func``.
+        """
+        async with self.get_transport_lock(authinfo):
+            if not self._executor_concurrency:
+                return func(*args, **kwargs)
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._executor_concurrency, thread_name_prefix='aiida-transport'
+                )
+
+            future = self._loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Keep holding the lock until the operation has finished, ignoring further cancellation requests
+                while not future.done():
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await asyncio.wait([future])
+
+                if not future.cancelled() and future.exception() is not None:
+                    _LOGGER.debug('transport operation of cancelled task excepted: %s', future.exception())
+
+                raise
+
     @contextlib.contextmanager
     def request_transport(self, authinfo: AuthInfo) -> Iterator[Awaitable[Transport]]:
         """
@@ -72,6 +263,19 @@ class TransportQueue:
         open_callback_handle = None
         transport_request = self._transport_requests.get(authinfo.pk, None)
 
+        if transport_request is not None and transport_request.close_handle is not None:
+            # The transport is kept open after its previous clients released it, so reuse it if it is still healthy
+            transport_request.close_handle.cancel()
+            transport_request.close_handle = None
+
+            if self._is_reusable(transport_request) and self._reset_cwd(transport_request):
+                _LOGGER.debug('Transport request reusing open transport for %s', authinfo)
+                self._get_statistics(authinfo)['reused'] += 1
+            else:
+                _LOGGER.debug('Transport request discarding expired or broken transport for %s', authinfo)
+                self._close_idle_transport(authinfo.pk, transport_request)
+                transport_request = None
+
         if transport_request is None:
             # There is no existing request for this transport (i.e. on this authinfo)
             transport_request = TransportRequest()
@@ -80,28 +284,43 @@ class TransportQueue:
             transport = authinfo.get_transport()
             safe_open_interval = transport.get_safe_open_interval()
 
-            def do_open():
+            async def do_open():
                 """ Actually open the transport """
                 if transport_request and transport_request.count > 0:
                     # The user still wants the transport so open it
                     _LOGGER.debug('Transport request opening transport for %s', authinfo)
                     try:
-                        transport.open()
+                        await self.run_in_executor(authinfo, transport.open)
                     except Exception as exception:  # pylint: disable=broad-except
                         _LOGGER.error('exception occurred while trying to open transport:\n %s', exception)
                         transport_request.future.set_exception(exception)
 
                         # Cleanup of the stale TransportRequest with the excepted transport future
-                        self._transport_requests.pop(authinfo.pk, None)
+                        if self._transport_requests.get(authinfo.pk, None) is transport_request:
+                            self._transport_requests.pop(authinfo.pk, None)
                     else:
-                        transport_request.future.set_result(transport)
+                        transport_request.opened = time.monotonic()
+                        transport_request.cwd = transport.getcwd()
+                        self._get_statistics(authinfo)['opened'] += 1
+
+                        if transport_request.count == 0:
+                            # All users gave up on the transport while it was being opened
+                            transport.close()
+                        else:
+                            transport_request.future.set_result(transport)
 
             # Save the handle so that we can cancel the callback if the user no longer wants it
             # Note: Don't pass the Process context, since (a) it is not needed by `do_open` and (b) the transport is
             # passed around to many places, including outside aiida-core (e.g. paramiko). Anyone keeping a reference
             # to this handle would otherwise keep the Process context (and thus the process itself) in memory.
             # See https://github.com/aiidateam/aiida-core/issues/4698
-            open_callback_handle = self._loop.call_later(safe_open_interval, do_open, context=contextvars.Context())
+            def schedule_open():
+                """Schedule opening the transport, keeping a reference to the task so it is not garbage collected."""
+                transport_request.open_task = asyncio.ensure_future(do_open())
+
+            open_callback_handle = self._loop.call_later(
+                safe_open_interval, schedule_open, context=contextvars.Context()
+            )
 
         try:
             transport_request.count += 1
@@ -119,10 +338,21 @@ class TransportQueue:
             assert transport_request.count >= 0, 'Transport request count dropped below 0!'
             # Check if there are no longer any users that want the transport
             if transport_request.count == 0:
-                if transport_request.future.done():
-                    _LOGGER.debug('Transport request closing transport for %s', authinfo)
-                    transport_request.future.result().close()
-                elif open_callback_handle is not None:
-                    open_callback_handle.cancel()
+                if transport_request.future.done() and self._should_keep_alive(transport_request):
+                    # Keep the transport open for the next clients, the request is kept such that they can find it
+                    _LOGGER.debug('Transport request keeping transport open for %s', authinfo)
+                    transport_request.close_handle = self._loop.call_later(
+                        self._keep_alive,
+                        self._close_idle_transport,
+                        authinfo.pk,
+                        transport_request,
+                        context=contextvars.Context(),
+                    )
+                else:
+                    if transport_request.future.done():
+                        _LOGGER.debug('Transport request closing transport for %s', authinfo)
+                        transport_request.future.result().close()
+                    elif open_callback_handle is not None:
+                        open_callback_handle.cancel()
 
-                self._transport_requests.pop(authinfo.pk, None)
+                    self._transport_requests.pop(authinfo.pk, None)
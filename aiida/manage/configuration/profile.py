@@ -268,5 +268,6 @@ class Profile:  # pylint: disable=too-many-public-methods
             'daemon': {
                 'log': str(DAEMON_LOG_DIR / f'aiida-{self.name}.log'),
                 'pid': str(DAEMON_DIR / f'aiida-{self.name}.pid'),
+                'workers': str(DAEMON_DIR / f'aiida-{self.name}-workers'),
             }
         }
@@ -9,8 +9,9 @@
 ###########################################################################
 """Abstract BackendNode and BackendNodeCollection implementation."""
 import abc
+from contextlib import contextmanager
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 from .entities import BackendCollection, BackendEntity, BackendEntityExtrasMixin
 
@@ -274,6 +275,15 @@ class BackendNode(BackendEntity, BackendEntityExtrasMixin, metaclass=abc.ABCMeta
         for key, value in attributes.items():
             self.set_attribute(key, value)
 
+    @contextmanager
+    def batch_attributes(self) -> Iterator[None]:
+        """Return a context manager in which the attribute changes of a stored node are written to the storage at once.
+
+        The changes are written when exiting the outermost context. Implementations that do not support this write each
+        change immediately, which is the default.
+        """
+        yield
+
     @abc.abstractmethod
     def reset_attributes(self, attributes: Dict[str, Any]) -> None:
         """Reset the attributes.
@@ -9,7 +9,7 @@
 ###########################################################################
 """Generic backend related objects"""
 import abc
-from typing import TYPE_CHECKING, Any, ContextManager, List, Optional, Sequence, TypeVar, Union
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, List, Optional, Sequence, Set, Tuple, TypeVar, Union
 
 if TYPE_CHECKING:
     from aiida.manage.configuration.profile import Profile
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
         BackendUserCollection,
     )
     from aiida.orm.users import User
+    from aiida.orm.utils.links import LinkQuadruple
     from aiida.repository.backend.abstract import AbstractRepositoryBackend
 
 __all__ = ('StorageBackend',)
@@ -246,6 +247,67 @@ class StorageBackend(abc.ABC):  # pylint: disable=too-many-public-methods
         :raises: ``AssertionError`` if a transaction is not active
         """
 
+    def traverse_graph(
+        self,
+        starting_pks: Set[int],
+        links_forward: Sequence[str] = (),
+        links_backward: Sequence[str] = (),
+        get_links: bool = False
+    ) -> Tuple[Set[int], Optional[Set['LinkQuadruple']]]:
+        """Return all nodes that are connected to the starting nodes through any sequence of the given links.
+
+        Contrary to the rule engine of :func:`aiida.tools.graph.graph_traversers.traverse_graph`, the traversal is
+        performed by the storage itself, instead of expanding the graph one hop at a time.
+
+        :param starting_pks: the pks of the starting nodes, which are assumed to exist
+        :param links_forward: the values of the link types to traverse in the forward direction
+        :param links_backward: the values of the link types to traverse in the backward direction
+        :param get_links: whether to also return the links that were traversed
+
+        :return: the pks of the connected nodes, including the starting nodes, and the traversed links if ``get_links``
+            is True, ``None`` otherwise
+        :raises: ``NotImplementedError`` if the storage does not support traversing the graph
+        """
+        raise NotImplementedError
+
+    def get_process_checkpoint(self, pk: int) -> Optional[str]:
+        """Return the checkpoint of a process node.
+
+        Storages that implement the checkpoint methods store the checkpoints separately from the node attributes,
+        which are otherwise used by :class:`aiida.orm.ProcessNode`.
+
+        :param pk: the pk of the process node
+        :return: the checkpoint, or ``None`` if the node does not have a checkpoint
+        :raises: ``NotImplementedError`` if the storage does not store checkpoints separately
+        """
+        raise NotImplementedError
+
+    def get_process_checkpoints(self, pks: Sequence[int]) -> Dict[int, str]:
+        """Return the checkpoints of multiple process nodes.
+
+        :param pks: the pks of the process nodes
+        :return: mapping of the pk to the checkpoint of each of the nodes that has a checkpoint
+        :raises: ``NotImplementedError`` if the storage does not store checkpoints separately
+        """
+        raise NotImplementedError
+
+    def set_process_checkpoint(self, pk: int, checkpoint: str) -> None:
+        """Set the checkpoint of a process node, replacing any existing checkpoint.
+
+        :param pk: the pk of the process node, which is assumed to exist
+        :param checkpoint: the checkpoint
+        :raises: ``NotImplementedError`` if the storage does not store checkpoints separately
+        """
+        raise NotImplementedError
+
+    def delete_process_checkpoint(self, pk: int) -> None:
+        """Delete the checkpoint of a process node, if it exists.
+
+        :param pk: the pk of the process node
+        :raises: ``NotImplementedError`` if the storage does not store checkpoints separately
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_repository(self) -> 'AbstractRepositoryBackend':
         """Return the object repository configured for this backend."""
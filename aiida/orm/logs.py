@@ -49,6 +49,21 @@ class LogCollection(entities.Collection['Log']):
         :param record: The record created by the logging module
         :return: A stored log instance
         """
+        fields = self.get_fields_from_record(record)
+
+        if fields is None:
+            return None
+
+        return Log(**fields, backend=self.backend)
+
+    @staticmethod
+    def get_fields_from_record(record: logging.LogRecord) -> Optional[Dict[str, Any]]:
+        """Return the fields of the log entry that corresponds to a record created by the python logging library.
+
+        :param record: The record created by the logging module
+        :return: dictionary with the ``time``, ``loggername``, ``levelname``, ``dbnode_id``, ``message`` and
+            ``metadata`` of the log entry, or ``None`` if the record is not attached to a node.
+        """
         dbnode_id = record.__dict__.get('dbnode_id', None)
 
         # Do not store if dbnode_id is not set
@@ -70,15 +85,14 @@ class LogCollection(entities.Collection['Log']):
             if key in metadata:
                 metadata[key] = str(metadata[key])
 
-        return Log(
-            time=timezone.make_aware(datetime.fromtimestamp(record.created)),
-            loggername=record.name,
-            levelname=record.levelname,
-            dbnode_id=dbnode_id,
-            message=message,
-            metadata=metadata,
-            backend=self.backend
-        )
+        return {
+            'time': timezone.make_aware(datetime.fromtimestamp(record.created)),
+            'loggername': record.name,
+            'levelname': record.levelname,
+            'dbnode_id': dbnode_id,
+            'message': message,
+            'metadata': metadata,
+        }
 
     def get_logs_for(self, entity: 'Node', order_by: Optional['OrderByType'] = None) -> List['Log']:
         """Get all the log messages for a given node and optionally sort
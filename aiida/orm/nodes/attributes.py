@@ -8,8 +8,9 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Interface to the attributes of a node instance."""
+from contextlib import contextmanager
 import copy
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Tuple
 
 if TYPE_CHECKING:
     from .node import Node
@@ -130,6 +131,22 @@ class NodeAttributes:
         self._node._check_mutability_attributes(list(attributes))  # pylint: disable=protected-access
         self._backend_node.set_attribute_many(attributes)
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Return a context manager in which the changes to the attributes of a stored node are written at once.
+
+        Within the context, the changed attributes are collected and written to the storage in a single operation when
+        exiting the context, which avoids writing the attributes of the node multiple times::
+
+            with node.base.attributes.batch():
+                node.base.attributes.set('a', 1)
+                node.base.attributes.set('b', 2)
+
+        Whether the changes are actually combined depends on the storage backend.
+        """
+        with self._backend_node.batch_attributes():
+            yield
+
     def reset(self, attributes: Dict[str, Any]) -> None:
         """Reset the attributes.
 
@@ -11,6 +11,10 @@ from aiida.common.lang import type_check
 
 from ..querybuilder import QueryBuilder
 
+# Maximum number of hashes of immutable stored nodes that are memoized by ``NodeCaching._get_hash``
+_MEMOIZED_HASHES_MAXSIZE = 10000
+_MEMOIZED_HASHES: dict[tuple[str, str, str, str], str] = {}
+
 
 class NodeCaching:
     """Interface to control caching of a node instance."""
@@ -39,10 +43,18 @@ class NodeCaching:
 
         This will always work, even before storing.
 
+        The hash of a node that can no longer change, see ``_is_hash_immutable``, is memoized. This avoids recomputing
+        the hash of a stored node each time it is used as the input of a process whose hash is computed.
+
         :param ignore_errors: return ``None`` on ``aiida.common.exceptions.HashingError`` (logging the exception)
         """
+        memo_key = self._get_memo_key() if not kwargs else None
+
+        if memo_key is not None and memo_key in _MEMOIZED_HASHES:
+            return _MEMOIZED_HASHES[memo_key]
+
         try:
-            return make_hash(self._get_objects_to_hash(), **kwargs)
+            node_hash = make_hash(self._get_objects_to_hash(), **kwargs)
         except exceptions.HashingError:
             if not ignore_errors:
                 raise
@@ -50,15 +62,60 @@ class NodeCaching:
                 self._node.logger.exception('Node hashing failed')
             return None
 
-    def _get_objects_to_hash(self) -> list[t.Any]:
-        """Return a list of objects which should be included in the hash."""
+        if memo_key is not None:
+            if len(_MEMOIZED_HASHES) >= _MEMOIZED_HASHES_MAXSIZE:
+                _MEMOIZED_HASHES.pop(next(iter(_MEMOIZED_HASHES)), None)
+            _MEMOIZED_HASHES[memo_key] = node_hash
+
+        return node_hash
+
+    def _get_memo_key(self) -> tuple[str, str, str, str] | None:
+        """Return the key under which the hash of the node is memoized, or ``None`` if it should not be memoized.
+
+        The key includes the profile, since the same node can be loaded from different profiles in one interpreter, and
+        the version of the package of the node class, since that is part of the hash.
+        """
+        if not self._is_hash_immutable():
+            return None
+
+        try:
+            version = self._get_package_version()
+        except exceptions.HashingError:
+            return None
+
+        return (self._node.backend.profile.name, self._node.uuid, self._node.__module__, version)
+
+    def _forget_hash(self) -> None:
+        """Remove the memoized hash of the node, if any."""
+        memo_key = self._get_memo_key()
+
+        if memo_key is not None:
+            _MEMOIZED_HASHES.pop(memo_key, None)
+
+    def _get_package_version(self) -> str:
+        """Return the version of the top-level package of the module of the node class.
+
+        :raises `~aiida.common.exceptions.HashingError`: if the version cannot be determined.
+        """
         top_level_module = self._node.__module__.split('.', 1)[0]
         try:
-            version = importlib.import_module(top_level_module).__version__
+            return importlib.import_module(top_level_module).__version__
         except (ImportError, AttributeError) as exc:
             raise exceptions.HashingError("The node's package version could not be determined") from exc
+
+    def _is_hash_immutable(self) -> bool:
+        """Return whether the hash of the node can no longer change.
+
+        This is the case for stored nodes, since their attributes and repository content can no longer be modified,
+        except for the updatable attributes which are not included in the hash. Subclasses whose hash includes data
+        that can still change after storing should override this method.
+        """
+        return self._node.is_stored
+
+    def _get_objects_to_hash(self) -> list[t.Any]:
+        """Return a list of objects which should be included in the hash."""
         objects = [
-            version,
+            self._get_package_version(),
             {
                 key: val
                 for key, val in self._node.base.attributes.items()
@@ -71,10 +128,12 @@ class NodeCaching:
 
     def rehash(self) -> None:
         """Regenerate the stored hash of the Node."""
+        self._forget_hash()
         self._node.base.extras.set(self._HASH_EXTRA_KEY, self.get_hash())
 
     def clear_hash(self) -> None:
         """Sets the stored hash of the Node to None."""
+        self._forget_hash()
         self._node.base.extras.set(self._HASH_EXTRA_KEY, None)
 
     def get_cache_source(self) -> str | None:
@@ -134,13 +193,76 @@ class NodeCaching:
         if not node_hash or not self._node._cachable:  # pylint: disable=protected-access
             return iter(())
 
-        builder = QueryBuilder(backend=self._node.backend)
-        builder.append(self._node.__class__, filters={f'extras.{self._HASH_EXTRA_KEY}': node_hash}, subclassing=False)
+        builder = self._get_same_nodes_builder([node_hash])
 
         return (
-            node for node in builder.all(flat=True) if node.base.caching.is_valid_cache
+            node for node, _ in builder.all() if node.base.caching.is_valid_cache
         )  # type: ignore[misc,union-attr]
 
+    def _get_same_nodes_builder(self, hashes: t.Sequence[str]) -> QueryBuilder:
+        """Return a query for the stored nodes of the same class as this node, with one of the given hashes.
+
+        The query excludes the nodes that are not a valid cache according to ``_get_valid_cache_filters``, but the
+        returned nodes should still be checked with ``is_valid_cache``, which can impose additional restrictions.
+
+        :param hashes: the hashes to match.
+        :return: a query that projects the node and the value of its hash extra.
+        """
+        filters = {f'extras.{self._HASH_EXTRA_KEY}': {'in': list(hashes)}, **self._get_valid_cache_filters()}
+        builder = QueryBuilder(backend=self._node.backend)
+        builder.append(
+            self._node.__class__, filters=filters, subclassing=False, project=['*', f'extras.{self._HASH_EXTRA_KEY}']
+        )
+        return builder
+
+    def _get_valid_cache_filters(self) -> dict[str, t.Any]:
+        """Return the ``QueryBuilder`` filters that select the nodes that may be a valid cache.
+
+        These filters implement the part of the ``is_valid_cache`` logic that can be evaluated by the database, such
+        that nodes that are not a valid cache do not have to be loaded. Subclasses that override ``is_valid_cache``
+        can extend these filters accordingly.
+        """
+        return {f'extras.{self._VALID_CACHE_KEY}': {'!==': False}}
+
+    @staticmethod
+    def get_same_nodes(nodes: t.Sequence['Node']) -> list['Node' | None]:
+        """Return for each of the given nodes a stored node from which it can be cached, or ``None`` if there is none.
+
+        This is equivalent to calling ``_get_same_node`` for each node, but the nodes of the same class are looked up
+        with a single query per batch of ``db.batch_size`` hashes, instead of with one query per node.
+
+        :param nodes: the nodes to look up, which should be stored or have had their attributes cleaned.
+        :return: list with for each node a stored node with the same hash that is a valid cache, or ``None``.
+        """
+        from aiida.manage import get_config_option
+
+        same_nodes: list['Node' | None] = [None] * len(nodes)
+        indices_per_class: dict[type, dict[str, list[int]]] = {}
+
+        for index, node in enumerate(nodes):
+            node_hash = node.base.caching._get_hash()  # pylint: disable=protected-access
+            if node_hash and node._cachable:  # pylint: disable=protected-access
+                indices_per_class.setdefault(node.__class__, {}).setdefault(node_hash, []).append(index)
+
+        batch_size = get_config_option('db.batch_size')
+
+        for indices_per_hash in indices_per_class.values():
+            hashes = list(indices_per_hash)
+            caching = nodes[indices_per_hash[hashes[0]][0]].base.caching
+
+            for offset in range(0, len(hashes), batch_size):
+                batch = hashes[offset:offset + batch_size]
+
+                builder = caching._get_same_nodes_builder(batch)  # pylint: disable=protected-access
+
+                for same_node, node_hash in builder.all():
+                    indices = indices_per_hash.get(node_hash, None)
+                    if indices and same_node.base.caching.is_valid_cache:
+                        for index in indices_per_hash.pop(node_hash):
+                            same_nodes[index] = same_node
+
+        return same_nodes
+
     @property
     def is_valid_cache(self) -> bool:
         """Hook to exclude certain ``Node`` classes from being considered a valid cache.
@@ -10,11 +10,125 @@
 """
 AiiDA ORM data class storing (numpy) arrays
 """
+import collections
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
 from ..data import Data
 
+if TYPE_CHECKING:
+    import numpy
+
 __all__ = ('ArrayData',)
 
 
+class ArrayCache:
+    """Process-wide in-memory cache of the arrays of stored ``ArrayData`` nodes.
+
+    The cache is bounded by the total size in bytes of the arrays it contains. When adding an array would exceed the
+    maximum size, the least recently used arrays are evicted. Arrays that are larger than the maximum size by themselves
+    are not cached at all. Unless specified explicitly, the maximum size is taken from the ``storage.array_cache_size``
+    configuration option.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        """Construct a new cache.
+
+        :param maxsize: the maximum total size in bytes of the cached arrays.
+        """
+        self._maxsize = maxsize
+        self._arrays: 'collections.OrderedDict[Tuple[str, str], numpy.ndarray]' = collections.OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        """Return the maximum total size in bytes of the cached arrays."""
+        if self._maxsize is None:
+            from aiida.manage import get_config_option
+            self._maxsize = get_config_option('storage.array_cache_size')
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        """Set the maximum total size in bytes of the cached arrays, evicting arrays if necessary."""
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._arrays
+
+    def get(self, key: Tuple[str, str]) -> Optional['numpy.ndarray']:
+        """Return the cached array for the given key and mark it as most recently used.
+
+        :param key: tuple of the UUID of the node and the name of the array.
+        :return: the array or ``None`` if it is not cached.
+        """
+        with self._lock:
+            try:
+                self._arrays.move_to_end(key)
+            except KeyError:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return self._arrays[key]
+
+    def put(self, key: Tuple[str, str], array: 'numpy.ndarray') -> None:
+        """Add an array to the cache, evicting the least recently used arrays if the maximum size is exceeded.
+
+        :param key: tuple of the UUID of the node and the name of the array.
+        :param array: the array.
+        """
+        with self._lock:
+            if array.nbytes > self.maxsize:
+                return
+
+            if key in self._arrays:
+                self._size -= self._arrays.pop(key).nbytes
+
+            self._arrays[key] = array
+            self._size += array.nbytes
+            self._evict()
+
+    def clear(self, uuid: Optional[str] = None) -> None:
+        """Remove the arrays of the node with the given UUID from the cache, or all arrays if no UUID is specified.
+
+        :param uuid: the UUID of the node.
+        """
+        with self._lock:
+            for key in [key for key in self._arrays if uuid is None or key[0] == uuid]:
+                self._size -= self._arrays.pop(key).nbytes
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return the statistics of this cache.
+
+        :return: dictionary with the number of hits, misses and evictions, the number of cached arrays, and their total
+            size and maximum total size in bytes.
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'count': len(self._arrays),
+            'size': self._size,
+            'maxsize': self.maxsize,
+        }
+
+    def _evict(self) -> None:
+        """Evict the least recently used arrays until the total size no longer exceeds the maximum size."""
+        while self._arrays and self._size > self.maxsize:
+            _, array = self._arrays.popitem(last=False)
+            self._size -= array.nbytes
+            self._evictions += 1
+
+
+ARRAY_CACHE = ArrayCache()
+
+
 class ArrayData(Data):
     """
     Store a set of arrays on disk (rather than on the database) in an efficient
@@ -27,16 +141,13 @@ class ArrayData(Data):
       :py:meth:`.get_array` call, the array will be re-read from disk.
       If instead the ArrayData node has already been stored,
       the array is cached in memory after the first read, and the cached array
-      is used thereafter.
-      If too much RAM memory is used, you can clear the
-      cache with the :py:meth:`.clear_internal_cache` method.
+      is used thereafter. The cache is shared by all nodes and its total size
+      is limited by the ``storage.array_cache_size`` configuration option,
+      evicting the least recently used arrays first.
+      To remove the arrays of a node from the cache, use the
+      :py:meth:`.clear_internal_cache` method.
     """
     array_prefix = 'array|'
-    _cached_arrays = None
-
-    def initialize(self):
-        super().initialize()
-        self._cached_arrays = {}
 
     def delete_array(self, name):
         """
@@ -122,20 +233,49 @@ class ArrayData(Data):
         if not self.is_stored:
             return get_array_from_file(self, name)
 
-        if name not in self._cached_arrays:
-            self._cached_arrays[name] = get_array_from_file(self, name)
+        array = ARRAY_CACHE.get((self.uuid, name))
+
+        if array is None:
+            array = get_array_from_file(self, name)
+            ARRAY_CACHE.put((self.uuid, name), array)
 
-        return self._cached_arrays[name]
+        return array
+
+    def get_array_slice(self, name, index):
+        """
+        Return part of an array stored in the node, indexed along its first axis.
+
+        This is equivalent to ``get_array(name)[index]``, but if the array is not already cached in memory, only the
+        bytes of the requested elements are read from the repository and the array is not cached. This allows to access
+        single steps of large arrays, such as the positions of a long trajectory, without loading the entire array.
+
+        :param name: The name of the array.
+        :param index: An integer or a slice that indexes the first axis of the array.
+        :raises KeyError: if the array does not exist.
+        :raises IndexError: if the integer index is out of range.
+        """
+        if self.is_stored and (self.uuid, name) in ARRAY_CACHE:
+            array = ARRAY_CACHE.get((self.uuid, name))
+            if array is not None:
+                return array[index]
+
+        filename = f'{name}.npy'
+
+        if filename not in self.base.repository.list_object_names():
+            raise KeyError(f'Array with name `{name}` not found in ArrayData<{self.pk}>')
+
+        with self.base.repository.open(filename, mode='rb') as handle:
+            return _read_array_slice(handle, index)
 
     def clear_internal_cache(self):
         """
-        Clear the internal memory cache where the arrays are stored after being
-        read from disk (used in order to reduce at minimum the readings from
-        disk).
+        Remove the arrays of this node from the memory cache where the arrays
+        are stored after being read from disk (used in order to reduce at
+        minimum the readings from disk).
         This function is useful if you want to keep the node in memory, but you
         do not want to waste memory to cache the arrays in RAM.
         """
-        self._cached_arrays = {}
+        ARRAY_CACHE.clear(self.uuid)
 
     def set_array(self, name, array):
         """
@@ -226,6 +366,55 @@ class ArrayData(Data):
         return json.dumps(json_dict).encode('utf-8'), {}
 
 
+def _read_array_slice(handle, index):
+    """Read part of an array, indexed along its first axis, from a handle to a ``.npy`` stream.
+
+    For arrays that are stored in C order, only the header and the bytes of the selected elements are read, by seeking
+    the stream to their offset. Otherwise, the entire array is loaded before it is indexed.
+
+    :param handle: a seekable handle to the stream in binary mode.
+    :param index: an integer or a slice that indexes the first axis of the array.
+    :return: the selected part of the array.
+    """
+    import numpy
+    from numpy.lib import format as npy_format
+
+    version = npy_format.read_magic(handle)
+
+    if version == (1, 0):
+        shape, fortran_order, dtype = npy_format.read_array_header_1_0(handle)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = npy_format.read_array_header_2_0(handle)
+    else:
+        shape, fortran_order, dtype = None, True, None
+
+    if fortran_order or not shape or dtype.hasobject:
+        handle.seek(0)
+        return numpy.load(handle, allow_pickle=False)[index]  # pylint: disable=unexpected-keyword-arg
+
+    # This raises an ``IndexError`` for an integer index out of range, just as indexing the array would
+    selection = range(shape[0])[index]
+    item_shape = shape[1:]
+    item_size = dtype.itemsize * int(numpy.prod(item_shape, dtype=numpy.int64))
+    offset = handle.tell()
+
+    if isinstance(selection, int):
+        handle.seek(offset + selection * item_size)
+        # Indexing with an empty tuple turns the array into a scalar if it has zero dimensions, like indexing would
+        return numpy.frombuffer(bytearray(handle.read(item_size)), dtype=dtype).reshape(item_shape)[()]
+
+    if not selection:
+        return numpy.empty((0,) + item_shape, dtype=dtype)
+
+    # Read the contiguous block of items that spans the selection and apply the step of the slice to it
+    first, last = sorted((selection[0], selection[-1]))
+    handle.seek(offset + first * item_size)
+    block = numpy.frombuffer(bytearray(handle.read((last - first + 1) * item_size)), dtype=dtype)
+    block = block.reshape((last - first + 1,) + item_shape)
+
+    return block[selection[0] - first::selection.step]
+
+
 def clean_array(array):
     """
     Replacing np.nan and np.inf/-np.inf for Nones.
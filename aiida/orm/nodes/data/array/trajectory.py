@@ -342,18 +342,19 @@ class TrajectoryData(ArrayData):
         if index >= self.numsteps:
             raise IndexError(f'You have only {self.numsteps} steps, but you are looking beyond (index={index})')
 
-        vel = self.get_velocities()
-        if vel is not None:
-            vel = vel[index, :, :]
-        time = self.get_times()
-        if time is not None:
-            time = time[index]
-        cells = self.get_cells()
-        if cells is not None:
-            cell = cells[index, :, :]
-        else:
-            cell = None
-        return (self.get_stepids()[index], time, cell, self.symbols, self.get_positions()[index, :, :], vel)
+        def get_optional_step_array(name):
+            """Return the given step of an optional array, reading only that step, or ``None`` if it is not set."""
+            try:
+                return self.get_array_slice(name, index)
+            except (AttributeError, KeyError):
+                return None
+
+        vel = get_optional_step_array('velocities')
+        time = get_optional_step_array('times')
+        cell = get_optional_step_array('cells')
+        positions = self.get_array_slice('positions', index)
+
+        return (self.get_array_slice('steps', index), time, cell, self.symbols, positions, vel)
 
     def get_step_structure(self, index, custom_kinds=None):
         """
@@ -79,17 +79,33 @@ class NodeLinks:
         """
         from aiida.orm.utils.links import validate_link
 
-        from .node import Node  # pylint: disable=redefined-outer-name
-
         validate_link(source, self._node, link_type, link_label, backend=self._node.backend)
 
         # Check if the proposed link would introduce a cycle in the graph following ancestor/descendant rules
         if link_type in [LinkType.CREATE, LinkType.INPUT_CALC, LinkType.INPUT_WORK]:
-            builder = QueryBuilder(backend=self._node.backend).append(
-                Node, filters={'id': self._node.pk}, tag='parent').append(
-                Node, filters={'id': source.pk}, tag='child', with_ancestors='parent')  # yapf:disable
-            if builder.count() > 0:
-                raise ValueError('the link you are attempting to create would generate a cycle in the graph')
+            self.validate_acyclic(source)
+
+    def validate_acyclic(self, source: 'Node') -> None:
+        """Validate that linking the given source node to ourself would not introduce a cycle in the graph.
+
+        No query is needed at all if this node is not yet stored, since it cannot have any descendants yet, which is
+        always the case for the input links of a process node and for the links that are stored together with this
+        node, or if the source is not stored, since only stored nodes can be returned as descendants.
+
+        :param source: the node from which the link would be coming
+        :raise ValueError: if the proposed link would generate a cycle in the graph
+        """
+        from .node import Node  # pylint: disable=redefined-outer-name
+
+        if not self._node.is_stored or not source.is_stored:
+            return
+
+        builder = QueryBuilder(backend=self._node.backend).append(
+            Node, filters={'id': self._node.pk}, tag='parent').append(
+            Node, filters={'id': source.pk}, tag='child', with_ancestors='parent')  # yapf:disable
+
+        if builder.count() > 0:
+            raise ValueError('the link you are attempting to create would generate a cycle in the graph')
 
     def validate_outgoing(self, target: 'Node', link_type: LinkType, link_label: str) -> None:  # pylint: disable=unused-argument
         """Validate adding a link of the given type from ourself to a given node.
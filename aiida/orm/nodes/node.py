@@ -421,9 +421,20 @@ class Node(Entity['BackendNode', NodeCollection], metaclass=AbstractNodeMeta):
         for link_triple in self.base.links.incoming_cache:
             link_triple.node._verify_are_parents_stored()  # pylint: disable=protected-access
 
+        # pylint: disable=protected-access
+        sources: dict[int, 'Node'] = {}
+
         for link_triple in self.base.links.incoming_cache:
             if not link_triple.node.is_stored:
-                link_triple.node.store(with_transaction=with_transaction)
+                sources.setdefault(id(link_triple.node), link_triple.node)
+
+        # The nodes from which the unstored sources can be cached are looked up with one query per node class, instead
+        # of with one query per node, which matters when storing the many inputs of a process that is being submitted.
+        cachable = [source for source in sources.values() if source._validate_before_store()]
+        same_nodes = dict(zip(map(id, cachable), NodeCaching.get_same_nodes(cachable)))
+
+        for key, source in sources.items():
+            source._store_validated(same_nodes.get(key, None), with_transaction=with_transaction)
 
         return self.store(with_transaction)
 
@@ -438,37 +449,53 @@ class Node(Entity['BackendNode', NodeCollection], metaclass=AbstractNodeMeta):
 
         :parameter with_transaction: if False, do not use a transaction because the caller will already have opened one.
         """
-        from aiida.manage.caching import get_use_cache
-
         if not self.is_stored:
+            use_cache = self._validate_before_store()
 
-            # Call `_validate_storability` directly and not in `_validate` in case sub class forgets to call the super.
-            self._validate_storability()
-            self._validate()
+            # Retrieve the cached node.
+            same_node = self.base.caching._get_same_node() if use_cache else None  # pylint: disable=protected-access
 
-            # Verify that parents are already stored. Raises if this is not the case.
-            self._verify_are_parents_stored()
+            self._store_validated(same_node, with_transaction=with_transaction)
 
-            # Determine whether the cache should be used for the process type of this node.
-            use_cache = get_use_cache(identifier=self.process_type)
+        return self
 
-            # Clean the values on the backend node *before* computing the hash in `_get_same_node`. This will allow
-            # us to set `clean=False` if we are storing normally, since the values will already have been cleaned
-            self._backend_entity.clean_values()
+    def _validate_before_store(self) -> bool:
+        """Validate this unstored node and clean its values, such that its hash can be computed before it is stored.
 
-            # Retrieve the cached node.
-            same_node = self.base.caching._get_same_node() if use_cache else None  # pylint: disable=protected-access
+        :return: whether the cache should be used to store this node.
+        """
+        from aiida.manage.caching import get_use_cache
 
-            if same_node is not None:
-                self._store_from_cache(same_node, with_transaction=with_transaction)
-            else:
-                self._store(with_transaction=with_transaction, clean=True)
+        # Call `_validate_storability` directly and not in `_validate` in case sub class forgets to call the super.
+        self._validate_storability()
+        self._validate()
 
-            if self.backend.autogroup.is_to_be_grouped(self):
-                group = self.backend.autogroup.get_or_create_group()
-                group.add_nodes(self)
+        # Verify that parents are already stored. Raises if this is not the case.
+        self._verify_are_parents_stored()
 
-        return self
+        # Determine whether the cache should be used for the process type of this node.
+        use_cache = get_use_cache(identifier=self.process_type)
+
+        # Clean the values on the backend node *before* computing the hash in `_get_same_node`. This will allow
+        # us to set `clean=False` if we are storing normally, since the values will already have been cleaned
+        self._backend_entity.clean_values()
+
+        return use_cache
+
+    def _store_validated(self, same_node: Optional['Node'], with_transaction: bool = True) -> None:
+        """Store this node after it was validated by ``_validate_before_store``.
+
+        :param same_node: the stored node from which to cache this node, or ``None`` to store it normally.
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        """
+        if same_node is not None:
+            self._store_from_cache(same_node, with_transaction=with_transaction)
+        else:
+            self._store(with_transaction=with_transaction, clean=True)
+
+        if self.backend.autogroup.is_to_be_grouped(self):
+            group = self.backend.autogroup.get_or_create_group()
+            group.add_nodes(self)
 
     def _store(self, with_transaction: bool = True, clean: bool = True) -> 'Node':
         """Store the node in the database while saving its attributes and repository directory.
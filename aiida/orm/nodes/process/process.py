@@ -8,6 +8,7 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Module with `Node` sub class for processes."""
+import contextlib
 import enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
@@ -67,6 +68,22 @@ class ProcessNodeCaching(NodeCaching):
         """
         super(ProcessNodeCaching, self.__class__).is_valid_cache.fset(self, valid)
 
+    def _is_hash_immutable(self) -> bool:
+        """Return whether the hash of the node can no longer change.
+
+        Input links can be added to a stored process node until it is sealed, so only then is its hash immutable.
+        """
+        return super()._is_hash_immutable() and self._node.is_sealed
+
+    def _get_valid_cache_filters(self) -> Dict[str, Any]:
+        """Return the ``QueryBuilder`` filters that select the nodes that may be a valid cache.
+
+        In addition to the filters of the base class, only nodes of processes that are finished are selected.
+        """
+        filters = super()._get_valid_cache_filters()
+        filters[f'attributes.{self._node.PROCESS_STATE_KEY}'] = ProcessState.FINISHED.value
+        return filters
+
     def _get_objects_to_hash(self) -> List[Any]:
         """
         Return a list of objects which should be included in the hash.
@@ -497,20 +514,45 @@ class ProcessNode(Sealable, Node):
 
         :returns: checkpoint bundle if it exists, None otherwise
         """
-        return self.base.attributes.get(self.CHECKPOINT_KEY, None)
+        checkpoint = None
+
+        if self.is_stored:
+            with contextlib.suppress(NotImplementedError):
+                checkpoint = self.backend.get_process_checkpoint(self.pk)
+
+        if checkpoint is None:
+            checkpoint = self.base.attributes.get(self.CHECKPOINT_KEY, None)
+
+        return checkpoint
 
     def set_checkpoint(self, checkpoint: str) -> None:
         """
         Set the checkpoint bundle set for the process
 
+        The checkpoint of a stored node is written to the checkpoint store of the storage backend, such that it is not
+        loaded with the attributes of the node. If the storage has no such store, or the node is not yet stored, the
+        checkpoint is stored as an attribute instead.
+
         :param state: string representation of the stepper state info
         """
+        if self.is_stored:
+            self._check_mutability_attributes([self.CHECKPOINT_KEY])
+            try:
+                return self.backend.set_process_checkpoint(self.pk, checkpoint)
+            except NotImplementedError:
+                pass
+
         return self.base.attributes.set(self.CHECKPOINT_KEY, checkpoint)
 
     def delete_checkpoint(self) -> None:
         """
         Delete the checkpoint bundle set for the process
         """
+        if self.is_stored:
+            self._check_mutability_attributes([self.CHECKPOINT_KEY])
+            with contextlib.suppress(NotImplementedError):
+                self.backend.delete_process_checkpoint(self.pk)
+
         try:
             self.base.attributes.delete(self.CHECKPOINT_KEY)
         except AttributeError:
@@ -271,6 +271,35 @@ class NodeRepository:
         self._repository.put_object_from_tree(filepath, path)
         self._update_repository_metadata()
 
+    def put_objects_from_serialized(self, serialized: Dict[str, Any]) -> None:
+        """Set the content of the repository from serialized metadata of objects already written to the profile.
+
+        The objects referenced by the keys in the metadata should already exist in the repository backend of the storage
+        of the node. Instead of being copied from a sandbox once the node is stored, they are then attached to the node
+        as is. This allows to write the content to the repository backend first, for example in another thread, and to
+        only add it to a node once all of it was written successfully. Objects that were written but are not attached to
+        any node are removed by the maintenance of the repository.
+
+        :param serialized: the serialized metadata as returned by :meth:`aiida.repository.Repository.serialize`.
+        :raises `~aiida.common.exceptions.ModificationNotAllowed`: when the node is stored and therefore immutable.
+        :raises ValueError: if the repository already contains objects.
+        :raises FileNotFoundError: if an object referenced by the metadata does not exist in the repository backend.
+        """
+        self._check_mutability()
+
+        if not self._repository.is_empty():
+            raise ValueError('the repository already contains objects.')
+
+        backend = self._node.backend.get_repository()
+        repository = Repository.from_serialized(backend=backend, serialized=serialized)
+        keys = repository.get_file_keys()
+        missing = [key for key, exists in zip(keys, backend.has_objects(keys)) if not exists]
+
+        if missing:
+            raise FileNotFoundError(f'objects with keys {missing} do not exist in the repository backend.')
+
+        self._repository = repository
+
     def walk(self, path: Optional[FilePath] = None) -> Iterable[Tuple[pathlib.PurePosixPath, List[str], List[str]]]:
         """Walk over the directories and files contained within this repository.
 
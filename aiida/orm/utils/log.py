@@ -9,6 +9,12 @@
 ###########################################################################
 """Module for logging methods/classes that need the ORM."""
 import logging
+import threading
+import traceback
+import weakref
+
+#: Registry of the buffered handlers that are alive, such that they can be flushed by :func:`flush_db_log_handlers`.
+_BUFFERED_HANDLERS: 'weakref.WeakSet[BufferedDBLogHandler]' = weakref.WeakSet()
 
 
 class DBLogHandler(logging.Handler):
@@ -34,11 +40,123 @@ class DBLogHandler(logging.Handler):
         except Exception:  # pylint: disable=broad-except
             # To avoid loops with the error handler, I just print.
             # Hopefully, though, this should not happen!
-            import traceback
             traceback.print_exc()
             raise
 
 
+class BufferedDBLogHandler(DBLogHandler):
+    """A db log handler that buffers records and writes them to the database in batches from a background thread.
+
+    Records are converted into rows for the ``Log`` table when they are emitted, but the rows are only inserted with
+    :meth:`~aiida.orm.implementation.storage_backend.StorageBackend.bulk_insert` once the buffer contains
+    ``flush_size`` rows or ``flush_interval`` seconds have passed, whichever comes first. This prevents the thread that
+    emits the record, for example the event loop of a daemon worker, from blocking on a database insert for every
+    record. The buffer can be flushed explicitly with :meth:`flush` and is always flushed when the handler is closed.
+    """
+
+    def __init__(self, level=logging.NOTSET, flush_size: int = 100, flush_interval: float = 1.0):
+        """Construct a new handler.
+
+        :param level: the log level of the handler.
+        :param flush_size: the number of buffered rows that triggers a flush.
+        :param flush_interval: the maximum time in seconds that rows are kept in the buffer.
+        """
+        super().__init__(level)
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._buffer: list = []
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='aiida-db-log-flusher', daemon=True)
+        self._thread.start()
+        _BUFFERED_HANDLERS.add(self)
+
+    def emit(self, record):
+        from aiida.common.utils import get_new_uuid
+        from aiida.orm.logs import LogCollection
+
+        if record.exc_info:
+            self.format(record)
+
+        try:
+            backend = record.__dict__.pop('backend')
+        except KeyError:
+            # The backend should be set. We silently absorb this error
+            return
+
+        fields = LogCollection.get_fields_from_record(record)
+
+        if fields is None:
+            return
+
+        fields['uuid'] = get_new_uuid()
+
+        with self._buffer_lock:
+            self._buffer.append((backend, fields))
+            size = len(self._buffer)
+
+        if size >= self._flush_size:
+            self._flush_requested.set()
+
+    def flush(self):
+        """Write all buffered rows to the database."""
+        with self._flush_lock:
+            with self._buffer_lock:
+                buffer, self._buffer = self._buffer, []
+
+            rows_per_backend: dict = {}
+
+            for backend, fields in buffer:
+                rows_per_backend.setdefault(backend, []).append(fields)
+
+            for backend, rows in rows_per_backend.items():
+                self._insert_rows(backend, rows)
+
+    def close(self):
+        """Stop the background thread and flush the remaining buffered rows."""
+        if not self._closed:
+            self._closed = True
+            self._flush_requested.set()
+            self._thread.join()
+            self.flush()
+            _BUFFERED_HANDLERS.discard(self)
+        super().close()
+
+    def _run(self):
+        """Flush the buffer periodically or when requested until the handler is closed."""
+        while not self._closed:
+            self._flush_requested.wait(self._flush_interval)
+            self._flush_requested.clear()
+            self.flush()
+
+    @staticmethod
+    def _insert_rows(backend, rows):
+        """Insert the rows into the ``Log`` table of the given backend.
+
+        If the bulk insert fails, for example because one of the nodes was deleted in the meantime, the rows are
+        inserted one by one such that only the offending rows are lost.
+        """
+        from aiida.orm.entities import EntityTypes
+
+        try:
+            backend.bulk_insert(EntityTypes.LOG, [dict(row) for row in rows])
+        except Exception:  # pylint: disable=broad-except
+            for row in rows:
+                try:
+                    backend.bulk_insert(EntityTypes.LOG, [dict(row)])
+                except Exception:  # pylint: disable=broad-except
+                    # To avoid loops with the error handler, I just print.
+                    traceback.print_exc()
+
+
+def flush_db_log_handlers():
+    """Flush all buffered db log handlers such that all records emitted so far are written to the database."""
+    for handler in list(_BUFFERED_HANDLERS):
+        handler.flush()
+
+
 def get_dblogger_extra(node):
     """Return the additional information necessary to attach any log records to the given node instance.
 
@@ -10,7 +10,7 @@ import contextlib
 import hashlib
 import io
 import pathlib
-from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from aiida.common.hashing import chunked_file_hash
 
@@ -83,6 +83,30 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
     def _put_object_from_filelike(self, handle: BinaryIO) -> str:
         pass
 
+    def put_objects_from_filelikes(self, handles: List[BinaryIO]) -> List[str]:
+        """Store the byte contents of multiple files in the repository.
+
+        :param handles: list of filelike objects with the byte content to be stored.
+        :return: list of the generated fully qualified identifiers for the objects within the repository, in the same
+            order as the handles that were provided.
+        :raises TypeError: if any of the handles is not a byte stream.
+        """
+        for handle in handles:
+            if not isinstance(handle, io.BufferedIOBase) and not self.is_readable_byte_stream(handle):
+                raise TypeError(f'handle does not seem to be a byte stream: {type(handle)}.')
+        return self._put_objects_from_filelikes(handles)
+
+    def _put_objects_from_filelikes(self, handles: List[BinaryIO]) -> List[str]:
+        """Store the byte contents of multiple files in the repository.
+
+        The default implementation simply stores the objects one by one. Backends that can ingest many objects more
+        efficiently in a single operation, for example concurrently, should override this method.
+
+        :param handles: list of filelike objects with the byte content to be stored.
+        :return: list of the generated fully qualified identifiers for the objects within the repository.
+        """
+        return [self._put_object_from_filelike(handle) for handle in handles]
+
     def put_object_from_file(self, filepath: Union[str, pathlib.Path]) -> str:
         """Store a new object with contents of the file located at `filepath` on this file system.
 
@@ -193,6 +217,19 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
         with self.open(key) as handle:  # pylint: disable=not-context-manager
             return chunked_file_hash(handle, hashlib.sha256)
 
+    def get_object_hashes(self, keys: List[str]) -> Dict[str, str]:
+        """Return the SHA-256 hashes of the objects stored under the given keys.
+
+        Implementations should override this method if they can determine the hashes without reading the content of
+        each object, for example because it is already addressed by its hash.
+
+        :param keys: fully qualified identifiers for the objects within the repository.
+        :return: a mapping of the keys onto the hashes of the corresponding objects.
+        :raise FileNotFoundError: if any of the files does not exist.
+        :raise OSError: if any of the files could not be opened.
+        """
+        return {key: self.get_object_hash(key) for key in keys}
+
     @abc.abstractmethod
     def delete_objects(self, keys: List[str]) -> None:
         """Delete the objects from the repository.
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Implementation of the ``AbstractRepositoryBackend`` using the ``disk-objectstore`` as the backend."""
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
+import os
 import shutil
 import typing as t
 
@@ -15,9 +17,23 @@ __all__ = ('DiskObjectStoreRepositoryBackend',)
 
 BYTES_TO_MB = 1 / 1024**2
 
+PACK_INGESTION_LOCK_FILENAME = 'aiida-pack-ingestion.lock'
+
 logger = STORAGE_LOGGER.getChild('disk_object_store')
 
 
+class _PackSizeTargetContainer(Container):
+    """Container that overrides the target size of pack files that is defined in the configuration of the container."""
+
+    def __init__(self, folder: str, pack_size_target: int):
+        super().__init__(folder)
+        self._pack_size_target = pack_size_target
+
+    @property
+    def pack_size_target(self) -> int:
+        return self._pack_size_target
+
+
 class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
     """Implementation of the ``AbstractRepositoryBackend`` using the ``disk-object-store`` as the backend.
 
@@ -30,9 +46,40 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
 
     """
 
-    def __init__(self, container: Container):
+    def __init__(
+        self,
+        container: Container,
+        max_workers: t.Optional[int] = None,
+        direct_to_pack: bool = False,
+        pack_size_target: t.Optional[int] = None,
+        pack_fsync: bool = True,
+    ):
+        """Construct a new instance.
+
+        By default, new objects are written as loose objects, which can later be packed by ``maintain``. When
+        ``direct_to_pack`` is enabled, new objects are instead streamed directly into pack files. Since the disk object
+        store only allows a single process to write to pack files at a time, the write falls back to loose objects if
+        another process is currently writing to the pack files of the container.
+
+        :param container: the container of the disk object store.
+        :param max_workers: the maximum number of threads used to write objects concurrently when storing multiple
+            loose objects at once through ``put_objects_from_filelikes``. By default, the default of
+            ``ThreadPoolExecutor`` is used.
+        :param direct_to_pack: write new objects directly to pack files instead of as loose objects.
+        :param pack_size_target: the target size in bytes of pack files that objects are written to directly. By
+            default, the target size defined in the configuration of the container is used.
+        :param pack_fsync: call ``fsync`` on the pack file after each batch of objects that is written directly to it.
+            Objects passed in a single call to ``put_objects_from_filelikes`` are synced to disk together.
+        """
         type_check(container, Container)
+        type_check(max_workers, int, allow_none=True)
+        type_check(pack_size_target, int, allow_none=True)
         self._container = container
+        self._max_workers = max_workers
+        self._direct_to_pack = direct_to_pack
+        self._pack_size_target = pack_size_target
+        self._pack_fsync = pack_fsync
+        self._pack_container: t.Optional[Container] = None
 
     def __str__(self) -> str:
         """Return the string representation of this repository."""
@@ -83,9 +130,107 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
         :return: the generated fully qualified identifier for the object within the repository.
         :raises TypeError: if the handle is not a byte stream.
         """
+        if self._direct_to_pack:
+            keys = self._put_objects_to_pack([handle])
+            if keys is not None:
+                return keys[0]
+
+        return self._put_loose_object(handle)
+
+    def _put_objects_from_filelikes(self, handles: t.List[t.BinaryIO]) -> t.List[str]:
+        """Store the byte contents of multiple files in the repository.
+
+        If ``direct_to_pack`` is enabled, the objects are streamed into pack files in a single operation. Otherwise,
+        the objects are written as loose objects by a pool of threads. Since the content is hashed while it is being
+        written, this also distributes the hashing over the threads. Writing loose objects concurrently is safe, since
+        the disk object store moves each completed object atomically into place.
+
+        :param handles: list of filelike objects with the byte content to be stored.
+        :return: list of the generated fully qualified identifiers for the objects within the repository.
+        """
+        if self._direct_to_pack and handles:
+            keys = self._put_objects_to_pack(handles)
+            if keys is not None:
+                return keys
+
+        if len(handles) < 2:
+            return [self._put_loose_object(handle) for handle in handles]
+
+        with self._container as container:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                return list(executor.map(container.add_streamed_object, handles))
+
+    def _put_loose_object(self, handle: t.BinaryIO) -> str:
+        """Store the byte contents of a file as a loose object.
+
+        :param handle: filelike object with the byte content to be stored.
+        :return: the generated fully qualified identifier for the object within the repository.
+        """
         with self._container as container:
             return container.add_streamed_object(handle)
 
+    def _put_objects_to_pack(self, handles: t.List[t.BinaryIO]) -> t.Optional[t.List[str]]:
+        """Store the byte contents of files directly in pack files.
+
+        :param handles: list of filelike objects with the byte content to be stored.
+        :return: list of the generated fully qualified identifiers for the objects within the repository, or ``None`` if
+            the pack files are currently being written to by another process, in which case nothing was written.
+        """
+        with self._pack_ingestion_lock() as acquired:
+            if not acquired:
+                logger.debug('pack files are locked by another process: writing objects as loose objects instead.')
+                return None
+
+            with self._get_pack_container() as container:
+                return container.add_streamed_objects_to_pack(handles, do_fsync=self._pack_fsync)
+
+    def _get_pack_container(self) -> Container:
+        """Return the container to use for writing objects directly to pack files.
+
+        If a ``pack_size_target`` was specified, this is a separate container instance for the same folder which
+        overrides the target size of the pack files, otherwise it is the container of this backend.
+        """
+        if self._pack_size_target is None:
+            return self._container
+
+        if self._pack_container is None:
+            self._pack_container = _PackSizeTargetContainer(self._container.get_folder(), self._pack_size_target)
+
+        return self._pack_container
+
+    @contextlib.contextmanager
+    def _pack_ingestion_lock(self, blocking: bool = False) -> t.Iterator[bool]:
+        """Acquire the lock to write objects to the pack files of the container.
+
+        The disk object store requires that only a single process writes to pack files at any one time. The lock is an
+        advisory lock on a file in the container folder, such that it is respected by all processes, for example all
+        daemon workers and the maintenance operations, that use the same container.
+
+        :param blocking: whether to wait until the lock is released by another process, instead of returning directly.
+        :return: yield whether the lock was acquired, which is always the case if ``blocking`` is ``True``.
+        """
+        try:
+            import fcntl
+        except ImportError:
+            # Without advisory file locks other processes cannot be excluded, so objects are never written directly to
+            # pack files. The maintenance operations are still performed, as they were before the lock was introduced.
+            yield blocking
+            return
+
+        filepath = os.path.join(self._container.get_folder(), PACK_INGESTION_LOCK_FILENAME)
+
+        with open(filepath, 'a', encoding='utf8') as handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
     def has_objects(self, keys: t.List[str]) -> t.List[bool]:
         with self._container as container:
             return container.has_objects(keys)
@@ -141,6 +286,23 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
                 return super().get_object_hash(key)
         return key
 
+    def get_object_hashes(self, keys: t.List[str]) -> t.Dict[str, str]:
+        """Return the SHA-256 hashes of the objects stored under the given keys.
+
+        If the container uses SHA-256 as its hash type, the keys are the hashes, and the objects are not read.
+
+        :param keys: fully qualified identifiers for the objects within the repository.
+        :return: a mapping of the keys onto the hashes of the corresponding objects.
+        :raise FileNotFoundError: if any of the files does not exist.
+        """
+        missing = [key for key, exists in zip(keys, self.has_objects(keys)) if not exists]
+        if missing:
+            raise FileNotFoundError(missing[0])
+        with self._container as container:
+            if container.hash_type != 'sha256':
+                return super().get_object_hashes(keys)
+        return {key: key for key in keys}
+
     def maintain( # type: ignore[override] # pylint: disable=arguments-differ,too-many-branches
         self,
         dry_run: bool = False,
@@ -183,14 +345,16 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
                 files_size = container.get_total_size()['total_size_loose'] * BYTES_TO_MB
                 logger.report(f'Packing all loose files ({files_numb} files occupying {files_size} MB) ...')
                 if not dry_run:
-                    container.pack_all_loose(compress=compress)
+                    with self._pack_ingestion_lock(blocking=True):
+                        container.pack_all_loose(compress=compress)
 
             if do_repack:
                 files_numb = container.count_objects()['packed']
                 files_size = container.get_total_size()['total_size_packfiles_on_disk'] * BYTES_TO_MB
                 logger.report(f'Re-packing all pack files ({files_numb} files in packs, occupying {files_size} MB) ...')
                 if not dry_run:
-                    container.repack()
+                    with self._pack_ingestion_lock(blocking=True):
+                        container.repack()
 
             if clean_storage:
                 logger.report(f'Cleaning the repository database (with `vacuum={do_vacuum}`) ...')
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import os
 import shutil
 import typing as t
@@ -25,6 +26,7 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
         """
         self._sandbox: SandboxFolder | None = None
         self._filepath: str | None = filepath
+        self._object_hashes: dict[str, str] = {}
 
     def __str__(self) -> str:
         """Return the string representation of this repository."""
@@ -78,6 +80,7 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
                 pass
             finally:
                 self._sandbox = None
+                self._object_hashes = {}
 
     def _put_object_from_filelike(self, handle: t.BinaryIO) -> str:
         """Store the byte contents of a file in the repository.
@@ -88,9 +91,15 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
         """
         key = str(uuid.uuid4())
         filepath = os.path.join(self.sandbox.abspath, key)
+        hasher = hashlib.sha256()
 
+        # The hash is computed while the content is written, such that ``get_object_hash`` does not have to read it
         with open(filepath, 'wb') as target:
-            shutil.copyfileobj(handle, target)
+            for chunk in iter(lambda: handle.read(shutil.COPY_BUFSIZE), b''):
+                hasher.update(chunk)
+                target.write(chunk)
+
+        self._object_hashes[key] = hasher.hexdigest()
 
         return key
 
@@ -113,10 +122,23 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
             with self.open(key) as handle:  # pylint: disable=not-context-manager
                 yield key, handle
 
+    def get_object_hash(self, key: str) -> str:
+        """Return the SHA-256 hash of an object stored under the given key.
+
+        The hash is computed when the object is stored, so the content of the object is not read again.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :raise FileNotFoundError: if the file does not exist.
+        """
+        if key not in self._object_hashes:
+            return super().get_object_hash(key)
+        return self._object_hashes[key]
+
     def delete_objects(self, keys: list[str]) -> None:
         super().delete_objects(keys)
         for key in keys:
             os.remove(os.path.join(self.sandbox.abspath, key))
+            self._object_hashes.pop(key, None)
 
     def list_objects(self) -> t.Iterable[str]:
         return self.sandbox.get_content_list()
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 """Module for the implementation of a file repository."""
 import contextlib
+import functools
 import pathlib
-from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import Any, BinaryIO, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from aiida.common.hashing import make_hash
 from aiida.common.lang import type_check
@@ -13,6 +14,7 @@ from .common import File, FileType
 __all__ = ('Repository',)
 
 FilePath = Union[str, pathlib.PurePosixPath]
+ObjectOpener = Callable[[], ContextManager[BinaryIO]]
 
 
 class Repository:
@@ -33,6 +35,9 @@ class Repository:
 
     _file_cls = File
 
+    # Maximum number of files that are passed at once to the backend when storing the contents of a directory.
+    _put_object_batch_size = 256
+
     def __init__(self, backend: Optional[AbstractRepositoryBackend] = None):
         """Construct a new instance with empty metadata.
 
@@ -114,17 +119,26 @@ class Repository:
     def hash(self) -> str:
         """Generate a hash of the repository's contents.
 
-        .. warning:: this will read the content of all file objects contained within the virtual hierarchy into memory.
+        The hashes of the file objects are obtained from the backend with a single call to ``get_object_hashes``.
+
+        .. warning:: this will read the content of all file objects contained within the virtual hierarchy, unless the
+            backend can determine their hash without doing so, for example because it addresses objects by their hash.
 
         :return: the hash representing the contents of the repository.
         """
         objects: Dict[str, Any] = {}
+        keys: Dict[str, str] = {}
         for root, dirnames, filenames in self.walk():
             objects['__dirnames__'] = dirnames
             for filename in filenames:
                 key = self.get_file(root / filename).key
                 assert key is not None, 'Expected FileType.File to have a key'
-                objects[str(root / filename)] = self.backend.get_object_hash(key)
+                keys[str(root / filename)] = key
+
+        hashes = self.backend.get_object_hashes(list(set(keys.values())))
+
+        for path, key in keys.items():
+            objects[path] = hashes[key]
 
         return make_hash(objects)
 
@@ -348,6 +362,8 @@ class Repository:
         if path.parts:
             self.create_directory(path)
 
+        objects: List[Tuple[ObjectOpener, pathlib.PurePosixPath]] = []
+
         for root_str, dirnames, filenames in os.walk(filepath):
 
             root = pathlib.PurePosixPath(root_str)
@@ -356,7 +372,31 @@ class Repository:
                 self.create_directory(path / root.relative_to(filepath) / dirname)
 
             for filename in filenames:
-                self.put_object_from_file(root / filename, path / root.relative_to(filepath) / filename)
+                opener = functools.partial(open, root / filename, 'rb')
+                objects.append((opener, path / root.relative_to(filepath) / filename))
+
+        self._put_objects_from_openers(objects)
+
+    def _put_objects_from_openers(self, objects: List[Tuple[ObjectOpener, pathlib.PurePosixPath]]) -> None:
+        """Store multiple objects in the repository by passing them to the backend in batches.
+
+        The backend can ingest the objects of a batch in bulk, while the batches limit the number of file handles that
+        are open at the same time.
+
+        .. note:: this assumes the paths are valid relative paths, so should be checked by the caller.
+
+        :param objects: list of tuples of a callable, that returns a context manager yielding a byte stream with the
+            content of the object, and the relative path where to store the object in the repository.
+        """
+        for index in range(0, len(objects), self._put_object_batch_size):
+            batch = objects[index:index + self._put_object_batch_size]
+
+            with contextlib.ExitStack() as stack:
+                handles = [stack.enter_context(opener()) for opener, _ in batch]
+                keys = self.backend.put_objects_from_filelikes(handles)
+
+            for (_, path), key in zip(batch, keys):
+                self._insert_file(path, key)
 
     def is_empty(self) -> bool:
         """Return whether the repository is empty.
@@ -453,12 +493,15 @@ class Repository:
         if not isinstance(source, Repository):
             raise TypeError('source is not an instance of `Repository`.')
 
+        objects: List[Tuple[ObjectOpener, pathlib.PurePosixPath]] = []
+
         for root, dirnames, filenames in source.walk():
             for dirname in dirnames:
                 self.create_directory(root / dirname)
             for filename in filenames:
-                with source.open(root / filename) as handle:
-                    self.put_object_from_filelike(handle, root / filename)
+                objects.append((functools.partial(source.open, root / filename), root / filename))
+
+        self._put_objects_from_openers(objects)
 
     def walk(self, path: Optional[FilePath] = None) -> Iterable[Tuple[pathlib.PurePosixPath, List[str], List[str]]]:
         """Walk over the directories and files contained within this repository.
@@ -273,12 +273,12 @@ class DirectScheduler(aiida.schedulers.Scheduler):
 
         return job_list
 
-    def get_jobs(self, jobs=None, user=None, as_dict=False):
+    def get_jobs(self, jobs=None, user=None, as_dict=False, filter_jobs=None):
         """
         Overrides original method from DirectScheduler in order to list
         missing processes as DONE.
         """
-        job_stats = super().get_jobs(jobs=jobs, user=user, as_dict=as_dict)
+        job_stats = super().get_jobs(jobs=jobs, user=user, as_dict=as_dict, filter_jobs=filter_jobs)
 
         found_jobs = []
         # Get the list of known jobs
@@ -11,6 +11,7 @@
 Plugin for SLURM.
 This has been tested on SLURM 14.03.7 on the CSCS.ch machines.
 """
+import json
 import re
 
 from aiida.common.lang import type_check
@@ -53,6 +54,37 @@ _MAP_STATUS_SLURM = {
     'TO': JobState.DONE,
 }
 
+# The long names of the states, as reported in the JSON output of squeue
+_MAP_STATUS_SLURM_JSON = {
+    'BOOT_FAIL': JobState.DONE,
+    'CANCELLED': JobState.DONE,
+    'COMPLETED': JobState.DONE,
+    'COMPLETING': JobState.RUNNING,
+    'CONFIGURING': JobState.QUEUED,
+    'DEADLINE': JobState.DONE,
+    'FAILED': JobState.DONE,
+    'NODE_FAIL': JobState.DONE,
+    'OUT_OF_MEMORY': JobState.DONE,
+    'PENDING': JobState.QUEUED,
+    'PREEMPTED': JobState.DONE,
+    'RUNNING': JobState.RUNNING,
+    'SUSPENDED': JobState.SUSPENDED,
+    'TIMEOUT': JobState.DONE,
+}
+
+# Special values of numbers in the JSON output of squeue before SLURM 23.02
+_SLURM_INFINITE = 2**32 - 1
+_SLURM_NO_VAL = 2**32 - 2
+
+# Reasons for a pending job that mean that it is held (see _parse_joblist_output)
+_HELD_REASONS = ('Dependency', 'JobHeldUser', 'JobHeldAdmin', 'BeginTime')
+
+# Fields of the JSON output of squeue that are parsed
+_JSON_FIELDS = (
+    'job_id', 'job_state', 'state_reason', 'user_name', 'node_count', 'cpus', 'nodes', 'partition', 'time_limit',
+    'start_time', 'submit_time', 'name'
+)
+
 # From the manual,
 # possible lines are:
 # salloc: Granted job allocation 65537
@@ -102,6 +134,26 @@ _TIME_REGEXP = re.compile(
 _FIELD_SEPARATOR = '^^^'
 
 
+def _get_json_number(value):
+    """Return the integer of a number in the JSON output of squeue, or None if it is not set or infinite.
+
+    Since SLURM 23.02 numbers are reported as a dictionary with the keys `set`, `infinite` and `number`, before they
+    were plain integers with special values for infinite and unset numbers.
+    """
+    if isinstance(value, dict):
+        return value.get('number') if value.get('set') and not value.get('infinite') else None
+    if value in (_SLURM_INFINITE, _SLURM_NO_VAL):
+        return None
+    return value
+
+
+def _is_json_number_infinite(value):
+    """Return whether a number in the JSON output of squeue is infinite (e.g. an unlimited time limit)."""
+    if isinstance(value, dict):
+        return bool(value.get('infinite'))
+    return value == _SLURM_INFINITE
+
+
 class SlurmJobResource(NodeNumberJobResource):
     """Class for SLURM job resources."""
 
@@ -194,12 +246,16 @@ class SlurmScheduler(Scheduler):
         """
         from aiida.common.exceptions import FeatureNotAvailable
 
-        # I add the environment variable SLURM_TIME_FORMAT in front to be
-        # sure to get the times in 'standard' format
-        command = [
-            "SLURM_TIME_FORMAT='standard'", 'squeue', '--noheader',
-            f"-o '{_FIELD_SEPARATOR.join(_[0] for _ in self.fields)}'"
-        ]
+        if self._structured_output:
+            # Machine-readable output, that is available since SLURM 21.08
+            command = ['squeue', '--json']
+        else:
+            # I add the environment variable SLURM_TIME_FORMAT in front to be
+            # sure to get the times in 'standard' format
+            command = [
+                "SLURM_TIME_FORMAT='standard'", 'squeue', '--noheader',
+                f"-o '{_FIELD_SEPARATOR.join(_[0] for _ in self.fields)}'"
+            ]
 
         if user and jobs:
             raise FeatureNotAvailable('Cannot query by user and job(s) in SLURM')
@@ -457,7 +513,8 @@ class SlurmScheduler(Scheduler):
         command returned by _get_joblist_command command,
         that is here implemented as a list of lines, one for each
         job, with _field_separator as separator. The order is described
-        in the _get_joblist_command function.
+        in the _get_joblist_command function. The JSON output of
+        ``squeue --json`` is parsed as well.
 
         Return a list of JobInfo objects, one of each job,
         each relevant parameters implemented.
@@ -468,6 +525,21 @@ class SlurmScheduler(Scheduler):
             in the qstat output; missing jobs (for whatever reason) simply
             will not appear here.
         """
+        return self._parse_squeue_output(retval, stdout, stderr)
+
+    def _parse_joblist_output_filtered(self, retval, stdout, stderr, job_ids):
+        """
+        Parse the queue output string like _parse_joblist_output, but
+        skip the lines (or JSON entries) of all jobs other than the
+        ones in job_ids, before they are parsed.
+        """
+        return self._parse_squeue_output(retval, stdout, stderr, job_ids)
+
+    def _parse_squeue_output(self, retval, stdout, stderr, job_ids=None):
+        """
+        Parse the output of squeue, in either the text or the JSON format,
+        only keeping the jobs in job_ids, if specified.
+        """
         # pylint: disable=too-many-branches,too-many-statements
         num_fields = len(self.fields)
 
@@ -490,7 +562,16 @@ stderr='{stderr.strip()}'"""
         # the last field), I don't split the title.
         # This assumes that _field_separator never
         # appears in any previous field.
-        jobdata_raw = [l.split(_FIELD_SEPARATOR, num_fields) for l in stdout.splitlines() if _FIELD_SEPARATOR in l]
+        if stdout.lstrip().startswith('{'):
+            return self._parse_squeue_json_output(stdout, job_ids)
+
+        lines = [l for l in stdout.splitlines() if _FIELD_SEPARATOR in l]
+
+        # The job id is the first field: skip the other jobs before splitting the full lines
+        if job_ids is not None:
+            lines = [l for l in lines if l.split(_FIELD_SEPARATOR, 1)[0] in job_ids]
+
+        jobdata_raw = [l.split(_FIELD_SEPARATOR, num_fields) for l in lines]
 
         # Create dictionary and parse specific fields
         job_list = []
@@ -530,10 +611,7 @@ stderr='{stderr.strip()}'"""
             # There are actually a few others, like possible
             # failures, or partition-related reasons, but for the moment I
             # leave them in the QUEUED state.
-            if (
-                job_state_string == JobState.QUEUED and
-                this_job.annotation in ['Dependency', 'JobHeldUser', 'JobHeldAdmin', 'BeginTime']
-            ):
+            if job_state_string == JobState.QUEUED and this_job.annotation in _HELD_REASONS:
                 job_state_string = JobState.QUEUED_HELD
 
             this_job.job_state = job_state_string
@@ -631,6 +709,92 @@ stderr='{stderr.strip()}'"""
 
         return job_list
 
+    def _parse_squeue_json_output(self, stdout, job_ids=None):
+        """
+        Parse the output of ``squeue --json``, only keeping the jobs in
+        job_ids, if specified.
+
+        Older versions of SLURM ignore the filtering options of squeue
+        when the JSON output is requested, and report all jobs in the
+        queue instead, so filtering the jobs here is essential.
+        """
+        # pylint: disable=too-many-branches
+        import datetime
+        import time
+
+        try:
+            jobs = json.loads(stdout)['jobs']
+        except (ValueError, KeyError, TypeError) as exception:
+            raise SchedulerError(f'Unable to parse the JSON output of squeue: {exception}') from exception
+
+        job_list = []
+        for job in jobs:
+
+            try:
+                job_id = str(job['job_id'])
+            except (KeyError, TypeError):
+                self.logger.error(f'Job without job id in squeue output! `{job}`')
+                continue
+
+            if job_ids is not None and job_id not in job_ids:
+                continue
+
+            this_job = JobInfo()
+            this_job.job_id = job_id
+            this_job.annotation = job.get('state_reason')
+
+            # Since SLURM 23.02 the state is a list of the base state followed by flags; the COMPLETING and CONFIGURING
+            # flags are reported as the state in the compact form of the text output, so they take precedence here.
+            # A missing or empty state is reported as an unrecognized state.
+            states = job.get('job_state')
+            states = [state for state in (states if isinstance(states, list) else [states]) if state]
+            job_state_raw = next((state for state in ('COMPLETING', 'CONFIGURING') if state in states),
+                                 states[0] if states else None)
+
+            try:
+                job_state_string = _MAP_STATUS_SLURM_JSON[job_state_raw]
+            except KeyError:
+                self.logger.warning(f"Unrecognized job_state '{job_state_raw}' for job id {job_id}")
+                job_state_string = JobState.UNDETERMINED
+
+            if job_state_string == JobState.QUEUED and this_job.annotation in _HELD_REASONS:
+                job_state_string = JobState.QUEUED_HELD
+
+            this_job.job_state = job_state_string
+            this_job.job_owner = job.get('user_name')
+            this_job.num_machines = _get_json_number(job.get('node_count'))
+            this_job.num_mpiprocs = _get_json_number(job.get('cpus'))
+            this_job.queue_name = job.get('partition')
+            this_job.title = job.get('name')
+
+            if this_job.job_state == JobState.RUNNING:
+                this_job.allocated_machines_raw = job.get('nodes')
+
+            # The time limit is reported in minutes
+            if _is_json_number_infinite(job.get('time_limit')):
+                this_job.requested_wallclock_time_seconds = 2147483647
+            else:
+                time_limit = _get_json_number(job.get('time_limit'))
+                if time_limit is not None:
+                    this_job.requested_wallclock_time_seconds = time_limit * 60
+
+            # Times are reported as seconds since the epoch, where zero means that the time is not set
+            start_time = _get_json_number(job.get('start_time'))
+            if this_job.job_state == JobState.RUNNING and start_time:
+                this_job.dispatch_time = datetime.datetime.fromtimestamp(start_time)
+                this_job.wallclock_time_seconds = max(int(time.time()) - start_time, 0)
+
+            submit_time = _get_json_number(job.get('submit_time'))
+            if submit_time:
+                this_job.submission_time = datetime.datetime.fromtimestamp(submit_time)
+
+            # Only store the fields that are used, since the full entry of each job is very large
+            this_job.raw_data = {key: job.get(key) for key in _JSON_FIELDS}
+
+            job_list.append(this_job)
+
+        return job_list
+
     def _convert_time(self, string):
         """
         Convert a string in the format DD-HH:MM:SS to a number of seconds.
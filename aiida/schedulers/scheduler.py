@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import abc
 import typing as t
+import uuid
 
 from aiida.common import exceptions, log, warnings
 from aiida.common.datastructures import CodeRunMode
@@ -47,6 +48,9 @@ class Scheduler(metaclass=abc.ABCMeta):
     # The class to be used for the job resource.
     _job_resource_class: t.Type[JobResource] | None = None
 
+    # Whether the jobs are queried in the machine-readable output format of the scheduler, see `set_structured_output`.
+    _structured_output: bool = False
+
     def __str__(self):
         return self.__class__.__name__
 
@@ -339,11 +343,25 @@ class Scheduler(metaclass=abc.ABCMeta):
         :return: list of `JobInfo` objects, one of each job each with at least its default params implemented.
         """
 
+    def _parse_joblist_output_filtered(self, retval: int, stdout: str, stderr: str,
+                                       job_ids: set[str]) -> list[JobInfo]:
+        """Parse the joblist output, only returning the jobs with the given identifiers.
+
+        The default implementation parses the output of all jobs and discards the other jobs afterwards. Plugins can
+        override it to skip the other jobs before they are parsed, which is much cheaper if the output contains many
+        more jobs than the ones that are requested.
+
+        :param job_ids: the identifiers of the jobs to return.
+        :return: list of `JobInfo` objects, one for each of the requested jobs that is in the output.
+        """
+        return [job for job in self._parse_joblist_output(retval, stdout, stderr) if job.job_id in job_ids]
+
     def get_jobs(
         self,
         jobs: list[str] | None = None,
         user: str | None = None,
         as_dict: bool = False,
+        filter_jobs: t.Iterable[str] | None = None,
     ) -> list[JobInfo] | dict[str, JobInfo]:
         """Return the list of currently active jobs.
 
@@ -353,12 +371,17 @@ class Scheduler(metaclass=abc.ABCMeta):
         :param str user: a string with a user: only jobs of this user are checked
         :param list as_dict: if False (default), a list of JobInfo objects is returned. If True, a dictionary is
             returned, having as key the job_id and as value the JobInfo object.
+        :param filter_jobs: if specified, only the jobs with these identifiers are returned, even if the scheduler
+            reports more jobs, for example when querying all jobs of a user.
         :return: list of active jobs
         """
         with self.transport:
             retval, stdout, stderr = self.transport.exec_command_wait(self._get_joblist_command(jobs=jobs, user=user))
 
-        joblist = self._parse_joblist_output(retval, stdout, stderr)
+        if filter_jobs is None:
+            joblist = self._parse_joblist_output(retval, stdout, stderr)
+        else:
+            joblist = self._parse_joblist_output_filtered(retval, stdout, stderr, set(filter_jobs))
         if as_dict:
             jobdict = {job.job_id: job for job in joblist}
             if None in jobdict:
@@ -382,6 +405,13 @@ class Scheduler(metaclass=abc.ABCMeta):
         """
         self._transport = transport
 
+    def set_structured_output(self, structured_output: bool) -> None:
+        """Set whether the jobs are queried in the machine-readable output format of the scheduler.
+
+        Plugins that do not support a machine-readable output format ignore this setting.
+        """
+        self._structured_output = structured_output
+
     @abc.abstractmethod
     def _get_submit_command(self, submit_script: str) -> str:
         """Return the string to execute to submit a given script.
@@ -409,6 +439,62 @@ class Scheduler(metaclass=abc.ABCMeta):
         result = self.transport.exec_command_wait(self._get_submit_command(escape_for_bash(submit_script)))
         return self._parse_submit_output(*result)
 
+    def submit_from_scripts(self, submissions: list[tuple[str, str]]) -> list[str | ExitCode | Exception]:
+        """Submit multiple submission scripts to the scheduler with a single remote command.
+
+        Each submit command is executed in its own working directory and its return value, stdout and stderr are parsed
+        separately by ``_parse_submit_output``, exactly as if it had been submitted through ``submit_from_script``. This
+        saves a round trip over the transport for each additional script, which dominates the time to submit a large
+        number of jobs to a remote computer. Since the working directories are changed into by the command itself, the
+        current working directory of the transport is not used nor changed.
+
+        :param submissions: list of tuples of the working directory and the filename of the submission script.
+        :return: list with for each submission, in the same order, the job ID or an ``ExitCode`` as returned by
+            ``_parse_submit_output`` or the exception that was raised while parsing the output of its submit command.
+        :raises SchedulerError: if the output of the combined command cannot be split in that of the individual ones.
+        """
+        if not submissions:
+            return []
+
+        separator = f'AIIDA-SUBMIT-{uuid.uuid4().hex}'
+        lines = ['tmp=$(mktemp -d) || exit 1']
+
+        for working_directory, submit_script in submissions:
+            submit_command = self._get_submit_command(escape_for_bash(submit_script))
+            lines.append(f'( cd {escape_for_bash(working_directory)} || exit 1')
+            lines.append(submit_command)
+            lines.append(') > "$tmp/stdout" 2> "$tmp/stderr"')
+            lines.append(f'printf "%s\\n%s\\n" {separator} $?')
+            lines.append('cat "$tmp/stdout"')
+            lines.append(f'printf "%s\\n" {separator}')
+            lines.append('cat "$tmp/stderr"')
+
+        lines.append(f'printf "%s\\n" {separator}')
+        lines.append('rm -rf "$tmp"')
+
+        retval, stdout, stderr = self.transport.exec_command_wait('\n'.join(lines))
+
+        # The output consists of the header, the return value and stdout and the stderr of each submission, all
+        # separated by the separator, which is followed by a final separator after the stderr of the last submission.
+        parts = stdout.split(f'{separator}\n')
+
+        if retval != 0 or len(parts) != 2 * len(submissions) + 2:
+            raise SchedulerError(
+                f'Error during batched submission, retval={retval}\nstdout={stdout}\nstderr={stderr}'
+            )
+
+        results: list[str | ExitCode | Exception] = []
+
+        for index in range(len(submissions)):
+            submit_retval, _, submit_stdout = parts[2 * index + 1].partition('\n')
+            submit_stderr = parts[2 * index + 2]
+            try:
+                results.append(self._parse_submit_output(int(submit_retval), submit_stdout, submit_stderr))
+            except Exception as exception:  # pylint: disable=broad-except
+                results.append(exception)
+
+        return results
+
     def kill(self, jobid: str) -> bool:
         """Kill a remote job and parse the return value of the scheduler to check if the command succeeded.
 
@@ -13,7 +13,7 @@ from contextlib import contextmanager, nullcontext
 import functools
 import gc
 import pathlib
-from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Set, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from disk_objectstore import Container
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
@@ -29,6 +29,7 @@ from aiida.storage.psql_dos.models import base
 from .orm import authinfos, comments, computers, convert, groups, logs, nodes, querybuilder, users
 
 if TYPE_CHECKING:
+    from aiida.orm.utils.links import LinkQuadruple
     from aiida.repository.backend import DiskObjectStoreRepositoryBackend
 
 __all__ = ('PsqlDosBackend',)
@@ -195,9 +196,15 @@ class PsqlDosBackend(StorageBackend):  # pylint: disable=too-many-public-methods
                 )
 
     def get_repository(self) -> 'DiskObjectStoreRepositoryBackend':
+        from aiida.manage import get_config_option
         from aiida.repository.backend import DiskObjectStoreRepositoryBackend
         container = Container(str(get_filepath_container(self.profile)))
-        return DiskObjectStoreRepositoryBackend(container=container)
+        return DiskObjectStoreRepositoryBackend(
+            container=container,
+            direct_to_pack=get_config_option('storage.repository_direct_to_pack'),
+            pack_size_target=get_config_option('storage.repository_pack_size_target') or None,
+            pack_fsync=get_config_option('storage.repository_pack_fsync'),
+        )
 
     @property
     def authinfos(self):
@@ -337,6 +344,62 @@ class PsqlDosBackend(StorageBackend):  # pylint: disable=too-many-public-methods
         # Delete the actual nodes
         session.query(DbNode).filter(DbNode.id.in_(list(pks_to_delete))).delete(synchronize_session='fetch')
 
+    def traverse_graph(
+        self,
+        starting_pks: Set[int],
+        links_forward: Sequence[str] = (),
+        links_backward: Sequence[str] = (),
+        get_links: bool = False
+    ) -> Tuple[Set[int], Optional[Set['LinkQuadruple']]]:
+        from aiida.storage.psql_dos.models.node import DbLink, DbNode
+        from aiida.storage.psql_dos.utils import get_graph_closure
+
+        return get_graph_closure(
+            self.get_session(), DbNode, DbLink, starting_pks, links_forward, links_backward, get_links
+        )
+
+    def get_process_checkpoint(self, pk: int) -> Optional[str]:
+        from sqlalchemy import select
+
+        from aiida.storage.psql_dos.models.checkpoint import DbCheckpoint
+
+        query = select(DbCheckpoint.checkpoint).where(DbCheckpoint.dbnode_id == pk)
+        return self.get_session().execute(query).scalar_one_or_none()
+
+    def get_process_checkpoints(self, pks: Sequence[int]) -> Dict[int, str]:
+        from sqlalchemy import select
+
+        from aiida.storage.psql_dos.models.checkpoint import DbCheckpoint
+
+        if not pks:
+            return {}
+
+        query = select(DbCheckpoint.dbnode_id, DbCheckpoint.checkpoint).where(DbCheckpoint.dbnode_id.in_(pks))
+        return dict(self.get_session().execute(query).all())
+
+    def set_process_checkpoint(self, pk: int, checkpoint: str) -> None:
+        from sqlalchemy.dialects.postgresql import insert
+
+        from aiida.storage.psql_dos.models.checkpoint import DbCheckpoint
+
+        statement = insert(DbCheckpoint).values(dbnode_id=pk, checkpoint=checkpoint)
+        statement = statement.on_conflict_do_update(
+            index_elements=[DbCheckpoint.dbnode_id], set_={'checkpoint': statement.excluded.checkpoint}
+        )
+        session = self.get_session()
+        # Within a transaction, a savepoint ensures that a failure to write the checkpoint does not abort the transaction
+        with (session.begin_nested() if self.in_transaction else self.transaction()):
+            session.execute(statement)
+
+    def delete_process_checkpoint(self, pk: int) -> None:
+        from sqlalchemy import delete
+
+        from aiida.storage.psql_dos.models.checkpoint import DbCheckpoint
+
+        session = self.get_session()
+        with (nullcontext() if self.in_transaction else self.transaction()):
+            session.execute(delete(DbCheckpoint).where(DbCheckpoint.dbnode_id == pk))
+
     def get_backend_entity(self, model: base.Base) -> BackendEntity:
         """
         Return the backend entity that corresponds to the given Model instance
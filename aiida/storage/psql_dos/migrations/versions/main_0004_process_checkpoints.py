@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Move the checkpoints of process nodes from the ``checkpoints`` attribute to the ``db_dbcheckpoint`` table.
+
+Revision ID: main_0004
+Revises: main_0003
+Create Date: 2023-08-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = 'main_0004'
+down_revision = 'main_0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_table(
+        'db_dbcheckpoint',
+        sa.Column('dbnode_id', sa.Integer(), nullable=False),
+        sa.Column('checkpoint', JSONB(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['dbnode_id'],
+            ['db_dbnode.id'],
+            name='fk_db_dbcheckpoint_dbnode_id_db_dbnode',
+            ondelete='CASCADE',
+            initially='DEFERRED',
+            deferrable=True,
+        ),
+        sa.PrimaryKeyConstraint('dbnode_id', name='db_dbcheckpoint_pkey'),
+    )
+    op.execute(
+        """
+        INSERT INTO db_dbcheckpoint (dbnode_id, checkpoint)
+        SELECT id, attributes->'checkpoints' FROM db_dbnode
+        WHERE node_type LIKE 'process.%' AND attributes ? 'checkpoints';
+        """
+    )
+    op.execute(
+        """
+        UPDATE db_dbnode SET attributes = attributes - 'checkpoints'
+        WHERE node_type LIKE 'process.%' AND attributes ? 'checkpoints';
+        """
+    )
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.execute(
+        """
+        UPDATE db_dbnode SET attributes = jsonb_set(attributes, '{checkpoints}', db_dbcheckpoint.checkpoint)
+        FROM db_dbcheckpoint WHERE db_dbnode.id = db_dbcheckpoint.dbnode_id;
+        """
+    )
+    op.drop_table('db_dbcheckpoint')
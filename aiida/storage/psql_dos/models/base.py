@@ -87,6 +87,7 @@ def get_orm_metadata() -> MetaData:
     # we must load all models, to populate the ORM metadata
     from aiida.storage.psql_dos.models import (  # pylint: disable=unused-import
         authinfo,
+        checkpoint,
         comment,
         computer,
         group,
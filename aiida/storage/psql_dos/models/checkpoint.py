@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=import-error,no-name-in-module
+"""Module to manage process checkpoints for the SQLA backend."""
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.schema import Column
+from sqlalchemy.sql.schema import ForeignKey
+from sqlalchemy.types import Integer
+
+from aiida.storage.psql_dos.models.base import Base
+
+
+class DbCheckpoint(Base):
+    """Database model to store the checkpoint of a :py:class:`aiida.orm.ProcessNode`.
+
+    The checkpoints are kept out of the attributes of the node, since they are large, are rewritten on every state
+    transition of a running process and are only needed to recreate the process from the node.
+    """
+    __tablename__ = 'db_dbcheckpoint'
+
+    dbnode_id = Column(
+        Integer,
+        ForeignKey('db_dbnode.id', deferrable=True, initially='DEFERRED', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    checkpoint = Column(JSONB, nullable=False)
+
+    def __str__(self):
+        return f'DbCheckpoint for node {self.dbnode_id}'
@@ -103,6 +103,9 @@ class DbNode(Base):
             postgresql_using='btree',
             postgresql_ops={'process_type': 'varchar_pattern_ops'}
         ),
+        # Index on the hash of the node used by the caching mechanism, such that equality filters on the ``_aiida_hash``
+        # extra, as generated by the ``QueryBuilder``, do not require a sequential scan of the table
+        Index('ix_db_dbnode_extras_aiida_hash', extras[('_aiida_hash',)].astext, postgresql_using='btree'),
     )
 
     @property
@@ -9,9 +9,12 @@
 ###########################################################################
 """SqlAlchemy implementation of the `BackendNode` and `BackendNodeCollection` classes."""
 # pylint: disable=no-name-in-module,import-error
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Iterable, Tuple, Type
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Type
 
+from sqlalchemy import inspect, literal, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -38,6 +41,9 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], ExtrasMixin, BackendNode
     COMPUTER_CLASS = SqlaComputer
     LINK_CLASS = models.DbLink
 
+    # The attributes that were changed within :meth:`batch_attributes` and still have to be written to the database
+    _attributes_patch: Optional[Dict[str, Any]] = None
+
     def __init__(
         self,
         backend,
@@ -234,11 +240,11 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], ExtrasMixin, BackendNode
 
     @property
     def attributes(self):
-        return self.model.attributes
+        return self._attributes_model.attributes
 
     def get_attribute(self, key: str) -> Any:
         try:
-            return self.model.attributes[key]
+            return self._attributes_model.attributes[key]
         except KeyError as exception:
             raise AttributeError(f'attribute `{exception}` does not exist') from exception
 
@@ -246,25 +252,101 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], ExtrasMixin, BackendNode
         validate_attribute_extra_key(key)
 
         if self.is_stored:
-            value = clean_value(value)
-
-        self.model.attributes[key] = value
-        self._flush_if_stored({'attributes'})
+            self._update_attributes({key: clean_value(value)})
+        else:
+            self.model.attributes[key] = value
 
     def set_attribute_many(self, attributes: Dict[str, Any]) -> None:
         for key in attributes:
             validate_attribute_extra_key(key)
 
         if self.is_stored:
-            attributes = {key: clean_value(value) for key, value in attributes.items()}
+            self._update_attributes({key: clean_value(value) for key, value in attributes.items()})
+        else:
+            for key, value in attributes.items():
+                self.bare_model.attributes[key] = value
 
-        for key, value in attributes.items():
-            # We need to use the SQLA model, because otherwise the second iteration will refetch
-            # what is in the database and we lose the initial changes.
-            self.bare_model.attributes[key] = value
-        self._flush_if_stored({'attributes'})
+    @contextmanager
+    def batch_attributes(self) -> Iterator[None]:
+        if self._attributes_patch is not None or not self.is_stored:
+            yield
+            return
+
+        self._attributes_patch = {}
+
+        try:
+            yield
+        finally:
+            self._write_attributes_patch()
+            self._attributes_patch = None
+
+    @property
+    def _attributes_model(self):
+        """Return the model to read the attributes from.
+
+        Within :meth:`batch_attributes` the attributes are not refreshed from the database, which would discard the
+        changes that have not yet been written. If they were expired in the meantime, for example because the session
+        was committed, the pending changes are applied again after loading them.
+        """
+        if self._attributes_patch is None:
+            return self.model
+
+        model = self.bare_model
+
+        if 'attributes' in inspect(model).unloaded:
+            model.attributes.update(self._attributes_patch)
+
+        return model
+
+    def _update_attributes(self, attributes: Dict[str, Any]) -> None:
+        """Update the given attributes of the stored node, leaving the other attributes untouched.
+
+        Within :meth:`batch_attributes`, the changes are only written to the database when exiting the context.
+
+        :param attributes: the cleaned values of the attributes to update
+        """
+        model = self.bare_model
+
+        # Only update the attributes in memory if they are loaded, otherwise they are fetched after the update anyway
+        if 'attributes' not in inspect(model).unloaded:
+            model.attributes.update(attributes)
+
+        if self._attributes_patch is not None:
+            self._attributes_patch.update(attributes)
+        else:
+            self._write_attributes(attributes)
+
+    def _write_attributes_patch(self) -> None:
+        """Write the attributes that were changed within :meth:`batch_attributes` to the database."""
+        if self._attributes_patch:
+            attributes, self._attributes_patch = self._attributes_patch, {}
+            self._write_attributes(attributes)
+
+    def _write_attributes(self, attributes: Dict[str, Any]) -> None:
+        """Write the given attributes to the database with a single statement that merges them into the stored ones.
+
+        Only the keys that changed are sent to the database, such that it does not need to rewrite the entire attributes
+        column of the node. The changes are committed unless a transaction is open.
+
+        :param attributes: the cleaned values of the attributes to write
+        """
+        session = self.backend.get_session()
+        pk = inspect(self.bare_model).identity[0]
+        statement = update(self.MODEL_CLASS).where(self.MODEL_CLASS.id == pk).values(
+            attributes=self.MODEL_CLASS.attributes.op('||')(literal(attributes, JSONB))
+        ).execution_options(synchronize_session=False)
+
+        try:
+            session.execute(statement)
+            if not self.backend.in_transaction:
+                session.commit()
+        except SQLAlchemyError:
+            session.rollback()
+            raise
 
     def reset_attributes(self, attributes: Dict[str, Any]) -> None:
+        self._write_attributes_patch()
+
         for key in attributes:
             validate_attribute_extra_key(key)
 
@@ -275,6 +357,8 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], ExtrasMixin, BackendNode
         self._flush_if_stored({'attributes'})
 
     def delete_attribute(self, key: str) -> None:
+        self._write_attributes_patch()
+
         try:
             self.model.attributes.pop(key)
         except KeyError as exception:
@@ -283,6 +367,8 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], ExtrasMixin, BackendNode
             self._flush_if_stored({'attributes'})
 
     def delete_attribute_many(self, keys: Iterable[str]) -> None:
+        self._write_attributes_patch()
+
         non_existing_keys = [key for key in keys if key not in self.model.attributes]
 
         if non_existing_keys:
@@ -294,15 +380,17 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], ExtrasMixin, BackendNode
         self._flush_if_stored({'attributes'})
 
     def clear_attributes(self):
+        self._write_attributes_patch()
+
         self.model.attributes = {}
         self._flush_if_stored({'attributes'})
 
     def attributes_items(self) -> Iterable[Tuple[str, Any]]:
-        for key, value in self.model.attributes.items():
+        for key, value in self._attributes_model.attributes.items():
             yield key, value
 
     def attributes_keys(self) -> Iterable[str]:
-        for key in self.model.attributes.keys():
+        for key in self._attributes_model.attributes.keys():
             yield key
 
 
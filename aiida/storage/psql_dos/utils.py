@@ -287,3 +287,67 @@ CREATE TRIGGER autoupdate_tc
         closure_table_parent_field=closure_table_parent_field,
         closure_table_child_field=closure_table_child_field
     )
+
+
+def get_graph_closure(
+    session, node_model, link_model, starting_pks, links_forward=(), links_backward=(), get_links=False
+):  # pylint: disable=too-many-arguments
+    """Return the nodes connected to the starting nodes through any sequence of the given links with a single query.
+
+    The closure is computed by the database as a recursive common table expression over the link table, where forward
+    and backward links are combined into a single set of directed edges. The ``UNION`` of the recursive term discards
+    nodes that were already visited, which guarantees termination for cyclic graphs.
+
+    :param session: the SQLAlchemy session
+    :param node_model: the model of the node table
+    :param link_model: the model of the link table
+    :param starting_pks: the pks of the starting nodes
+    :param links_forward: the values of the link types to traverse in the forward direction
+    :param links_backward: the values of the link types to traverse in the backward direction
+    :param get_links: whether to also return the traversed links
+    :return: the set of pks of the connected nodes and, if ``get_links`` is True, the set of traversed links as
+        :class:`aiida.orm.utils.links.LinkQuadruple`, ``None`` otherwise
+    """
+    from sqlalchemy import and_, or_, select, union_all
+
+    from aiida.orm.utils.links import LinkQuadruple
+
+    links_forward = list(links_forward)
+    links_backward = list(links_backward)
+
+    edges = []
+    if links_forward:
+        source, target = link_model.input_id.label('source'), link_model.output_id.label('target')
+        edges.append(select(source, target).where(link_model.type.in_(links_forward)))
+    if links_backward:
+        source, target = link_model.output_id.label('source'), link_model.input_id.label('target')
+        edges.append(select(source, target).where(link_model.type.in_(links_backward)))
+
+    closure = select(node_model.id.label('id')).where(node_model.id.in_(list(starting_pks)))
+
+    if not edges:
+        closure = closure.cte('closure')
+    else:
+        closure = closure.cte('closure', recursive=True)
+        edge = (union_all(*edges) if len(edges) > 1 else edges[0]).subquery('edge')
+        recursive = select(edge.c.target).select_from(edge.join(closure, edge.c.source == closure.c.id))
+        closure = closure.union(recursive)
+
+    nodes = set(session.execute(select(closure.c.id)).scalars())
+
+    if not get_links:
+        return nodes, None
+
+    conditions = []
+    if links_forward:
+        conditions.append(and_(link_model.type.in_(links_forward), link_model.input_id.in_(select(closure.c.id))))
+    if links_backward:
+        conditions.append(and_(link_model.type.in_(links_backward), link_model.output_id.in_(select(closure.c.id))))
+
+    if not conditions:
+        return nodes, set()
+
+    query = select(link_model.input_id, link_model.output_id, link_model.type, link_model.label).where(or_(*conditions))
+    links = {LinkQuadruple(*row) for row in session.execute(query)}
+
+    return nodes, links
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from functools import cached_property
-from typing import Any, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
 
 from sqlalchemy.orm import Session
 
@@ -25,6 +25,9 @@ from aiida.storage.sqlite_zip import models, orm
 from aiida.storage.sqlite_zip.migrator import get_schema_version_head
 from aiida.storage.sqlite_zip.utils import create_sqla_engine
 
+if TYPE_CHECKING:
+    from aiida.orm.utils.links import LinkQuadruple
+
 __all__ = ('SqliteTempBackend',)
 
 
@@ -207,3 +210,16 @@ class SqliteTempBackend(StorageBackend):  # pylint: disable=too-many-public-meth
 
     def delete_nodes_and_connections(self, pks_to_delete: Sequence[int]):
         raise NotImplementedError
+
+    def traverse_graph(
+        self,
+        starting_pks: set[int],
+        links_forward: Sequence[str] = (),
+        links_backward: Sequence[str] = (),
+        get_links: bool = False
+    ) -> tuple[set[int], set[LinkQuadruple] | None]:
+        from aiida.storage.psql_dos.utils import get_graph_closure
+
+        return get_graph_closure(
+            self.get_session(), models.DbNode, models.DbLink, starting_pks, links_forward, links_backward, get_links
+        )
@@ -17,7 +17,7 @@ import json
 from pathlib import Path
 import shutil
 import tempfile
-from typing import BinaryIO, Iterable, Iterator, Optional, Sequence, Tuple, cast
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, Optional, Sequence, Tuple, cast
 from zipfile import ZipFile, is_zipfile
 
 from archive_path import ZipPath, extract_file_in_zip
@@ -43,6 +43,9 @@ from .utils import (
     read_version,
 )
 
+if TYPE_CHECKING:
+    from aiida.orm.utils.links import LinkQuadruple
+
 __all__ = ('SqliteZipBackend',)
 
 LOGGER = AIIDA_LOGGER.getChild(__file__)
@@ -269,6 +272,21 @@ class SqliteZipBackend(StorageBackend):  # pylint: disable=too-many-public-metho
     def delete_nodes_and_connections(self, pks_to_delete: Sequence[int]):
         raise ReadOnlyError()
 
+    def traverse_graph(
+        self,
+        starting_pks: set[int],
+        links_forward: Sequence[str] = (),
+        links_backward: Sequence[str] = (),
+        get_links: bool = False
+    ) -> tuple[set[int], set[LinkQuadruple] | None]:
+        from aiida.storage.psql_dos.utils import get_graph_closure
+
+        from .models import DbLink, DbNode
+
+        return get_graph_closure(
+            self.get_session(), DbNode, DbLink, starting_pks, links_forward, links_backward, get_links
+        )
+
     def get_global_variable(self, key: str):
         raise NotImplementedError
 
@@ -114,7 +114,9 @@ def create_orm_cls(klass: base.Base) -> SqliteBase:
 
 
 for table in base.Base.metadata.sorted_tables:
-    pg_to_sqlite(table)
+    # The checkpoints are only needed to continue running processes and are never included in an archive
+    if table.name != 'db_dbcheckpoint':
+        pg_to_sqlite(table)
 
 DbUser = create_orm_cls(user.DbUser)
 DbComputer = create_orm_cls(computer.DbComputer)
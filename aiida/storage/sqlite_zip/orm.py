@@ -14,7 +14,7 @@ but redefines the SQLAlchemy models to the SQLite compatible ones.
 """
 from functools import singledispatch
 import json
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sqlalchemy import JSON, case, func
 from sqlalchemy.orm.util import AliasedClass
@@ -145,6 +145,11 @@ class SqliteNode(SqliteEntityOverride, nodes.SqlaNode):
     COMPUTER_CLASS = SqliteComputer
     LINK_CLASS = models.DbLink
 
+    def _write_attributes(self, attributes: Dict[str, Any]) -> None:
+        # SQLite has no operator to merge JSON documents that keeps ``null`` values, so the entire column is rewritten
+        self.bare_model.attributes.update(attributes)
+        self._flush_if_stored({'attributes'})
+
 
 class SqliteNodeCollection(nodes.SqlaNodeCollection):
 
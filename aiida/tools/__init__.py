@@ -35,6 +35,7 @@ __all__ = (
     'CalculationTools',
     'DELETE_LOGGER',
     'Graph',
+    'GraphSnapshot',
     'GroupNotFoundError',
     'GroupNotUniqueError',
     'GroupPath',
@@ -313,6 +313,8 @@ def create_archive(
                                 }, tag='entity', project=['**']
                             ).iterdict(batch_size=batch_size), batch_size, transform
                         ):
+                            if etype == EntityTypes.NODE and not strip_checkpoints:
+                                _add_process_checkpoints(backend, rows)
                             writer.bulk_insert(etype, rows)
                             progress.update(nrows)
 
@@ -564,6 +566,27 @@ def _collect_required_entities(
     return group_nodes, link_data
 
 
+def _add_process_checkpoints(backend: StorageBackend, rows: List[dict]) -> None:
+    """Add the checkpoints of the process nodes in a batch of node rows to their attributes.
+
+    The storage may keep the checkpoints out of the attributes, but they are exported with the attributes, since the
+    archive does not store them separately. The checkpoints of all the nodes of the batch are fetched with one query.
+    """
+    pks = [row['id'] for row in rows if row.get('node_type', '').startswith('process.')]
+
+    if not pks:
+        return
+
+    try:
+        checkpoints = backend.get_process_checkpoints(pks)
+    except NotImplementedError:
+        return
+
+    for row in rows:
+        if row['id'] in checkpoints:
+            row['attributes'][orm.ProcessNode.CHECKPOINT_KEY] = checkpoints[row['id']]
+
+
 def _stream_repo_files(
     key_format: str, writer: ArchiveWriterAbstract, node_ids: Set[int], backend: StorageBackend, batch_size: int
 ) -> None:
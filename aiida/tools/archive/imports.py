@@ -11,7 +11,9 @@
 """Import an archive."""
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, Literal, Optional, Set, Tuple, Union
+import shutil
+import tempfile
+from typing import BinaryIO, Callable, Dict, List, Literal, Optional, Set, Tuple, Union
 
 from tabulate import tabulate
 
@@ -1157,11 +1159,37 @@ def _add_files_to_repo(backend_from: StorageBackend, backend_to: StorageBackend,
 
     repository_to = backend_to.get_repository()
     repository_from = backend_from.get_repository()
-    with get_progress_reporter()(desc='Adding archive files to repository', total=len(new_keys)) as progress:
-        for key, handle in repository_from.iter_object_streams(new_keys):  # type: ignore
-            backend_key = repository_to.put_object_from_filelike(handle)
+
+    # The streams of the archive are only valid during the iteration, so their content is buffered, in memory up to a
+    # maximum size per object, such that the objects can be passed to the repository in batches.
+    buffer_max_size = 1024**2
+    batch_max_size = 100 * 1024**2
+    batch_max_count = 1000
+    batch: List[Tuple[str, BinaryIO]] = []
+    batch_size = 0
+
+    def add_batch(batch: List[Tuple[str, BinaryIO]]) -> None:
+        backend_keys = repository_to.put_objects_from_filelikes([buffer for _, buffer in batch])
+        for (key, buffer), backend_key in zip(batch, backend_keys):
+            buffer.close()
             if backend_key != key:
                 raise ImportValidationError(
                     f'Archive repository key is different to backend key: {key!r} != {backend_key!r}'
                 )
-            progress.update()
+        progress.update(len(batch))
+
+    with get_progress_reporter()(desc='Adding archive files to repository', total=len(new_keys)) as progress:
+        for key, handle in repository_from.iter_object_streams(new_keys):  # type: ignore
+            buffer = tempfile.SpooledTemporaryFile(max_size=buffer_max_size, mode='w+b')
+            shutil.copyfileobj(handle, buffer)
+            batch_size += buffer.tell()
+            buffer.seek(0)
+            batch.append((key, buffer))  # type: ignore[arg-type]
+
+            if batch_size >= batch_max_size or len(batch) >= batch_max_count:
+                add_batch(batch)
+                batch = []
+                batch_size = 0
+
+        if batch:
+            add_batch(batch)
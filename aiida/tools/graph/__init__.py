@@ -15,9 +15,11 @@
 # pylint: disable=wildcard-import
 
 from .deletions import *
+from .snapshot import *
 
 __all__ = (
     'DELETE_LOGGER',
+    'GraphSnapshot',
     'delete_group_nodes',
     'delete_nodes',
 )
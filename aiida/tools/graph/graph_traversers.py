@@ -16,6 +16,7 @@ from numpy import inf
 from aiida import orm
 from aiida.common import exceptions
 from aiida.common.links import GraphTraversalRules, LinkType
+from aiida.manage import get_manager
 from aiida.orm.utils.links import LinkQuadruple
 from aiida.tools.graph.age_entities import Basket
 from aiida.tools.graph.age_rules import RuleSaveWalkers, RuleSequence, RuleSetWalkers, UpdateRule
@@ -196,7 +197,8 @@ def traverse_graph(
     links_forward: Iterable[LinkType] = (),
     links_backward: Iterable[LinkType] = (),
     missing_callback: Optional[Callable[[Iterable[int]], None]] = None,
-    backend: Optional['StorageBackend'] = None
+    backend: Optional['StorageBackend'] = None,
+    storage_traversal: bool = True,
 ) -> TraverseGraphOutput:
     """
     This function will return the set of all nodes that can be connected
@@ -215,6 +217,10 @@ def traverse_graph(
     :param links_backward: List with all the links that should be traversed in the backward direction.
 
     :param missing_callback: A callback to handle missing starting_pks or if None raise NotExistent
+
+    :param storage_traversal:
+        Pass True to let the storage compute the full traversal in a single query, if it supports it. This is only used
+        when ``max_iterations`` is None, otherwise the nodes are always collected by the rule engine one hop at a time.
     """
     # pylint: disable=too-many-locals,too-many-statements,too-many-branches
 
@@ -223,19 +229,19 @@ def traverse_graph(
     elif not (isinstance(max_iterations, int) or max_iterations is inf):
         raise TypeError('Max_iterations has to be an integer or infinity')
 
-    linktype_list = []
+    linktypes_forward = []
     for linktype in links_forward:
         if not isinstance(linktype, LinkType):
             raise TypeError(f'links_forward should contain links, but one of them is: {type(linktype)}')
-        linktype_list.append(linktype.value)
-    filters_forwards = {'type': {'in': linktype_list}}
+        linktypes_forward.append(linktype.value)
+    filters_forwards = {'type': {'in': linktypes_forward}}
 
-    linktype_list = []
+    linktypes_backward = []
     for linktype in links_backward:
         if not isinstance(linktype, LinkType):
             raise TypeError(f'links_backward should contain links, but one of them is: {type(linktype)}')
-        linktype_list.append(linktype.value)
-    filters_backwards = {'type': {'in': linktype_list}}
+        linktypes_backward.append(linktype.value)
+    filters_backwards = {'type': {'in': linktypes_backward}}
 
     if not isinstance(starting_pks, Iterable):  # pylint: disable=isinstance-second-argument-not-valid-type
         raise TypeError(f'starting_pks must be an iterable\ninstead, it is {type(starting_pks)}')
@@ -260,6 +266,15 @@ def traverse_graph(
     elif missing_pks and missing_callback is not None:
         missing_callback(missing_pks)
 
+    if storage_traversal and max_iterations is inf:
+        storage = backend or get_manager().get_profile_storage()
+        try:
+            nodes, links = storage.traverse_graph(existing_pks, linktypes_forward, linktypes_backward, get_links)
+        except NotImplementedError:
+            pass
+        else:
+            return {'nodes': nodes, 'links': links}
+
     rules = []
     basket = Basket(nodes=existing_pks)
 
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""In-memory snapshot of the links of the provenance graph, for repeated traversals without querying the storage."""
+import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from aiida import orm
+from aiida.common import exceptions
+from aiida.common.links import LinkType
+from aiida.orm.utils.links import LinkQuadruple
+
+if TYPE_CHECKING:
+    from aiida.orm.implementation import StorageBackend
+
+__all__ = ('GraphSnapshot',)
+
+LINK_TYPES: Tuple[LinkType, ...] = tuple(LinkType)
+
+
+class _CompressedLinks(NamedTuple):
+    """Links in compressed sparse row format, where the links of node ``i`` are in ``indptr[i]:indptr[i + 1]``."""
+    indptr: np.ndarray
+    neighbours: np.ndarray
+    link_types: np.ndarray
+    links: np.ndarray
+
+
+def _compress(rows: np.ndarray, columns: np.ndarray, link_types: np.ndarray, num_nodes: int) -> _CompressedLinks:
+    """Return the links from the nodes with index ``rows`` to those with index ``columns`` in compressed format."""
+    order = np.argsort(rows, kind='stable')
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=num_nodes), out=indptr[1:])
+    return _CompressedLinks(indptr, columns[order], link_types[order], order)
+
+
+class GraphSnapshot:
+    """Snapshot of the links of the provenance graph, stored as compressed sparse row arrays.
+
+    The snapshot loads the link table once, after which the closure of a set of nodes along any combination of link
+    types and directions is computed with vectorized operations, one hop at a time, without querying the storage. The
+    nodes are identified by their pk and all methods return sorted arrays of pks.
+
+    The snapshot is not updated automatically. Call :meth:`refresh` to add the nodes and links that were created since
+    the snapshot was loaded or last refreshed. Nodes that are deleted in the meantime are only removed when a new
+    snapshot is created.
+
+    Example::
+
+        snapshot = GraphSnapshot()
+        snapshot.get_ancestors([node.pk], link_types=[LinkType.CREATE, LinkType.INPUT_CALC])
+        snapshot.refresh()
+
+    """
+
+    def __init__(self, backend: Optional['StorageBackend'] = None, batch_size: int = 100000) -> None:
+        """Load the snapshot of the links from the storage.
+
+        :param backend: the storage backend to load the links from, by default that of the loaded profile
+        :param batch_size: the number of rows fetched from the storage at a time
+        """
+        self._backend = backend
+        self._batch_size = batch_size
+        self._node_ids = np.empty(0, dtype=np.int64)
+        self._link_ids = np.empty(0, dtype=np.int64)
+        self._source_ids = np.empty(0, dtype=np.int64)
+        self._target_ids = np.empty(0, dtype=np.int64)
+        self._link_types = np.empty(0, dtype=np.uint8)
+        self._label_ids = np.empty(0, dtype=np.int32)
+        self._labels: List[str] = []
+        self._label_index: Dict[str, int] = {}
+        self._last_ctime: Optional[datetime.datetime] = None
+        self._last_link_id = -1
+        self._outgoing = self._incoming = _compress(self._link_ids, self._link_ids, self._link_types, 0)
+        self.refresh()
+
+    @property
+    def node_ids(self) -> np.ndarray:
+        """Return the sorted pks of the nodes in the snapshot."""
+        return self._node_ids
+
+    @property
+    def number_of_links(self) -> int:
+        """Return the number of links in the snapshot."""
+        return len(self._link_ids)
+
+    def refresh(self) -> int:
+        """Add the nodes created since the last refresh and the links created since then to the snapshot.
+
+        New nodes are those with a ``ctime`` that is not older than that of the most recent node in the snapshot. Since
+        links can also be added between existing nodes, for example a ``RETURN`` link to an existing data node, new
+        links are those with a larger id than any link in the snapshot.
+
+        :return: the number of links that were added
+        """
+        # The links are fetched before the nodes, such that the nodes of all links are guaranteed to be loaded
+        query = orm.QueryBuilder(backend=self._backend)
+        query.append(orm.Node, tag='source')
+        query.append(
+            orm.Node,
+            with_incoming='source',
+            edge_filters={'id': {'>': self._last_link_id}},
+            edge_project=['id', 'input_id', 'output_id', 'type', 'label'],
+        )
+        links = list(query.iterall(batch_size=self._batch_size))
+
+        filters = {} if self._last_ctime is None else {'ctime': {'>=': self._last_ctime}}
+        query = orm.QueryBuilder(backend=self._backend)
+        query.append(orm.Node, filters=filters, project=['id', 'ctime'])
+        nodes = list(query.iterall(batch_size=self._batch_size))
+        num_nodes = len(self._node_ids)
+
+        if nodes:
+            node_ids, ctimes = zip(*nodes)
+            self._node_ids = np.union1d(self._node_ids, np.array(node_ids, dtype=np.int64))
+            self._last_ctime = max(ctimes)
+
+        if links:
+            self._add_links(links)
+
+        if links or len(self._node_ids) != num_nodes:
+            sources = np.searchsorted(self._node_ids, self._source_ids)
+            targets = np.searchsorted(self._node_ids, self._target_ids)
+            self._outgoing = _compress(sources, targets, self._link_types, len(self._node_ids))
+            self._incoming = _compress(targets, sources, self._link_types, len(self._node_ids))
+
+        return len(links)
+
+    def get_ancestors(
+        self,
+        pks: Iterable[int],
+        link_types: Optional[Iterable[LinkType]] = None,
+        max_hops: Optional[int] = None
+    ) -> np.ndarray:
+        """Return the nodes that can be reached from the given nodes by following links in the backward direction.
+
+        :param pks: the pks of the starting nodes
+        :param link_types: the types of the links to follow, by default all link types
+        :param max_hops: the maximum number of links to follow, by default unlimited
+        :return: the sorted pks of the ancestors, excluding the starting nodes unless they are part of a cycle
+        :raises: :class:`~aiida.common.exceptions.NotExistent` if any of the starting nodes is not in the snapshot
+        """
+        return self._closure(pks, [(self._incoming, self._get_mask(link_types))], max_hops, include_start=False)
+
+    def get_descendants(
+        self,
+        pks: Iterable[int],
+        link_types: Optional[Iterable[LinkType]] = None,
+        max_hops: Optional[int] = None
+    ) -> np.ndarray:
+        """Return the nodes that can be reached from the given nodes by following links in the forward direction.
+
+        :param pks: the pks of the starting nodes
+        :param link_types: the types of the links to follow, by default all link types
+        :param max_hops: the maximum number of links to follow, by default unlimited
+        :return: the sorted pks of the descendants, excluding the starting nodes unless they are part of a cycle
+        :raises: :class:`~aiida.common.exceptions.NotExistent` if any of the starting nodes is not in the snapshot
+        """
+        return self._closure(pks, [(self._outgoing, self._get_mask(link_types))], max_hops, include_start=False)
+
+    def get_neighbourhood(
+        self, pks: Iterable[int], hops: int = 1, link_types: Optional[Iterable[LinkType]] = None
+    ) -> np.ndarray:
+        """Return the nodes that are connected to the given nodes by at most ``hops`` links in either direction.
+
+        :param pks: the pks of the starting nodes
+        :param hops: the maximum number of links to follow
+        :param link_types: the types of the links to follow, by default all link types
+        :return: the sorted pks of the nodes in the neighbourhood, including the starting nodes
+        :raises: :class:`~aiida.common.exceptions.NotExistent` if any of the starting nodes is not in the snapshot
+        """
+        mask = self._get_mask(link_types)
+        return self._closure(pks, [(self._outgoing, mask), (self._incoming, mask)], hops)
+
+    def traverse(
+        self,
+        pks: Iterable[int],
+        links_forward: Iterable[LinkType] = (),
+        links_backward: Iterable[LinkType] = (),
+        max_iterations: Optional[int] = None
+    ) -> np.ndarray:
+        """Return the nodes connected to the given nodes through any sequence of the given links.
+
+        This applies the same rules as :func:`aiida.tools.graph.graph_traversers.traverse_graph`, such that the
+        traversal rules returned by :func:`aiida.tools.graph.graph_traversers.validate_traversal_rules` can be used.
+
+        :param pks: the pks of the starting nodes
+        :param links_forward: the types of the links to follow in the forward direction
+        :param links_backward: the types of the links to follow in the backward direction
+        :param max_iterations: the maximum number of times the rules are applied, by default until no nodes are added
+        :return: the sorted pks of the connected nodes, including the starting nodes
+        :raises: :class:`~aiida.common.exceptions.NotExistent` if any of the starting nodes is not in the snapshot
+        """
+        steps = [
+            (self._outgoing, self._get_mask(links_forward)),
+            (self._incoming, self._get_mask(links_backward)),
+        ]
+        return self._closure(pks, steps, max_iterations)
+
+    def get_incoming(self, pk: int, link_types: Optional[Iterable[LinkType]] = None) -> List[LinkQuadruple]:
+        """Return the incoming links of a node.
+
+        :param pk: the pk of the node
+        :param link_types: the types of the links to return, by default all link types
+        :raises: :class:`~aiida.common.exceptions.NotExistent` if the node is not in the snapshot
+        """
+        return self._get_links(self._incoming, pk, link_types)
+
+    def get_outgoing(self, pk: int, link_types: Optional[Iterable[LinkType]] = None) -> List[LinkQuadruple]:
+        """Return the outgoing links of a node.
+
+        :param pk: the pk of the node
+        :param link_types: the types of the links to return, by default all link types
+        :raises: :class:`~aiida.common.exceptions.NotExistent` if the node is not in the snapshot
+        """
+        return self._get_links(self._outgoing, pk, link_types)
+
+    def _add_links(self, links: Sequence[Tuple[int, int, int, str, str]]) -> None:
+        """Add the links, given as tuples of their id, source and target pk, type and label, to the snapshot."""
+        link_ids, source_ids, target_ids, link_types, labels = zip(*links)
+        type_index = {link_type.value: index for index, link_type in enumerate(LINK_TYPES)}
+        label_ids = [self._label_index.setdefault(label, len(self._label_index)) for label in labels]
+        self._labels.extend(list(self._label_index)[len(self._labels):])
+
+        self._link_ids = np.concatenate((self._link_ids, np.array(link_ids, dtype=np.int64)))
+        self._source_ids = np.concatenate((self._source_ids, np.array(source_ids, dtype=np.int64)))
+        self._target_ids = np.concatenate((self._target_ids, np.array(target_ids, dtype=np.int64)))
+        self._link_types = np.concatenate(
+            (self._link_types, np.array([type_index[link_type] for link_type in link_types], dtype=np.uint8))
+        )
+        self._label_ids = np.concatenate((self._label_ids, np.array(label_ids, dtype=np.int32)))
+        self._last_link_id = int(self._link_ids.max())
+
+        # Nodes that were stored after the last refresh but with an older ``ctime`` are only known through their links
+        self._node_ids = np.union1d(self._node_ids, np.union1d(self._source_ids, self._target_ids))
+
+    @staticmethod
+    def _get_mask(link_types: Optional[Iterable[LinkType]]) -> np.ndarray:
+        """Return a boolean mask over :data:`LINK_TYPES` of the link types that should be followed."""
+        if link_types is None:
+            return np.ones(len(LINK_TYPES), dtype=bool)
+
+        mask = np.zeros(len(LINK_TYPES), dtype=bool)
+        for link_type in link_types:
+            if not isinstance(link_type, LinkType):
+                raise TypeError(f'link_types should contain links, but one of them is: {type(link_type)}')
+            mask[LINK_TYPES.index(link_type)] = True
+        return mask
+
+    def _get_indices(self, pks: Iterable[int]) -> np.ndarray:
+        """Return the indices in the snapshot of the nodes with the given pks."""
+        pks = np.unique(np.fromiter(pks, dtype=np.int64))
+        indices = np.searchsorted(self._node_ids, pks)
+        found = indices < len(self._node_ids)
+        found[found] = self._node_ids[indices[found]] == pks[found]
+        if not found.all():
+            raise exceptions.NotExistent(f'The following pks are not in the snapshot: {set(pks[~found].tolist())}')
+        return indices
+
+    def _get_links(self, links: _CompressedLinks, pk: int, link_types: Optional[Iterable[LinkType]]):
+        """Return the links of a node in the given direction as a list of link quadruples."""
+        index = self._get_indices([pk])[0]
+        positions = np.arange(links.indptr[index], links.indptr[index + 1])
+        positions = positions[self._get_mask(link_types)[links.link_types[positions]]]
+        return [
+            LinkQuadruple(
+                int(self._source_ids[link]), int(self._target_ids[link]), LINK_TYPES[self._link_types[link]],
+                self._labels[self._label_ids[link]]
+            ) for link in links.links[positions]
+        ]
+
+    def _closure(
+        self,
+        pks: Iterable[int],
+        steps: Sequence[Tuple[_CompressedLinks, np.ndarray]],
+        max_hops: Optional[int] = None,
+        include_start: bool = True
+    ) -> np.ndarray:
+        """Return the nodes that can be reached from the given nodes.
+
+        In each hop, the links of every step are followed from the nodes that were added in the previous hop.
+
+        :param pks: the pks of the starting nodes
+        :param steps: tuples of the links to follow and the mask of the link types to follow
+        :param max_hops: the maximum number of hops, by default until no nodes are added
+        :param include_start: whether to include the starting nodes if they are not reached through any link
+        """
+        start = self._get_indices(pks)
+        reached = np.zeros(len(self._node_ids), dtype=bool)
+        visited = np.zeros(len(self._node_ids), dtype=bool)
+        visited[start] = True
+        frontier = start
+        hops = 0
+
+        while frontier.size and (max_hops is None or hops < max_hops):
+            neighbours = np.concatenate([self._follow(links, mask, frontier) for links, mask in steps])
+            reached[neighbours] = True
+            frontier = np.unique(neighbours[~visited[neighbours]])
+            visited[frontier] = True
+            hops += 1
+
+        if include_start:
+            return self._node_ids[visited]
+
+        return self._node_ids[reached]
+
+    @staticmethod
+    def _follow(links: _CompressedLinks, mask: np.ndarray, frontier: np.ndarray) -> np.ndarray:
+        """Return the indices of the nodes linked to the nodes in the frontier through a link type in the mask."""
+        starts = links.indptr[frontier]
+        counts = links.indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if not total or not mask.any():
+            return np.empty(0, dtype=np.int64)
+
+        # The positions of all links of the frontier: each range ``starts[i]:starts[i] + counts[i]`` concatenated
+        positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        return links.neighbours[positions[mask[links.link_types[positions]]]]
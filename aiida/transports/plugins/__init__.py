@@ -15,8 +15,10 @@
 # pylint: disable=wildcard-import
 
 from .ssh import *
+from .ssh_multiplexed import *
 
 __all__ = (
+    'SshMultiplexedTransport',
     'SshTransport',
     'convert_to_bool',
     'parse_sshconfig',
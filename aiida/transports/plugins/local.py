@@ -55,6 +55,9 @@ class LocalTransport(Transport):
     # a small finite number that should prevent the CPUs from spinning while still guaranteeing fast throughput.
     DEFAULT_MINIMUM_JOB_POLL_INTERVAL = 0.1
 
+    SUPPORTS_ARCHIVE_UPLOAD = True
+    SUPPORTS_BATCHED_GLOB = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # The `_internal_dir` will emulate the concept of working directory, as the real current working directory is
@@ -497,6 +500,16 @@ class LocalTransport(Transport):
 
         shutil.copyfile(the_source, localpath)
 
+    @contextlib.contextmanager
+    def get_object_stream(self, remotepath):
+        """Return a context manager that yields a binary stream with the content of a file.
+
+        :param str remotepath: path to the file
+        :return: the file opened in binary mode for reading
+        """
+        with open(os.path.join(self.curdir, remotepath), 'rb') as handle:
+            yield handle
+
     def gettree(self, remotepath, localpath, *args, **kwargs):
         """
         Copies a folder recursively from 'remote' remotepath to
@@ -798,7 +811,8 @@ class LocalTransport(Transport):
 
                     filelike_stdin = line_encoder(stdin)
                 elif isinstance(stdin, io.BufferedIOBase):
-                    filelike_stdin = stdin
+                    # Binary streams are written in fixed size chunks, since they need not contain any newlines
+                    filelike_stdin = iter(lambda: stdin.read(self._STDIN_CHUNK_SIZE), b'')
                 else:
                     raise ValueError('You can only pass strings, bytes, BytesIO or StringIO objects')
 
@@ -9,11 +9,15 @@
 ###########################################################################
 """Plugin for transport over SSH (and SFTP for file transfer)."""
 # pylint: disable=too-many-lines
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextlib
 import glob
 import io
 import os
+import queue
 import re
-from stat import S_ISDIR, S_ISREG
+from stat import S_ISDIR, S_ISLNK, S_ISREG
+import time
 
 import click
 import paramiko
@@ -63,6 +67,12 @@ def convert_to_bool(string):
     raise ValueError('Invalid boolean value provided')
 
 
+def _format_throughput(size, duration):
+    """Return a string with the number of bytes transferred in the given duration and the corresponding throughput."""
+    throughput = size / duration / 1e6 if duration > 0 else float('inf')
+    return f'{size} bytes in {duration:.3f} s ({throughput:.2f} MB/s)'
+
+
 class SshTransport(Transport):  # pylint: disable=too-many-public-methods
     """
     Support connection, command execution and data transfer to remote computers via SSH+SFTP.
@@ -215,7 +225,17 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
                 'help': 'SSH key policy if host is not known.',
                 'non_interactive_default': True
             }
-        )
+        ),
+        (
+            'transfer_concurrency', {
+                'default': 1,
+                'type': click.IntRange(min=1),
+                'prompt': 'Number of concurrent file transfers',
+                'help': 'Maximum number of files that are transferred concurrently, each over its own SFTP channel, when '
+                'copying folders with `gettree` and `puttree`.',
+                'non_interactive_default': True
+            }
+        ),
     ]
 
     # Max size of log message to print in _exec_command_internal.
@@ -223,6 +243,9 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
     # if too large commands are sent, clogging the outputs or logs
     _MAX_EXEC_COMMAND_LOG_SIZE = None
 
+    SUPPORTS_ARCHIVE_UPLOAD = True
+    SUPPORTS_BATCHED_GLOB = True
+
     @classmethod
     def _get_username_suggestion_string(cls, computer):
         """
@@ -350,6 +373,13 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
         """
         return 'RejectPolicy'
 
+    @classmethod
+    def _get_transfer_concurrency_suggestion_string(cls, computer):  # pylint: disable=unused-argument
+        """
+        Return a suggestion for the specific field.
+        """
+        return '1'
+
     @classmethod
     def _get_gss_auth_suggestion_string(cls, computer):
         """
@@ -391,6 +421,8 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
            if False, do not load the system host keys
         :param key_policy: (optional, default = paramiko.RejectPolicy())
            the policy to use for unknown keys
+        :param transfer_concurrency: (optional, default 1)
+           the maximum number of files transferred concurrently by gettree and puttree
 
         Other parameters valid for the ssh connect function (see the
         self._valid_connect_params list) are passed to the connect
@@ -410,6 +442,8 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
         if self._load_system_host_keys:
             self._client.load_system_host_keys()
 
+        self._transfer_concurrency = kwargs.pop('transfer_concurrency', 1)
+
         self._missing_key_policy = kwargs.pop('key_policy', 'RejectPolicy')  # This is paramiko default
         if self._missing_key_policy == 'RejectPolicy':
             self._client.set_missing_host_key_policy(paramiko.RejectPolicy())
@@ -571,6 +605,14 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
 
         self._is_open = False
 
+    def is_alive(self):
+        """Return whether the transport is open and its SSH connection is still active."""
+        if not self._is_open:
+            return False
+
+        transport = self._client.get_transport()
+        return transport is not None and transport.is_active()
+
     @property
     def sshclient(self):
         if not self._is_open:
@@ -971,6 +1013,9 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
             remotepath = os.path.join(remotepath, os.path.split(localpath)[1])
             self.mkdir(remotepath)  # create a nested folder
 
+        # The folders are created first, after which all files are transferred at once, possibly concurrently
+        transfers = []
+
         for this_source in os.walk(localpath):
             # Get the relative path
             this_basename = os.path.relpath(path=this_source[0], start=localpath)
@@ -987,7 +1032,9 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
             for this_file in this_source[2]:
                 this_local_file = os.path.join(localpath, this_basename, this_file)
                 this_remote_file = os.path.join(remotepath, this_basename, this_file)
-                self.putfile(this_local_file, this_remote_file)
+                transfers.append((this_local_file, this_remote_file))
+
+        self._transfer_files(transfers, put=True)
 
     def get(self, remotepath, localpath, callback=None, dereference=True, overwrite=True, ignore_nonexisting=False):  # pylint: disable=too-many-branches,arguments-differ,too-many-arguments
         """
@@ -1085,6 +1132,21 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
                 pass
             raise
 
+    @contextlib.contextmanager
+    def get_object_stream(self, remotepath):
+        """Return a context manager that yields a binary stream with the content of a remote file.
+
+        The file is read directly through SFTP, prefetching its content in the background.
+
+        :param str remotepath: path to the remote file
+        :return: a buffered binary file-like object open for reading
+        """
+        with self.sftp.open(remotepath, 'rb') as handle:
+            handle.prefetch()
+            # The SFTP file is wrapped to make it a proper ``io.BufferedIOBase`` instance
+            with io.BufferedReader(handle) as stream:
+                yield stream
+
     def gettree(self, remotepath, localpath, callback=None, dereference=True, overwrite=True):  # pylint: disable=arguments-differ,unused-argument
         """
         Get a folder recursively from remote to local.
@@ -1126,16 +1188,145 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
             localpath = os.path.join(localpath, os.path.split(remotepath)[1])
             os.mkdir(localpath)  # create a nested folder
 
-        item_list = self.listdir(remotepath)
-        dest = str(localpath)
+        # The folders are created first, after which all files are transferred at once, possibly concurrently
+        transfers = []
+        self._collect_tree_transfers(remotepath, str(localpath), transfers)
+        self._transfer_files(transfers, put=False)
+
+    def _collect_tree_transfers(self, remotepath, localpath, transfers):
+        """Recursively create the local folders of a remote folder and collect the files to transfer.
 
-        for item in item_list:
-            item = str(item)
+        :param remotepath: the remote folder
+        :param localpath: the existing local folder corresponding to the remote folder
+        :param transfers: list to which the tuples of the remote and local path of each file are appended
+        """
+        # The attributes of all items are returned by a single request, but they are those of the link for symlinks
+        for attributes in self.sftp.listdir_attr(remotepath):
+            this_remote = os.path.join(remotepath, attributes.filename)
+            this_local = os.path.join(localpath, attributes.filename)
+
+            if S_ISLNK(attributes.st_mode):
+                is_dir = self.isdir(this_remote)
+            else:
+                is_dir = S_ISDIR(attributes.st_mode)
 
-            if self.isdir(os.path.join(remotepath, item)):
-                self.gettree(os.path.join(remotepath, item), os.path.join(dest, item))
+            if is_dir:
+                os.makedirs(this_local, exist_ok=True)
+                self._collect_tree_transfers(this_remote, this_local, transfers)
             else:
-                self.getfile(os.path.join(remotepath, item), os.path.join(dest, item))
+                transfers.append((this_remote, this_local))
+
+    def _transfer_files(self, transfers, put=False):
+        """Transfer a list of files, concurrently over multiple SFTP channels if ``transfer_concurrency`` is above one.
+
+        Each additional SFTP channel is opened on the existing SSH connection. Paramiko already pipelines the requests
+        within a single file transfer, prefetching the content for ``get`` and not waiting for acknowledgements for
+        ``put``. The throughput of each file and of all files together is logged.
+
+        The files are transferred one by one through ``putfile`` or ``getfile`` if the transfers are not concurrent or
+        if a subclass overrides these methods. Otherwise, the checks of these methods are performed for each file by
+        ``_transfer_file``. If a transfer fails, the transfers that did not start yet are cancelled.
+
+        :param transfers: list of tuples with the source and destination path of each file
+        :param put: if True, the files are copied from local to remote, otherwise from remote to local
+        """
+        if not transfers:
+            return
+
+        # Additional SFTP channels do not share the current working directory, so remote paths are made absolute
+        cwd = self.getcwd()
+        if put:
+            transfers = [(source, os.path.join(cwd, destination)) for source, destination in transfers]
+        else:
+            transfers = [(os.path.join(cwd, source), destination) for source, destination in transfers]
+
+        method = 'putfile' if put else 'getfile'
+        concurrency = min(self._transfer_concurrency, len(transfers))
+        start = time.monotonic()
+        total_size = 0
+
+        if concurrency > 1 and getattr(type(self), method) is not getattr(SshTransport, method):
+            # The files are transferred through the method of the subclass, which can only use the main SFTP channel
+            concurrency = 1
+
+        if concurrency <= 1:
+            for source, destination in transfers:
+                start_file = time.monotonic()
+                getattr(self, method)(source, destination)
+                size = os.path.getsize(source if put else destination)
+                total_size += self._log_transfer(source, destination, size, time.monotonic() - start_file)
+        else:
+            channels = queue.SimpleQueue()
+            opened = []
+
+            def transfer(source, destination):
+                sftp = channels.get()
+                try:
+                    return self._transfer_file(sftp, source, destination, put)
+                finally:
+                    channels.put(sftp)
+
+            try:
+                for _ in range(concurrency):
+                    sftp = self._open_sftp()
+                    opened.append(sftp)
+                    channels.put(sftp)
+
+                with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='aiida-sftp') as executor:
+                    futures = [executor.submit(transfer, source, destination) for source, destination in transfers]
+                    try:
+                        # The results are logged in this thread, since log handlers may not be safe to use in others
+                        for future in as_completed(futures):
+                            total_size += self._log_transfer(*future.result())
+                    except Exception:
+                        for future in futures:
+                            future.cancel()
+                        raise
+            finally:
+                for sftp in opened:
+                    sftp.close()
+
+        self.logger.debug(
+            f"{'put' if put else 'get'} of {len(transfers)} files with concurrency {concurrency}: "
+            f'{_format_throughput(total_size, time.monotonic() - start)}'
+        )
+
+    def _open_sftp(self):
+        """Open a new SFTP client on the SSH connection, in addition to the one returned by the ``sftp`` property."""
+        return self.sshclient.open_sftp()
+
+    @staticmethod
+    def _transfer_file(sftp, source, destination, put):
+        """Transfer a single file over the given SFTP client, performing the same checks as ``putfile`` and ``getfile``.
+
+        :return: tuple of the source, destination, size in bytes and duration in seconds of the transfer
+        :raise ValueError: if the local path is not absolute
+        """
+        if not os.path.isabs(source if put else destination):
+            raise ValueError('The localpath must be an absolute path')
+
+        start = time.monotonic()
+
+        if put:
+            size = sftp.put(source, destination).st_size
+        else:
+            # Workaround for bug #724 in paramiko -- remove localpath on IOError
+            try:
+                sftp.get(source, destination)
+            except IOError:
+                try:
+                    os.remove(destination)
+                except OSError:
+                    pass
+                raise
+            size = os.path.getsize(destination)
+
+        return source, destination, size, time.monotonic() - start
+
+    def _log_transfer(self, source, destination, size, duration):
+        """Log the throughput of a single file transfer and return its size."""
+        self.logger.debug(f'transferred {source} to {destination}: {_format_throughput(size, duration)}')
+        return size
 
     def get_attribute(self, path):
         """
@@ -1396,7 +1587,10 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
                 filelike_stdin = io.StringIO(stdin)
             elif isinstance(stdin, bytes):
                 filelike_stdin = io.BytesIO(stdin)
-            elif isinstance(stdin, (io.BufferedIOBase, io.TextIOBase)):
+            elif isinstance(stdin, io.BufferedIOBase):
+                # Binary streams are written in fixed size chunks, since they need not contain any newlines
+                filelike_stdin = iter(lambda: stdin.read(self._STDIN_CHUNK_SIZE), b'')
+            elif isinstance(stdin, io.TextIOBase):
                 # It seems both StringIO and BytesIO work correctly when doing ssh_stdin.write(line)?
                 # (The ChannelFile is opened with mode 'b', but until now it always has been a StringIO)
                 filelike_stdin = stdin
@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Plugin for transport over SSH connections that are multiplexed over a shared OpenSSH master connection."""
+import fcntl
+import getpass
+import hashlib
+import io
+import os
+import subprocess
+import tempfile
+import threading
+
+import click
+import paramiko
+
+from aiida.common.escaping import escape_for_bash
+
+from .ssh import SshTransport
+
+__all__ = ('SshMultiplexedTransport',)
+
+
+class _ProcessSocket:
+    """Socket-like interface to the standard input and output of a process, as used by ``paramiko.SFTPClient``.
+
+    Contrary to ``paramiko.ProxyCommand``, reading returns an empty bytestring when the process closes its output, such
+    that the SFTP client raises an ``EOFError`` instead of waiting indefinitely.
+    """
+
+    def __init__(self, process):
+        self.process = process
+
+    def send(self, content):
+        return self.process.stdin.write(content)
+
+    def recv(self, size):
+        return os.read(self.process.stdout.fileno(), size)
+
+    def get_name(self):
+        return f'sftp-{self.process.pid}'
+
+    def close(self):
+        self.process.stdin.close()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()
+
+
+class SshMultiplexedTransport(SshTransport):
+    """
+    Support connection, command execution and data transfer to remote computers via a shared OpenSSH connection.
+
+    All transports for the same computer and connection options, also those opened by different processes such as the
+    daemon workers, share a single OpenSSH master connection (``ControlMaster``). It is opened by the first transport
+    and kept alive for ``control_persist`` seconds after the last transport using it is closed. Commands are executed
+    over new sessions of the master connection and files are transferred over its SFTP subsystem, such that opening a
+    transport does not require a new login on the remote computer while the master connection is alive.
+
+    The ``ssh`` client also reads the OpenSSH configuration file, e.g. ``~/.ssh/config``, but the options configured for
+    the computer take precedence. Since the client cannot prompt for a password, the authentication needs to be
+    non-interactive, for example with a key loaded in an SSH agent.
+    """
+
+    # Opening a transport only starts a new login on the remote computer if the master connection is not alive, which
+    # is done by a single transport at a time across all processes, so transports can be opened much more often.
+    _DEFAULT_SAFE_OPEN_INTERVAL = 1.0
+
+    # The OpenSSH client executable
+    _SSH_EXECUTABLE = 'ssh'
+
+    _valid_connect_options = [
+        option for option in SshTransport._valid_connect_options
+        if option[0] in ['username', 'port', 'key_filename', 'timeout', 'proxy_jump', 'proxy_command', 'compress']
+    ]
+
+    _valid_connect_params = [i[0] for i in _valid_connect_options]
+
+    _valid_auth_options = _valid_connect_options + [
+        (
+            'control_persist', {
+                'default': 600,
+                'type': click.IntRange(min=0),
+                'prompt': 'Shared connection keep-alive time (s)',
+                'help': 'Time in seconds that the shared master connection is kept open after the last transport using '
+                'it is closed. Use 0 to keep it open indefinitely.',
+                'non_interactive_default': True
+            }
+        ),
+    ] + [option for option in SshTransport._valid_auth_options if option[0] == 'transfer_concurrency']
+
+    # Number of times that transports of this process opened a new master connection or reused an existing one,
+    # keyed by the connection string of the transport
+    _connection_statistics: dict = {}
+
+    @classmethod
+    def _get_control_persist_suggestion_string(cls, computer):  # pylint: disable=unused-argument
+        """
+        Return a suggestion for the specific field.
+        """
+        return '600'
+
+    @classmethod
+    def get_connection_statistics(cls):
+        """Return the number of master connections opened and reused by the transports of this process.
+
+        :return: mapping of the connection string, i.e. ``username@hostname:port``, onto a dictionary with the number
+            of times a master connection was ``opened`` or ``reused`` when opening a transport.
+        """
+        return {key: dict(statistics) for key, statistics in cls._connection_statistics.items()}
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the SshMultiplexedTransport class.
+
+        :param machine: the machine to connect to
+        :param control_persist: (optional, default 600)
+           the time in seconds that the master connection is kept open after its last use, 0 keeps it open indefinitely
+        :param transfer_concurrency: (optional, default 1)
+           the maximum number of files transferred concurrently by gettree and puttree
+
+        Other parameters valid for the ssh connect function (see the self._valid_connect_params list) are converted to
+        the corresponding options of the OpenSSH client.
+        """
+        self._control_persist = kwargs.pop('control_persist', 600)
+        super().__init__(*args, **kwargs)
+
+        options = repr(sorted(self._connect_args.items()))
+        digest = hashlib.sha256(f'{self._machine}{options}'.encode('utf-8')).hexdigest()
+
+        # Unix sockets have a maximum path length of around 100 characters, so the temporary directory is used
+        self._control_path = os.path.join(tempfile.gettempdir(), f'aiida-ssh-{getpass.getuser()}', digest[:16])
+
+    @property
+    def connection_string(self):
+        """Return the string ``username@hostname:port`` that identifies the master connection."""
+        username = self._connect_args.get('username', None)
+        port = self._connect_args.get('port', None)
+        return f"{f'{username}@' if username else ''}{self._machine}{f':{port}' if port else ''}"
+
+    def _get_ssh_command(self, *arguments, batch_mode=True):
+        """Return the OpenSSH client command that connects through the master connection to the machine.
+
+        :param arguments: additional arguments for the client, placed before the machine.
+        :param batch_mode: if True, the client never prompts for passwords or confirmations.
+        :return: list of the command line arguments, to which the remote command can be appended.
+        """
+        command = [self._SSH_EXECUTABLE, '-o', f'ControlPath={self._control_path}']
+
+        if batch_mode:
+            command.extend(['-o', 'BatchMode=yes'])
+
+        if self._connect_args.get('username'):
+            command.extend(['-l', self._connect_args['username']])
+
+        if self._connect_args.get('port'):
+            command.extend(['-p', str(self._connect_args['port'])])
+
+        if self._connect_args.get('key_filename'):
+            command.extend(['-i', self._connect_args['key_filename']])
+
+        if self._connect_args.get('timeout'):
+            command.extend(['-o', f"ConnectTimeout={self._connect_args['timeout']}"])
+
+        if self._connect_args.get('proxy_jump'):
+            command.extend(['-J', self._connect_args['proxy_jump']])
+
+        if self._connect_args.get('proxy_command'):
+            command.extend(['-o', f"ProxyCommand={self._connect_args['proxy_command']}"])
+
+        if self._connect_args.get('compress'):
+            command.append('-C')
+
+        command.extend(arguments)
+        command.append(self._machine)
+
+        return command
+
+    def _is_master_running(self):
+        """Return whether the master connection is alive."""
+        process = subprocess.run(  # pylint: disable=subprocess-run-check
+            self._get_ssh_command('-O', 'check'),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return process.returncode == 0
+
+    def _ensure_master_connection(self):
+        """Open the master connection unless it is already alive.
+
+        The check and opening are done while holding a lock on a file next to the control socket, such that when
+        multiple processes open a transport to the same computer at the same time, only a single master connection is
+        opened, which is then reused by the others.
+
+        :raise OSError: if the master connection could not be opened.
+        """
+        os.makedirs(os.path.dirname(self._control_path), mode=0o700, exist_ok=True)
+        statistics = self._connection_statistics.setdefault(self.connection_string, {'opened': 0, 'reused': 0})
+
+        with open(f'{self._control_path}.lock', 'w', encoding='utf-8') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+
+            if self._is_master_running():
+                statistics['reused'] += 1
+                self.logger.debug(f'reusing shared connection to {self.connection_string}: {statistics}')
+                return
+
+            # The master connection is forked to the background after authentication, but it keeps its standard error
+            # open, so it is written to a file instead of a pipe, which would not be closed when the client returns.
+            with tempfile.TemporaryFile() as stderr:
+                process = subprocess.run(  # pylint: disable=subprocess-run-check
+                    self._get_ssh_command(
+                        '-o', 'ControlMaster=yes', '-o', f'ControlPersist={self._control_persist}', '-N', '-f'
+                    ),
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr,
+                    start_new_session=True,
+                )
+
+                if process.returncode != 0:
+                    stderr.seek(0)
+                    message = stderr.read().decode('utf-8', errors='replace').strip()
+                    raise OSError(f'failed to open the shared connection to {self.connection_string}: {message}')
+
+            statistics['opened'] += 1
+            self.logger.info(f'opened shared connection to {self.connection_string}: {statistics}')
+
+    def _open_sftp(self):
+        """Open a new SFTP client over the SFTP subsystem of the master connection."""
+        process = subprocess.Popen(  # pylint: disable=consider-using-with
+            self._get_ssh_command('-o', 'ControlMaster=no', '-s') + ['sftp'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            start_new_session=True,
+        )
+        sock = _ProcessSocket(process)
+
+        try:
+            return paramiko.SFTPClient(sock)
+        except Exception:
+            sock.close()
+            raise
+
+    def open(self):
+        """
+        Open the master connection to the machine, if it is not already alive, and an SFTP channel over it.
+
+        The current working directory is set explicitly, so it is not None.
+
+        :raise aiida.common.InvalidOperation: if the channel is already open
+        """
+        from paramiko.ssh_exception import SSHException
+
+        from aiida.common.exceptions import InvalidOperation
+
+        if self._is_open:
+            raise InvalidOperation('Cannot open the transport twice')
+
+        self._ensure_master_connection()
+
+        try:
+            self._sftp = self._open_sftp()
+        except (SSHException, EOFError):
+            raise InvalidOperation(
+                f'Error in ssh_multiplexed transport plugin: could not open an SFTP channel to {self.connection_string}.'
+                ' This may be due to the remote computer not supporting SFTP.'
+            )
+
+        self._is_open = True
+
+        # Set the current directory to a explicit path, and not to None
+        self._sftp.chdir(self._sftp.normalize('.'))
+
+        return self
+
+    def close(self):
+        """
+        Close the SFTP channel. The master connection is kept alive for the ``control_persist`` time.
+
+        :raise aiida.common.InvalidOperation: if the channel is already closed
+        """
+        from aiida.common.exceptions import InvalidOperation
+
+        if not self._is_open:
+            raise InvalidOperation('Cannot close the transport: it is already closed')
+
+        self._sftp.close()
+        self._is_open = False
+
+    def is_alive(self):
+        """Return whether the transport is open and its SFTP channel, and so the master connection, is still active."""
+        return self._is_open and self._sftp.sock.process.poll() is None
+
+    def _exec_command_internal(self, command, combine_stderr=False, bufsize=-1):  # pylint: disable=arguments-differ
+        """
+        Executes the specified command in bash login shell, in a new session of the master connection.
+
+        Before the command is executed, changes directory to the current
+        working directory as returned by self.getcwd().
+
+        For executing commands and waiting for them to finish, use
+        exec_command_wait.
+
+        :param  command: the command to execute. The command is assumed to be
+            already escaped using :py:func:`aiida.common.escaping.escape_for_bash`.
+        :param combine_stderr: (default False) if True, combine stdout and
+                stderr on the same buffer (i.e., stdout).
+                Note: If combine_stderr is True, stderr will be None.
+        :param bufsize: same meaning of the one used by subprocess.Popen.
+
+        :return: a tuple with (stdin, stdout, stderr, process),
+            where stdin, stdout and stderr are the byte streams of the
+            process object as returned by the subprocess.Popen() class.
+        """
+        if self.getcwd() is not None:
+            escaped_folder = escape_for_bash(self.getcwd())
+            command_to_execute = f'cd {escaped_folder} && ( {command} )'
+        else:
+            command_to_execute = command
+
+        self.logger.debug(f'Command to be executed: {command_to_execute[:self._MAX_EXEC_COMMAND_LOG_SIZE]}')
+
+        # Note: The remote shell will eat one level of escaping, while
+        # 'bash -l -c ...' will eat another. Thus, we need to escape again.
+        bash_commmand = self._bash_command_str + '-c '
+
+        process = subprocess.Popen(  # pylint: disable=consider-using-with
+            self._get_ssh_command('-o', 'ControlMaster=no') + [bash_commmand + escape_for_bash(command_to_execute)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if combine_stderr else subprocess.PIPE,
+            bufsize=bufsize,
+            start_new_session=True,
+        )
+
+        return process.stdin, process.stdout, process.stderr, process
+
+    def exec_command_wait_bytes(self, command, stdin=None, combine_stderr=False, bufsize=-1):  # pylint: disable=arguments-differ
+        """
+        Executes the specified command and waits for it to finish.
+
+        :param command: the command to execute
+        :param stdin: (optional,default=None) can be a string or a
+                   file-like object.
+        :param combine_stderr: (optional, default=False) see docstring of
+                   self._exec_command_internal()
+        :param bufsize: same meaning of subprocess.Popen.
+
+        :return: a tuple with (return_value, stdout, stderr) where stdout and stderr
+            are both bytes and the return_value is an int.
+        """
+        if stdin is None:
+            filelike_stdin = []
+        elif isinstance(stdin, str):
+            filelike_stdin = [stdin.encode('utf-8')]
+        elif isinstance(stdin, bytes):
+            filelike_stdin = [stdin]
+        elif isinstance(stdin, io.BufferedIOBase):
+            # Binary streams are written in fixed size chunks, since they need not contain any newlines
+            filelike_stdin = iter(lambda: stdin.read(self._STDIN_CHUNK_SIZE), b'')
+        elif isinstance(stdin, io.TextIOBase):
+            filelike_stdin = (line.encode('utf-8') for line in stdin)
+        else:
+            raise ValueError('You can only pass strings, bytes, BytesIO or StringIO objects')
+
+        ssh_stdin, _, _, process = self._exec_command_internal(command, combine_stderr, bufsize=bufsize)
+
+        def write_stdin():
+            try:
+                for chunk in filelike_stdin:
+                    ssh_stdin.write(chunk)
+            except BrokenPipeError:
+                # The command exited without reading all of its input
+                pass
+            finally:
+                try:
+                    ssh_stdin.close()
+                except BrokenPipeError:
+                    pass
+
+        with process:
+            # The input is written in a separate thread while the output is read, since the command may block on
+            # writing its output before it has read all of its input. The stdin is detached from the process, such that
+            # ``communicate`` does not close it while it is still being written.
+            process.stdin = None
+            writer = threading.Thread(target=write_stdin, daemon=True)
+            writer.start()
+            stdout_bytes, stderr_bytes = process.communicate()
+            writer.join()
+
+        return process.returncode, stdout_bytes, stderr_bytes or b''
+
+    def gotocomputer_command(self, remotedir):
+        """
+        Specific gotocomputer string to connect to a given remote computer via
+        ssh and directly go to the calculation folder, reusing the master connection if it is alive.
+        """
+        command = ' '.join(escape_for_bash(argument) for argument in self._get_ssh_command('-t', batch_mode=False))
+        connect_string = self._gotocomputer_string(remotedir)
+        return f'{command} {connect_string}'
@@ -10,10 +10,12 @@
 """Transport interface."""
 import abc
 from collections import OrderedDict
+import contextlib
 import fnmatch
 import os
 import re
 import sys
+import tempfile
 
 from aiida.common.exceptions import InternalError
 from aiida.common.lang import classproperty
@@ -47,10 +49,23 @@ class Transport(abc.ABC):
     # but this should  be redefined in plugins where appropriate
     _DEFAULT_SAFE_OPEN_INTERVAL = 30.
 
+    # Whether the transport can unpack a tar archive streamed through the stdin of a remote command, see ``put_archive``.
+    # Plugins that can execute ``tar`` on the remote should set this to ``True``.
+    SUPPORTS_ARCHIVE_UPLOAD = False
+
+    # Whether the transport can expand all patterns passed to ``expand_paths`` with a single remote ``bash`` command.
+    # Otherwise, each pattern is expanded by ``glob``, which requires a number of ``listdir`` calls for each pattern.
+    # Plugins should only set this to ``True`` if their ``exec_command_wait_bytes`` runs the command with ``bash``.
+    SUPPORTS_BATCHED_GLOB = False
+
+    # Size in bytes of the chunks in which binary streams passed as ``stdin`` to ``exec_command_wait_bytes`` are written
+    _STDIN_CHUNK_SIZE = 2**16
+
     # To be defined in the subclass
     # See the ssh or local plugin to see the format
     _valid_auth_params = None
     _MAGIC_CHECK = re.compile('[*?[]')
+    _EXPAND_PATHS_MARKER = 'AIIDA_EXPAND_PATHS'
     _valid_auth_options: list = []
     _common_auth_options = [
         (
@@ -141,6 +156,17 @@ class Transport(abc.ABC):
     def is_open(self):
         return self._is_open
 
+    def is_alive(self):
+        """Return whether the transport is open and its connection is still usable.
+
+        This is used to check whether an open transport can be reused, so it should be cheap and not require a round
+        trip to the remote computer. Plugins whose connection can be lost while the transport is open should override
+        this method.
+
+        :return: True if the transport is open and can be used.
+        """
+        return self.is_open
+
     @abc.abstractmethod
     def open(self):
         """
@@ -449,6 +475,23 @@ class Transport(abc.ABC):
         :param localpath: (str) local_folder_path
         """
 
+    @contextlib.contextmanager
+    def get_object_stream(self, remotepath):
+        """Return a context manager that yields a binary stream with the content of a remote file.
+
+        This allows to pass the content of a remote file to a consumer, for example the file repository, without the
+        caller having to write it to a local file first. The default implementation still downloads the file to a
+        local temporary file, so plugins should override it if they can read the remote file directly.
+
+        :param str remotepath: path to the remote file
+        :return: a binary file-like object open for reading
+        """
+        with tempfile.TemporaryDirectory() as dirpath:
+            localpath = os.path.join(dirpath, os.path.basename(remotepath) or 'object')
+            self.getfile(remotepath, localpath)
+            with open(localpath, 'rb') as handle:
+                yield handle
+
     @abc.abstractmethod
     def getfile(self, remotepath, localpath, *args, **kwargs):
         """
@@ -642,6 +685,31 @@ class Transport(abc.ABC):
         :param str remotepath: path to remote folder
         """
 
+    def put_archive(self, handle, remotepath):
+        """Unpack a gzipped tar archive, streamed from a local binary file handle, into a remote folder.
+
+        The archive is sent through the stdin of a single remote ``tar`` command, which is much faster than putting
+        many small files one by one. The remote folder should already exist.
+
+        :param handle: a binary file-like object, positioned at the start of a gzipped tar archive
+        :param str remotepath: the remote folder in which to unpack the archive
+        :raises NotImplementedError: if the transport does not support archive uploads
+        :raises OSError: if the remote ``tar`` command fails
+        """
+        from aiida.common.escaping import escape_for_bash
+
+        if not self.SUPPORTS_ARCHIVE_UPLOAD:
+            raise NotImplementedError(f'the `{self.__class__.__name__}` transport does not support archive uploads')
+
+        command = f'tar -xzf - -C {escape_for_bash(remotepath)}'
+        retval, _, stderr = self.exec_command_wait_bytes(command, stdin=handle)
+
+        if retval != 0:
+            raise OSError(
+                f'unpacking the archive in `{remotepath}` failed with exit code {retval}: '
+                f'{stderr.decode("utf-8", errors="replace").strip()}'
+            )
+
     @abc.abstractmethod
     def remove(self, path):
         """
@@ -807,6 +875,73 @@ class Transport(abc.ABC):
             return [basename]
         return []
 
+    def expand_paths(self, pathnames):
+        """Expand the wildcards of a list of pathname patterns and determine which of the matching paths are folders.
+
+        Pathnames without wildcards are only checked for existence. If the transport supports it, as indicated by the
+        ``SUPPORTS_BATCHED_GLOB`` attribute, all patterns are expanded by a single remote command, such that the number
+        of round-trips does not grow with the number of patterns and matching paths. The remote command relies on the
+        pattern expansion of ``bash``, so the remote shell used to execute commands must be ``bash``. The results are
+        the same as those of ``glob``: in particular, wildcards never match the ``.`` and ``..`` entries of a folder,
+        which versions of ``bash`` before 5.2 do when a pattern starts with a dot.
+
+        :param list pathnames: the pathname patterns, which may contain simple shell-style wildcards a la fnmatch.
+        :return: dictionary mapping each pathname to the list of ``(path, is_dir)`` tuples of its existing matches.
+        """
+        if not self.SUPPORTS_BATCHED_GLOB:
+            return {pathname: [(path, self.isdir(path)) for path in self.glob(pathname)] for pathname in pathnames}
+
+        pathnames = list(pathnames)
+        results = {pathname: [] for pathname in pathnames}
+
+        if not pathnames:
+            return results
+
+        # The patterns are passed through stdin separated by null characters, so they do not need to be escaped. With
+        # an empty ``IFS`` the unquoted pattern is not split in words but still expanded, and ``nullglob`` makes that
+        # patterns without matches expand to nothing. Each pattern is followed by a separator record in the output.
+        command = (
+            f"shopt -s nullglob; printf '{self._EXPAND_PATHS_MARKER}\\0'; "
+            "while IFS= read -r -d '' pattern; do "
+            'IFS=; for path in $pattern; do '
+            'if [ -d "$path" ]; then printf \'d\\0%s\\0\' "$path"; '
+            'elif [ -e "$path" ]; then printf \'f\\0%s\\0\' "$path"; fi; '
+            "done; unset IFS; printf 'p\\0\\0'; done"
+        )
+        stdin = b''.join(pathname.encode('utf-8') + b'\0' for pathname in pathnames)
+        retval, stdout, stderr = self.exec_command_wait_bytes(command, stdin=stdin)
+
+        if retval != 0:
+            raise OSError(f'expanding the paths failed with exit code {retval}: {stderr.decode("utf-8").strip()}')
+
+        # Anything printed before the marker, for example by the login scripts of the shell, is discarded
+        _, _, output = stdout.partition(f'{self._EXPAND_PATHS_MARKER}\0'.encode('utf-8'))
+        fields = output.split(b'\0')
+        pathnames_iterator = iter(pathnames)
+        pathname = next(pathnames_iterator)
+
+        for kind, path in zip(fields[0::2], fields[1::2]):
+            if kind == b'p':
+                pathname = next(pathnames_iterator, None)
+            elif not self._is_dot_entry_match(pathname, path.decode('utf-8')):
+                results[pathname].append((path.decode('utf-8'), kind == b'd'))
+
+        return results
+
+    def _is_dot_entry_match(self, pattern, path):
+        """Return whether a wildcard of the pattern matched the ``.`` or ``..`` entry of a folder in the given path.
+
+        :param str pattern: the pathname pattern.
+        :param str path: a path that was matched by the pattern, which has as many components as the pattern.
+        """
+        pattern_parts = pattern.split('/')
+        path_parts = path.split('/')
+
+        if len(pattern_parts) != len(path_parts):
+            return False
+
+        return any(self.has_magic(part) and name in ('.', '..') for part, name in zip(pattern_parts, path_parts))
+
     def has_magic(self, string):
         return self._MAGIC_CHECK.search(string) is not None
 
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=unused-argument
+"""Performance benchmark tests for the traversal of the provenance graph.
+
+The purpose of these tests is to compare the traversal of the graph by the storage
+with the traversal by the rule engine, which expands the graph one hop at a time.
+"""
+import pytest
+
+from aiida.common.links import GraphTraversalRules, LinkType
+from aiida.engine import ProcessState
+from aiida.orm import CalcFunctionNode, Data
+from aiida.tools.graph.graph_traversers import traverse_graph, validate_traversal_rules
+
+
+def recursive_provenance(in_node, depth, breadth):
+    """Recursively build a provenance tree, returning the number of nodes that were created."""
+    if not in_node.is_stored:
+        in_node.store()
+    if depth < 1:
+        return 1
+    depth -= 1
+    count = 1
+    for _ in range(breadth):
+        calcfunc = CalcFunctionNode()
+        calcfunc.set_process_state(ProcessState.FINISHED)
+        calcfunc.base.links.add_incoming(in_node, link_type=LinkType.INPUT_CALC, link_label='input')
+        calcfunc.store()
+
+        out_node = Data()
+        out_node.base.links.add_incoming(calcfunc, link_type=LinkType.CREATE, link_label='output')
+        out_node.store()
+
+        calcfunc.seal()
+
+        count += 1 + recursive_provenance(out_node, depth, breadth)
+    return count
+
+
+TREE = {'small': (2, 3), 'medium': (3, 5), 'large': (4, 5)}
+TRAVERSAL = {'storage': True, 'rules': False}
+
+
+@pytest.mark.parametrize('storage_traversal', TRAVERSAL.values(), ids=TRAVERSAL.keys())
+@pytest.mark.parametrize('depth,breadth', TREE.values(), ids=TREE.keys())
+@pytest.mark.benchmark(group='graph-traversal')
+def test_traverse_graph(aiida_profile_clean, benchmark, depth, breadth, storage_traversal):
+    """Benchmark collecting all nodes of a provenance tree with the deletion rules, starting from its root."""
+    root_node = Data()
+    num_nodes = recursive_provenance(root_node, depth=depth, breadth=breadth)
+    rules = validate_traversal_rules(GraphTraversalRules.DELETE)
+
+    def _run():
+        return traverse_graph(
+            [root_node.pk],
+            get_links=True,
+            links_forward=rules['forward'],
+            links_backward=rules['backward'],
+            storage_traversal=storage_traversal,
+        )
+
+    result = benchmark.pedantic(_run, iterations=1, rounds=10, warmup_rounds=1)
+    assert len(result['nodes']) == num_nodes
+    assert len(result['links']) == num_nodes - 1
@@ -215,3 +215,34 @@ def test_daemon_status_worker_timeout(run_cli_command):
     )
     result = run_cli_command(cmd_daemon.status)
     assert literal in result.output
+
+
+@patch.object(DaemonClient, 'get_status', lambda *_, **__: {'status': 'running'})
+@patch.object(DaemonClient, 'get_daemon_info', get_daemon_info)
+@patch.object(DaemonClient, 'get_worker_info', get_worker_info)
+@patch.object(
+    DaemonClient, 'get_worker_status', lambda _, pids: {
+        pid: {
+            'tasks': {
+                'localhost': {
+                    'retrieve': {'running': 2, 'waiting': 0},
+                    'upload': {'running': 0, 'waiting': 5},
+                }
+            }
+        } for pid in pids
+    }
+)
+@patch('aiida.cmdline.utils.common.format_local_time', format_local_time)
+def test_daemon_status_worker_tasks(run_cli_command):
+    """Test `get_status` output includes the transport tasks of the workers."""
+    literal = textwrap.dedent(
+        """\
+        Transport tasks:
+          PID  Computer    Task        Running    Waiting
+        -----  ----------  --------  ---------  ---------
+         4990  localhost   retrieve          2          0
+         4990  localhost   upload            0          5
+        Use `verdi daemon [incr | decr] [num]` to increase / decrease the number of workers"""
+    )
+    result = run_cli_command(cmd_daemon.status)
+    assert literal in result.output
@@ -60,3 +60,15 @@ def test_get_status_timeout(stopped_daemon_client):
     """Test ``DaemonClient.get_status`` output when the circus daemon process cannot be reached."""
     with pytest.raises(DaemonTimeoutException, match='Connection to the daemon timed out.'):
         stopped_daemon_client.get_status()
+
+
+def test_worker_status(stopped_daemon_client):
+    """Test ``DaemonClient.write_worker_status``, ``get_worker_status`` and ``delete_worker_status``."""
+    status = {'tasks': {'localhost': {'upload': {'running': 1, 'waiting': 2}}}}
+
+    stopped_daemon_client.write_worker_status(1, status)
+    assert stopped_daemon_client.get_worker_status([1, 2]) == {1: status}
+
+    stopped_daemon_client.delete_worker_status(1)
+    stopped_daemon_client.delete_worker_status(2)
+    assert stopped_daemon_client.get_worker_status([1, 2]) == {}
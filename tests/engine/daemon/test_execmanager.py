@@ -18,7 +18,7 @@ import pytest
 
 from aiida.common.datastructures import CalcInfo, CodeInfo
 from aiida.engine.daemon import execmanager
-from aiida.orm import CalcJobNode, FolderData, SinglefileData
+from aiida.orm import CalcJobNode, FolderData, PortableCode, SinglefileData
 from aiida.transports.plugins.local import LocalTransport
 
 
@@ -165,6 +165,152 @@ def test_retrieve_files_from_list(
     assert serialize_file_hierarchy(target) == expected_hierarchy
 
 
+# yapf: disable
+
+@pytest.mark.parametrize('retrieve_list, expected_hierarchy', (
+    (['file_a.txt'], {'file_a.txt': 'file_a'}),
+    (['path'], {'path': {'file_b.txt': 'file_b', 'sub': {'file_c.txt': 'file_c', 'file_d.txt': 'file_d'}}}),
+    (['*/*.txt'], {'file_b.txt': 'file_b'}),
+    ([('path/sub/file_c.txt', '.', 3)], {'path': {'sub': {'file_c.txt': 'file_c'}}}),
+    ([('path/sub/file_c.txt', '.', 0)], {'file_c.txt': 'file_c'}),
+    ([('path/sub', '.', 1)], {'sub': {'file_c.txt': 'file_c', 'file_d.txt': 'file_d'}}),
+    ([('path/*', '.', 0)], {'file_b.txt': 'file_b', 'sub': {'file_c.txt': 'file_c', 'file_d.txt': 'file_d'}}),
+    ([('path/sub/*.txt', '.', None)], {'path': {'sub': {'file_c.txt': 'file_c', 'file_d.txt': 'file_d'}}}),
+    ([('path/sub', 'target', 1)], {'target': {'sub': {'file_c.txt': 'file_c', 'file_d.txt': 'file_d'}}}),
+    (['file_a.txt', 'file_u.txt', 'path/file_u.txt', ('path/sub/file_u.txt', '.', 3)], {'file_a.txt': 'file_a'}),
+))
+# yapf: enable
+def test_stream_retrieved_calculation(
+    aiida_localhost, tmp_path_factory, file_hierarchy, retrieve_list, expected_hierarchy
+):
+    """Test the ``stream_retrieved_calculation`` function.
+
+    The files should end up in the repository of the ``retrieved`` output exactly as they would with the sandbox folder
+    used by ``retrieve_calculation``, and the files of the ``retrieve_temporary_list`` in the temporary folder.
+    """
+    workdir = tmp_path_factory.mktemp('workdir')
+    retrieved_temporary_folder = tmp_path_factory.mktemp('temporary')
+    target = tmp_path_factory.mktemp('target')
+    create_file_hierarchy(file_hierarchy, workdir)
+
+    node = CalcJobNode(computer=aiida_localhost)
+    node.set_remote_workdir(str(workdir))
+    node.set_retrieve_list(retrieve_list)
+    node.set_retrieve_temporary_list(['path/sub/file_d.txt'])
+    node.store()
+
+    with LocalTransport() as transport:
+        execmanager.stream_retrieved_calculation(node, transport, str(retrieved_temporary_folder))
+
+    node.outputs.retrieved.base.repository.copy_tree(target)
+    assert serialize_file_hierarchy(target) == expected_hierarchy
+    assert serialize_file_hierarchy(retrieved_temporary_folder) == {'file_d.txt': 'file_d'}
+
+
+def test_stream_retrieved_calculation_failure(aiida_localhost, tmp_path_factory, file_hierarchy, monkeypatch):
+    """Test that no ``retrieved`` output is attached if streaming one of the files fails."""
+    workdir = tmp_path_factory.mktemp('workdir')
+    create_file_hierarchy(file_hierarchy, workdir)
+
+    node = CalcJobNode(computer=aiida_localhost)
+    node.set_remote_workdir(str(workdir))
+    node.set_retrieve_list(['file_a.txt', 'path'])
+    node.store()
+
+    def get_object_stream(self, path):
+        if path.endswith('file_c.txt'):
+            raise OSError('connection lost')
+        return original(self, path)
+
+    original = LocalTransport.get_object_stream
+    monkeypatch.setattr(LocalTransport, 'get_object_stream', get_object_stream)
+
+    with LocalTransport() as transport:
+        with pytest.raises(OSError, match='connection lost'):
+            execmanager.stream_retrieved_calculation(node, transport, str(tmp_path_factory.mktemp('temporary')))
+
+    assert not execmanager.is_retrieved(node)
+
+
+@pytest.mark.parametrize('retrieve_list, expected_hierarchy', (
+    (['file_a.txt', 'path/sub'], {'file_a.txt': 'file_a', 'sub': {'file_c.txt': 'file_c', 'file_d.txt': 'file_d'}}),
+    (['*.txt', ('path/sub/*c.txt', '.', 2)], {'file_a.txt': 'file_a', 'sub': {'file_c.txt': 'file_c'}}),
+    ([('path/*.txt', '.', None)], {'path': {'file_b.txt': 'file_b'}}),
+))
+def test_download_calculation(tmp_path_factory, file_hierarchy, retrieve_list, expected_hierarchy):
+    """Test that ``download_calculation`` resolves paths with respect to the working directory, not the cwd."""
+    source = tmp_path_factory.mktemp('source')
+    target = tmp_path_factory.mktemp('target')
+    target_temporary = tmp_path_factory.mktemp('target_temporary')
+
+    create_file_hierarchy(file_hierarchy, source)
+
+    with LocalTransport() as transport:
+        transport.chdir(tmp_path_factory.mktemp('other'))
+        execmanager.download_calculation(
+            transport, str(source), str(target), retrieve_list, str(target_temporary), ['path/file_b.txt']
+        )
+
+    assert serialize_file_hierarchy(target) == expected_hierarchy
+    assert serialize_file_hierarchy(target_temporary) == {'file_b.txt': 'file_b'}
+
+
+def test_upload_archive(fixture_sandbox, file_hierarchy, tmp_path_factory):
+    """Test the ``upload_archive`` function, which uploads portable code files and the sandbox as a single archive."""
+    dirpath_code = tmp_path_factory.mktemp('code')
+    create_file_hierarchy({'bin': {'code.sh': 'code'}, 'data': 'code_data', 'file_a.txt': 'code_a'}, dirpath_code)
+    code = PortableCode(filepath_executable='bin/code.sh', filepath_files=dirpath_code)
+
+    create_file_hierarchy(file_hierarchy, pathlib.Path(fixture_sandbox.abspath))
+    workdir = tmp_path_factory.mktemp('workdir')
+
+    with LocalTransport() as transport:
+        assert transport.SUPPORTS_ARCHIVE_UPLOAD
+        execmanager.upload_archive(transport, fixture_sandbox, str(workdir), [code])
+
+    # Files in the sandbox take precedence over those of the portable code
+    expected_hierarchy = {'bin': {'code.sh': 'code'}, 'data': 'code_data', **file_hierarchy}
+    assert serialize_file_hierarchy(workdir) == expected_hierarchy
+    assert os.access(workdir / 'bin' / 'code.sh', os.X_OK)
+
+
+@pytest.mark.parametrize('archive_upload', (True, False))
+def test_upload_calculation_archive_upload(
+    fixture_sandbox, node_and_calc_info, file_hierarchy, isolated_config, archive_upload
+):
+    """Test that ``upload_calculation`` uploads the same files regardless of the ``transport.archive_upload`` option."""
+    isolated_config.set_option('transport.archive_upload', archive_upload, scope=None)
+    create_file_hierarchy(file_hierarchy, pathlib.Path(fixture_sandbox.abspath))
+    node, calc_info = node_and_calc_info
+
+    with LocalTransport() as transport:
+        execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+
+    assert serialize_file_hierarchy(pathlib.Path(node.get_remote_workdir())) == file_hierarchy
+
+
+@pytest.mark.parametrize('archive_upload', (True, False))
+def test_upload_calculation_portable_code(
+    fixture_sandbox, node_and_calc_info, tmp_path_factory, isolated_config, archive_upload
+):
+    """Test that ``upload_calculation`` uploads the files of portable codes before the content of the sandbox."""
+    isolated_config.set_option('transport.archive_upload', archive_upload, scope=None)
+    dirpath_code = tmp_path_factory.mktemp('code')
+    create_file_hierarchy({'code.sh': 'code', 'file_a.txt': 'code_a'}, dirpath_code)
+    code = PortableCode(filepath_executable='code.sh', filepath_files=dirpath_code).store()
+    create_file_hierarchy({'file_a.txt': 'file_a'}, pathlib.Path(fixture_sandbox.abspath))
+
+    node, calc_info = node_and_calc_info
+    calc_info.codes_info[0].code_uuid = code.uuid
+
+    with LocalTransport() as transport:
+        execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+
+    workdir = pathlib.Path(node.get_remote_workdir())
+    assert serialize_file_hierarchy(workdir) == {'code.sh': 'code', 'file_a.txt': 'file_a'}
+    assert os.access(workdir / 'code.sh', os.X_OK)
+
+
 # yapf: disable
 
 @pytest.mark.parametrize(('local_copy_list', 'expected_hierarchy'), (
@@ -239,3 +385,34 @@ def test_upload_local_copy_list_files_folders(fixture_sandbox, node_and_calc_inf
     expected_hierarchy['files']['file_x'] = 'content_x'
     expected_hierarchy['files']['file_y'] = 'content_y'
     assert expected_hierarchy == written_hierarchy
+
+
+def test_submit_calculations(aiida_localhost, monkeypatch):
+    """Test that ``submit_calculations`` submits the jobs of calculations without a job id with a single command."""
+    from aiida.schedulers.plugins.direct import DirectScheduler
+
+    calls = []
+
+    def submit_from_scripts(self, submissions):  # pylint: disable=unused-argument
+        calls.append(submissions)
+        return ['2', ValueError('submission failed')]
+
+    monkeypatch.setattr(DirectScheduler, 'submit_from_scripts', submit_from_scripts)
+
+    nodes = []
+
+    for index in range(3):
+        node = CalcJobNode(computer=aiida_localhost)
+        node.set_remote_workdir(f'/scratch/{index}')
+        node.set_option('submit_script_filename', '_aiidasubmit.sh')
+        nodes.append(node.store())
+
+    nodes[0].set_job_id('1')
+
+    with LocalTransport() as transport:
+        results = execmanager.submit_calculations(nodes, transport)
+
+    assert calls == [[('/scratch/1', '_aiidasubmit.sh'), ('/scratch/2', '_aiidasubmit.sh')]]
+    assert results[:2] == ['1', '2']
+    assert isinstance(results[2], ValueError)
+    assert [node.get_job_id() for node in nodes] == ['1', '2', None]
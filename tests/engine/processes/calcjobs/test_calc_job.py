@@ -1434,3 +1434,26 @@ class TestImport:
         assert 'sum' in results
         assert isinstance(results['sum'], orm.Int)
         assert results['sum'].value == expected_sum
+
+
+def test_submit_batched(get_calcjob_builder, isolated_config, monkeypatch):
+    """Test that a job is submitted through ``Scheduler.submit_from_scripts`` if batched submission is enabled."""
+    from aiida.schedulers.plugins.direct import DirectScheduler
+
+    isolated_config.set_option('runner.submit.batch_size', 10, scope=None)
+    isolated_config.set_option('runner.submit.batch_delay', 0., scope=None)
+
+    calls = []
+    submit_from_scripts = DirectScheduler.submit_from_scripts
+
+    def _submit_from_scripts(self, submissions):
+        calls.append(submissions)
+        return submit_from_scripts(self, submissions)
+
+    monkeypatch.setattr(DirectScheduler, 'submit_from_scripts', _submit_from_scripts)
+
+    builder = get_calcjob_builder()
+    _, node = launch.run_get_node(builder)
+    assert node.is_finished_ok, (node.process_state, node.exit_status)
+    assert len(calls) == 1
+    assert calls[0] == [(node.get_remote_workdir(), node.get_option('submit_script_filename'))]
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.engine.processes.calcjobs.tasks` module."""
+import asyncio
+import contextlib
+
+import pytest
+
+from aiida.engine.processes.calcjobs.tasks import (
+    KILL_COMMAND,
+    RETRIEVE_COMMAND,
+    SUBMIT_COMMAND,
+    UPLOAD_COMMAND,
+    TaskScheduler,
+    task_submit_job,
+)
+from aiida.engine.utils import InterruptableFuture
+from aiida.orm import CalcJobNode
+
+
+@pytest.fixture
+def computers(aiida_computer_local):
+    """Return two computers."""
+    return aiida_computer_local(label='computer-one'), aiida_computer_local(label='computer-two')
+
+
+def test_task_scheduler_defaults():
+    """Test that the task scheduler does not limit the tasks by default."""
+    task_scheduler = TaskScheduler(asyncio.get_event_loop())
+    assert task_scheduler._computer_limit == 0  # pylint: disable=protected-access
+    assert set(task_scheduler._task_limits.values()) == {0}  # pylint: disable=protected-access
+
+
+def test_task_scheduler_computer_limit(computers):
+    """Test that slots are granted by priority once the limit of a computer is reached."""
+    task_scheduler = TaskScheduler(asyncio.get_event_loop(), computer_limit=1, task_limits={})
+    computer_one, computer_two = computers
+
+    with contextlib.ExitStack() as stack, contextlib.ExitStack() as running_stack:
+        running = running_stack.enter_context(task_scheduler.request_slot(computer_one, UPLOAD_COMMAND))
+        upload = stack.enter_context(task_scheduler.request_slot(computer_one, UPLOAD_COMMAND))
+        retrieve = stack.enter_context(task_scheduler.request_slot(computer_one, RETRIEVE_COMMAND))
+        other = stack.enter_context(task_scheduler.request_slot(computer_two, UPLOAD_COMMAND))
+
+        # The limit is per computer, so the request for the other computer is granted immediately
+        assert running.done() and other.done()
+        assert not upload.done() and not retrieve.done()
+        assert task_scheduler.get_statistics() == {
+            'computer-one': {
+                UPLOAD_COMMAND: {'running': 1, 'waiting': 1},
+                RETRIEVE_COMMAND: {'running': 0, 'waiting': 1},
+            },
+            'computer-two': {
+                UPLOAD_COMMAND: {'running': 1, 'waiting': 0},
+            },
+        }
+
+        with task_scheduler.request_slot(computer_one, KILL_COMMAND) as kill:
+            assert not kill.done()
+
+        # Withdrawn requests are no longer waiting
+        assert kill.cancelled()
+        assert task_scheduler.get_statistics()['computer-one'] == {
+            UPLOAD_COMMAND: {'running': 1, 'waiting': 1},
+            RETRIEVE_COMMAND: {'running': 0, 'waiting': 1},
+        }
+
+        # Releasing the slot grants the retrieval, which takes precedence over the upload that was requested earlier
+        running_stack.close()
+
+        assert retrieve.done() and not retrieve.cancelled()
+        assert not upload.done()
+
+    assert task_scheduler.get_statistics() == {}
+
+
+def test_task_scheduler_task_limits(computers):
+    """Test that the number of tasks of a type is limited over all computers."""
+    task_scheduler = TaskScheduler(asyncio.get_event_loop(), computer_limit=0, task_limits={RETRIEVE_COMMAND: 1})
+    computer_one, computer_two = computers
+
+    with task_scheduler.request_slot(computer_one, RETRIEVE_COMMAND) as retrieve_one:
+        with task_scheduler.request_slot(computer_two, RETRIEVE_COMMAND) as retrieve_two:
+            with task_scheduler.request_slot(computer_two, UPLOAD_COMMAND) as upload:
+                # A waiting request does not hold back requests with a lower priority that are subject to other limits
+                assert retrieve_one.done() and upload.done()
+                assert not retrieve_two.done()
+
+        assert retrieve_two.cancelled()
+
+    with task_scheduler.request_slot(computer_two, RETRIEVE_COMMAND) as retrieve_two:
+        assert retrieve_two.done()
+
+
+def test_task_submit_job_batched(aiida_localhost):
+    """Test that a batched submission does not wait for a slot of the task scheduler."""
+    loop = asyncio.get_event_loop()
+    task_scheduler = TaskScheduler(loop, computer_limit=1, task_limits={})
+    node = CalcJobNode(computer=aiida_localhost).store()
+
+    class JobManager:
+        """Job manager that submits the job as soon as it is requested."""
+
+        submit_batch_size = 2
+
+        @contextlib.contextmanager
+        def request_submission(self, authinfo, node):  # pylint: disable=unused-argument
+            future = loop.create_future()
+            future.set_result('1')
+            yield future
+
+    with task_scheduler.request_slot(aiida_localhost, SUBMIT_COMMAND) as slot:
+        assert slot.done()
+        task = task_submit_job(
+            node, None, InterruptableFuture(), job_manager=JobManager(), task_scheduler=task_scheduler
+        )
+        result = loop.run_until_complete(asyncio.wait_for(task, timeout=5))
+
+    assert result == '1'
@@ -13,9 +13,17 @@ import time
 
 import pytest
 
-from aiida.engine.processes.calcjobs.manager import JobManager, JobsList
+from aiida.engine.processes.calcjobs.manager import (
+    AdaptivePollPolicy,
+    JobManager,
+    JobsList,
+    JobSubmitter,
+    _JobPollState,
+)
 from aiida.engine.transports import TransportQueue
-from aiida.orm import User
+from aiida.orm import CalcJobNode, User
+from aiida.schedulers import SchedulerError
+from aiida.schedulers.datastructures import JobInfo, JobState
 
 
 class TestJobManager:
@@ -45,6 +53,149 @@ class TestJobManager:
         with self.manager.request_job_info_update(self.auth_info, job_id=1) as request:
             assert isinstance(request, asyncio.Future)
 
+    def test_request_job_info_update_coalesced(self, monkeypatch):
+        """Test that update requests of authinfos for the same scheduler queue are served by a single query."""
+        from aiida.schedulers.plugins.direct import DirectScheduler
+
+        calls = []
+
+        def get_jobs(self, jobs=None, user=None, as_dict=False, filter_jobs=None):  # pylint: disable=unused-argument
+            calls.append((user, sorted(filter_jobs)))
+            return {job_id: JobInfo({'job_id': job_id, 'job_state': JobState.RUNNING}) for job_id in ('1', '2')}
+
+        monkeypatch.setattr(DirectScheduler, 'get_jobs', get_jobs)
+
+        user = User(email='coalesced@localhost').store()
+        auth_info = self.computer.configure(user=user)
+        auth_params = self.auth_info.get_auth_params()
+        for authinfo in (auth_info, self.auth_info):
+            authinfo.set_auth_params({**authinfo.get_auth_params(), 'username': 'shared'})
+        assert self.manager.get_poller_key(auth_info) == self.manager.get_poller_key(self.auth_info)
+
+        async def request_updates():
+            with self.manager.request_job_info_update(self.auth_info, job_id='1') as request_one:
+                with self.manager.request_job_info_update(auth_info, job_id='2') as request_two:
+                    return await asyncio.gather(request_one, request_two)
+
+        job_info_one, job_info_two = self.loop.run_until_complete(request_updates())
+
+        assert job_info_one.job_id == '1'
+        assert job_info_two.job_id == '2'
+        assert calls == [('$USER', ['1', '2'])]
+
+        statistics = self.manager.get_polling_statistics()[self.manager.get_poller_key(self.auth_info)]
+        assert statistics['hits'] == 1
+        assert statistics['misses'] == 1
+        assert statistics['latency_last'] is not None
+
+        self.auth_info.set_auth_params(auth_params)
+
+    def test_get_poller_key_without_username(self):
+        """Test that authinfos that do not define a username do not share a poller."""
+        user = User(email='separate@localhost').store()
+        auth_info = self.computer.configure(user=user)
+        assert 'username' not in auth_info.get_auth_params()
+        assert self.manager.get_poller_key(auth_info) != self.manager.get_poller_key(self.auth_info)
+
+        auth_info.set_auth_params({**auth_info.get_auth_params(), 'username': 'other'})
+        assert self.manager.get_poller_key(auth_info)[-1] == 'other'
+
+    def test_request_job_info_update_legacy_get_jobs(self, monkeypatch):
+        """Test that scheduler plugins overriding ``get_jobs`` without the ``filter_jobs`` argument are supported."""
+        from aiida.schedulers.plugins.direct import DirectScheduler
+
+        def get_jobs(self, jobs=None, user=None, as_dict=False):  # pylint: disable=unused-argument
+            return {job_id: JobInfo({'job_id': job_id, 'job_state': JobState.RUNNING}) for job_id in ('1', '2')}
+
+        monkeypatch.setattr(DirectScheduler, 'get_jobs', get_jobs)
+
+        async def request_update():
+            with self.manager.request_job_info_update(self.auth_info, job_id='1') as request:
+                return await request
+
+        assert self.loop.run_until_complete(request_update()).job_id == '1'
+
+        poller = self.manager._pollers[self.manager.get_poller_key(self.auth_info)]  # pylint: disable=protected-access
+        assert list(poller._poll.future.result()) == ['1']  # pylint: disable=protected-access
+
+    def test_get_job_submitter(self):
+        """Test the `JobManager.get_job_submitter` method."""
+        job_submitter = self.manager.get_job_submitter(self.auth_info)
+        assert isinstance(job_submitter, JobSubmitter)
+        assert self.manager.get_job_submitter(self.auth_info) is job_submitter
+
+    def test_request_submission_batched(self, monkeypatch):
+        """Test that submission requests are submitted in batches of at most the batch size."""
+        from aiida.schedulers.plugins.direct import DirectScheduler
+
+        calls = []
+
+        def submit_from_scripts(self, submissions):  # pylint: disable=unused-argument
+            calls.append(submissions)
+            if len(calls) == 1:
+                return ['1', SchedulerError('submission failed')]
+            return [str(len(calls))] * len(submissions)
+
+        monkeypatch.setattr(DirectScheduler, 'submit_from_scripts', submit_from_scripts)
+
+        nodes = []
+
+        for index in range(3):
+            node = CalcJobNode(computer=self.computer)
+            node.set_remote_workdir(f'/scratch/{index}')
+            node.set_option('submit_script_filename', '_aiidasubmit.sh')
+            nodes.append(node.store())
+
+        job_submitter = JobSubmitter(self.auth_info, self.transport_queue, batch_size=2, batch_delay=0.)
+
+        async def request_submissions():
+            with job_submitter.request_submission(nodes[0]) as request_one:
+                with job_submitter.request_submission(nodes[1]) as request_two:
+                    with job_submitter.request_submission(nodes[2]) as request_three:
+                        return await asyncio.gather(request_one, request_two, request_three, return_exceptions=True)
+
+        results = self.loop.run_until_complete(request_submissions())
+
+        assert calls == [
+            [('/scratch/0', '_aiidasubmit.sh'), ('/scratch/1', '_aiidasubmit.sh')],
+            [('/scratch/2', '_aiidasubmit.sh')],
+        ]
+        assert results[0] == '1'
+        assert isinstance(results[1], SchedulerError)
+        assert results[2] == '2'
+        assert [node.get_job_id() for node in nodes] == ['1', None, '2']
+
+        # A node that already has a job id is not submitted again
+        async def request_submission():
+            with job_submitter.request_submission(nodes[0]) as request:
+                return await request
+
+        assert self.loop.run_until_complete(request_submission()) == '1'
+        assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    'job_state, wallclock_seconds, elapsed_seconds, expected', (
+        (None, None, 0, 0.),
+        (JobState.QUEUED, None, 100, 10.),
+        (JobState.QUEUED, None, 10000, 60.),
+        (JobState.RUNNING, None, 100, 10.),
+        (JobState.RUNNING, 500, 100, 40.),
+        (JobState.RUNNING, 1000, 2000, 0.),
+    )
+)
+def test_adaptive_poll_policy(job_state, wallclock_seconds, elapsed_seconds, expected):
+    """Test the `AdaptivePollPolicy.get_poll_interval` method."""
+    policy = AdaptivePollPolicy(maximum_interval=60, backoff_factor=0.1)
+    now = time.time()
+    job = _JobPollState(last_changed=now - elapsed_seconds, max_wallclock_seconds=wallclock_seconds)
+
+    if job_state is not None:
+        job.job_info = JobInfo({'job_id': '1', 'job_state': job_state})
+        job.last_polled = now
+
+    assert policy.get_poll_interval(job, now) == pytest.approx(expected)
+
 
 class TestJobsList:
     """Test the `aiida.engine.processes.calcjobs.manager.JobsList` class."""
@@ -73,3 +224,23 @@ class TestJobsList:
         last_updated = time.time()
         jobs_list = JobsList(self.auth_info, self.transport_queue, last_updated=last_updated)
         assert jobs_list.last_updated == last_updated
+
+    def test_get_next_update_delay_adaptive(self):
+        """Test that the update is delayed until the first job is due if a poll policy is defined."""
+        jobs_list = JobsList(
+            self.auth_info,
+            self.transport_queue,
+            last_updated=time.time(),
+            poll_policy=AdaptivePollPolicy(maximum_interval=600, backoff_factor=0.5)
+        )
+
+        with jobs_list.request_job_info_update('1', max_wallclock_seconds=1000):
+            # The job has not been polled yet so the update is only limited by the minimum poll interval
+            assert jobs_list._get_next_update_delay() <= jobs_list.get_minimum_update_interval()  # pylint: disable=protected-access
+
+            job = jobs_list._job_poll_states['1']  # pylint: disable=protected-access
+            job.job_info = JobInfo({'job_id': '1', 'job_state': JobState.RUNNING})
+            job.last_polled = time.time()
+
+            # The job is running with a remaining wallclock time of 1000 seconds, so is due after about 500 seconds
+            assert jobs_list._get_next_update_delay() == pytest.approx(500, abs=1)  # pylint: disable=protected-access
@@ -12,7 +12,7 @@ import plumpy
 import pytest
 
 from aiida.engine import Process, run
-from aiida.engine.persistence import AiiDAPersister
+from aiida.engine.persistence import COMPRESSED_CHECKPOINT_PREFIX, AiiDAPersister, decode_checkpoint, encode_checkpoint
 from tests.utils.processes import DummyProcess
 
 
@@ -67,3 +67,39 @@ class TestAiiDAPersister:
 
         self.persister.delete_checkpoint(process.pid)
         assert process.node.checkpoint is None
+
+    def test_save_load_checkpoint_compressed(self):
+        """Test saving and loading a compressed checkpoint."""
+        persister = AiiDAPersister(compress=True)
+        process = DummyProcess()
+        bundle_saved = persister.save_checkpoint(process)
+
+        assert process.node.checkpoint.startswith(COMPRESSED_CHECKPOINT_PREFIX)
+        assert persister.load_checkpoint(process.node.pk) == bundle_saved
+        assert persister.get_statistics()['size_last'] == len(process.node.checkpoint)
+
+    def test_save_checkpoint_skip_unchanged(self):
+        """Test that an unchanged checkpoint is not written again if ``skip_unchanged`` is enabled."""
+        persister = AiiDAPersister(skip_unchanged=True)
+        process = DummyProcess()
+
+        persister.save_checkpoint(process)
+        persister.save_checkpoint(process)
+        assert persister.get_statistics()['saved'] == 1
+        assert persister.get_statistics()['skipped'] == 1
+
+        # After the checkpoint is deleted it should be written again
+        persister.delete_checkpoint(process.pid)
+        persister.save_checkpoint(process)
+        assert persister.get_statistics()['saved'] == 2
+        assert isinstance(process.node.checkpoint, str)
+
+
+@pytest.mark.parametrize('compress', (True, False))
+def test_encode_decode_checkpoint(compress):
+    """Test the round trip of :func:`encode_checkpoint` and :func:`decode_checkpoint`."""
+    data = {'context': {'values': list(range(100)), 'label': 'zlib: not compressed'}}
+    checkpoint = encode_checkpoint(data, compress=compress)
+
+    assert checkpoint.startswith(COMPRESSED_CHECKPOINT_PREFIX) is compress
+    assert decode_checkpoint(checkpoint) == data
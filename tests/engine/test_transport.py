@@ -9,6 +9,7 @@
 ###########################################################################
 """Module to test transport."""
 import asyncio
+import time
 
 import pytest
 
@@ -132,3 +133,174 @@ class TestTransportQueue:
 
         finally:
             transport_class._DEFAULT_SAFE_OPEN_INTERVAL = original_interval  # pylint: disable=protected-access
+
+    @pytest.mark.parametrize('executor_concurrency', (0, 2))
+    def test_run_in_executor(self, executor_concurrency):
+        """Test that ``run_in_executor`` runs operations in a thread pool unless the concurrency is zero."""
+        import threading
+
+        queue = TransportQueue(executor_concurrency=executor_concurrency)
+        loop = queue.loop
+
+        async def test():
+            return await queue.run_in_executor(self.authinfo, lambda value: (threading.get_ident(), value), 'value')
+
+        try:
+            thread, value = loop.run_until_complete(test())
+        finally:
+            queue.close()
+
+        assert value == 'value'
+        assert (thread == threading.get_ident()) is (executor_concurrency == 0)
+
+    def test_run_in_executor_lock(self):
+        """Test that ``run_in_executor`` holds the transport lock, such that operations are run one at a time."""
+        import threading
+
+        queue = TransportQueue(executor_concurrency=2)
+        loop = queue.loop
+        lock = queue.get_transport_lock(self.authinfo)
+        running = []
+        overlapped = threading.Event()
+
+        def operation():
+            running.append(True)
+            if len(running) > 1:
+                overlapped.set()
+            time.sleep(0.05)
+            running.pop()
+            return lock.locked()
+
+        async def test():
+            return await asyncio.gather(*[queue.run_in_executor(self.authinfo, operation) for _ in range(3)])
+
+        try:
+            assert loop.run_until_complete(test()) == [True, True, True]
+        finally:
+            queue.close()
+
+        assert not overlapped.is_set()
+        assert not lock.locked()
+
+    def test_run_in_executor_waits_for_lock(self):
+        """Test that ``run_in_executor`` waits while a task in the event loop holds the transport lock."""
+        queue = TransportQueue(executor_concurrency=1)
+        loop = queue.loop
+        events = []
+
+        async def use_transport():
+            async with queue.get_transport_lock(self.authinfo):
+                events.append('acquired')
+                await asyncio.sleep(0.1)
+                events.append('released')
+
+        async def test():
+            holder = asyncio.ensure_future(use_transport())
+            await asyncio.sleep(0)
+            await queue.run_in_executor(self.authinfo, events.append, 'operation')
+            await holder
+
+        try:
+            loop.run_until_complete(test())
+        finally:
+            queue.close()
+
+        assert events == ['acquired', 'released', 'operation']
+
+    def test_run_in_executor_cancelled(self):
+        """Test that a cancelled ``run_in_executor`` call only returns once the operation has finished."""
+        import threading
+
+        queue = TransportQueue(executor_concurrency=1)
+        loop = queue.loop
+        started = threading.Event()
+        finished = threading.Event()
+
+        def operation():
+            started.set()
+            time.sleep(0.2)
+            finished.set()
+
+        async def test():
+            task = asyncio.ensure_future(queue.run_in_executor(self.authinfo, operation))
+            await loop.run_in_executor(None, started.wait)
+            task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            return finished.is_set()
+
+        try:
+            assert loop.run_until_complete(test())
+        finally:
+            queue.close()
+
+        assert not queue.get_transport_lock(self.authinfo).locked()
+
+    def test_keep_alive(self):
+        """Test that a transport is kept open after it is released and reused by requests within the keep-alive."""
+        queue = TransportQueue(keep_alive=0.2)
+        loop = queue.loop
+
+        async def request_transport():
+            with queue.request_transport(self.authinfo) as request:
+                return await request
+
+        transport = loop.run_until_complete(request_transport())
+        assert transport.is_open
+        assert loop.run_until_complete(request_transport()) is transport
+        assert queue.get_statistics() == {self.computer.label: {'opened': 1, 'reused': 1}}
+
+        # After the keep-alive time has passed without requests, the transport is closed
+        loop.run_until_complete(asyncio.sleep(0.3))
+        assert not transport.is_open
+        assert loop.run_until_complete(request_transport()) is not transport
+        assert queue.get_statistics() == {self.computer.label: {'opened': 2, 'reused': 1}}
+
+        queue.close()
+        assert not queue._transport_requests  # pylint: disable=protected-access
+
+    def test_keep_alive_not_reusable(self, monkeypatch):
+        """Test that a transport that is kept open is not reused if it is broken or exceeded its maximum lifetime."""
+        queue = TransportQueue(keep_alive=10, max_lifetime=0.2)
+        loop = queue.loop
+
+        async def request_transport():
+            with queue.request_transport(self.authinfo) as request:
+                return await request
+
+        transport = loop.run_until_complete(request_transport())
+        monkeypatch.setattr(transport, 'is_alive', lambda: False)
+        replacement = loop.run_until_complete(request_transport())
+        assert replacement is not transport
+        assert not transport.is_open
+
+        loop.run_until_complete(asyncio.sleep(0.3))
+        assert loop.run_until_complete(request_transport()) is not replacement
+        assert not replacement.is_open
+        assert queue.get_statistics() == {self.computer.label: {'opened': 3, 'reused': 0}}
+
+        queue.close()
+
+    def test_keep_alive_resets_cwd(self, tmp_path):
+        """Test that a transport that is kept open is handed out in its initial working directory."""
+        queue = TransportQueue(keep_alive=10)
+        loop = queue.loop
+
+        async def request_transport(chdir=None):
+            with queue.request_transport(self.authinfo) as request:
+                transport = await request
+                if chdir is not None:
+                    transport.chdir(chdir)
+                return transport, transport.getcwd()
+
+        try:
+            transport, initial_cwd = loop.run_until_complete(request_transport(str(tmp_path)))
+            assert initial_cwd == str(tmp_path)
+            reused, cwd = loop.run_until_complete(request_transport())
+            assert reused is transport
+            assert cwd != str(tmp_path)
+            assert queue.get_statistics() == {self.computer.label: {'opened': 1, 'reused': 1}}
+        finally:
+            queue.close()
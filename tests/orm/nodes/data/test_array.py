@@ -9,8 +9,10 @@
 ###########################################################################
 """Tests for the :mod:`aiida.orm.nodes.data.array.array` module."""
 import numpy
+import pytest
 
 from aiida.orm import ArrayData, load_node
+from aiida.orm.nodes.data.array.array import ARRAY_CACHE, ArrayCache
 
 
 def test_read_stored():
@@ -26,3 +28,80 @@ def test_read_stored():
 
     loaded = load_node(node.uuid)
     assert numpy.array_equal(loaded.get_array('array'), array)
+
+
+@pytest.mark.parametrize('index', (0, 3, -1, slice(None), slice(1, 3), slice(4, 0, -2), slice(2, 2)))
+@pytest.mark.parametrize('order', ('C', 'F'))
+def test_get_array_slice(index, order):
+    """Test the ``ArrayData.get_array_slice`` method returns the same as indexing the full array."""
+    array = numpy.asarray(numpy.arange(60).reshape(5, 4, 3), order=order)
+    vector = numpy.arange(5, dtype=numpy.float32)
+    node = ArrayData()
+    node.set_array('array', array)
+    node.set_array('vector', vector)
+    node.store()
+
+    loaded = load_node(node.pk)
+    assert numpy.array_equal(loaded.get_array_slice('array', index), array[index])
+    assert numpy.array_equal(loaded.get_array_slice('vector', index), vector[index])
+    assert (loaded.uuid, 'array') not in ARRAY_CACHE
+
+    with pytest.raises(IndexError):
+        loaded.get_array_slice('array', 5)
+
+    with pytest.raises(KeyError):
+        loaded.get_array_slice('non_existent', 0)
+
+
+def test_array_cache():
+    """Test the ``ArrayCache`` evicts the least recently used arrays when its maximum size is exceeded."""
+    cache = ArrayCache(maxsize=200)
+    array_a = numpy.zeros(10)  # 80 bytes
+    array_b = numpy.zeros(10)
+    array_c = numpy.zeros(10)
+
+    cache.put(('a', 'array'), array_a)
+    cache.put(('b', 'array'), array_b)
+    assert cache.get(('a', 'array')) is array_a
+
+    # Adding a third array exceeds the maximum size, so the least recently used array ``b`` is evicted
+    cache.put(('c', 'array'), array_c)
+    assert cache.get(('b', 'array')) is None
+    assert cache.get(('c', 'array')) is array_c
+
+    # Arrays that exceed the maximum size by themselves are not cached
+    cache.put(('d', 'array'), numpy.zeros(100))
+    assert ('d', 'array') not in cache
+
+    assert cache.get_statistics() == {
+        'hits': 2,
+        'misses': 1,
+        'evictions': 1,
+        'count': 2,
+        'size': 160,
+        'maxsize': 200,
+    }
+
+    cache.clear('a')
+    assert ('a', 'array') not in cache
+    assert cache.get_statistics()['size'] == 80
+
+    cache.maxsize = 0
+    assert cache.get_statistics()['count'] == 0
+
+
+def test_get_array_cached():
+    """Test the arrays of stored nodes are cached across instances of the node, and removed by clearing the cache."""
+    array = numpy.arange(10)
+    node = ArrayData()
+    node.set_array('array', array)
+    node.get_array('array')
+    assert (node.uuid, 'array') not in ARRAY_CACHE
+
+    node.store()
+    node.get_array('array')
+    assert (node.uuid, 'array') in ARRAY_CACHE
+    assert load_node(node.pk).get_array('array') is node.get_array('array')
+
+    node.clear_internal_cache()
+    assert (node.uuid, 'array') not in ARRAY_CACHE
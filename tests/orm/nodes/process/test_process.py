@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 """Tests for :mod:`aiida.orm.nodes.process.process`."""
+import pytest
+
+from aiida.common.exceptions import ModificationNotAllowed
 from aiida.engine import ExitCode
+from aiida.orm import WorkflowNode, load_node
 from aiida.orm.nodes.process.process import ProcessNode
+from aiida.storage.sqlite_temp import SqliteTempBackend
 
 
 def test_exit_code():
@@ -14,3 +19,79 @@ def test_exit_code():
 
     node.set_exit_message('I am a teapot')
     assert node.exit_code == ExitCode(418, 'I am a teapot')
+
+
+@pytest.mark.parametrize('storage', ('profile', 'sqlite_temp'))
+def test_checkpoint(storage):
+    """Test the checkpoint of a process node, which the ``psql_dos`` storage keeps out of the node attributes."""
+    backend = SqliteTempBackend(SqliteTempBackend.create_profile(debug=False)) if storage == 'sqlite_temp' else None
+    node = WorkflowNode(backend=backend)
+    assert node.checkpoint is None
+
+    node.store()
+    node.set_checkpoint('checkpoint')
+    assert node.checkpoint == 'checkpoint'
+    assert (ProcessNode.CHECKPOINT_KEY in node.base.attributes.all) is (storage == 'sqlite_temp')
+
+    node.set_checkpoint('updated')
+    assert node.checkpoint == 'updated'
+
+    if storage == 'profile':
+        assert load_node(node.pk).checkpoint == 'updated'
+
+    node.delete_checkpoint()
+    assert node.checkpoint is None
+    node.delete_checkpoint()
+
+    node.seal()
+
+    with pytest.raises(ModificationNotAllowed):
+        node.set_checkpoint('checkpoint')
+
+
+def test_checkpoint_unstored():
+    """Test that the checkpoint of an unstored node is kept when it is stored."""
+    node = WorkflowNode()
+    node.set_checkpoint('checkpoint')
+    node.store()
+    assert node.checkpoint == 'checkpoint'
+
+    node.delete_checkpoint()
+    assert node.checkpoint is None
+
+
+def test_get_process_checkpoints():
+    """Test that the storage returns the checkpoints of multiple process nodes at once."""
+    nodes = [WorkflowNode().store() for _ in range(3)]
+    nodes[0].set_checkpoint('first')
+    nodes[2].set_checkpoint('third')
+
+    backend = nodes[0].backend
+    assert backend.get_process_checkpoints([node.pk for node in nodes]) == {nodes[0].pk: 'first', nodes[2].pk: 'third'}
+    assert backend.get_process_checkpoints([]) == {}
+
+
+def test_set_process_checkpoint_in_transaction(monkeypatch):
+    """Test that a failure to write a checkpoint within a transaction does not abort the other changes."""
+    from sqlalchemy import text
+    from sqlalchemy.exc import SQLAlchemyError
+
+    node = WorkflowNode().store()
+    backend = node.backend
+    execute = backend.get_session().execute
+
+    def failing_execute(statement, *args, **kwargs):
+        if 'db_dbcheckpoint' in str(statement):
+            execute(text('SELECT 1/0'))
+        return execute(statement, *args, **kwargs)
+
+    with backend.transaction(), node.base.attributes.batch():
+        node.set_process_state('waiting')
+        monkeypatch.setattr(backend.get_session(), 'execute', failing_execute)
+        with pytest.raises(SQLAlchemyError):
+            node.set_checkpoint('checkpoint')
+        monkeypatch.undo()
+
+    node = load_node(node.pk)
+    assert node.process_state.value == 'waiting'
+    assert node.checkpoint is None
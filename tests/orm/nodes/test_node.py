@@ -516,6 +516,26 @@ class TestNodeLinks:
         with pytest.raises(TypeError):
             self.node_target.base.links.validate_incoming(self.node_source, LinkType.CREATE.value, 'link_label')
 
+    def test_validate_acyclic(self):
+        """Test the `validate_acyclic` method, which only queries for descendants if both nodes are stored."""
+        data = Data().store()
+        calculation = CalculationNode()
+        calculation.base.links.add_incoming(data, LinkType.INPUT_CALC, 'input')
+        calculation.store()
+        other = CalculationNode().store()
+
+        # An unstored target cannot have descendants and an unstored source cannot be one
+        Data().base.links.validate_acyclic(calculation)
+        data.base.links.validate_acyclic(CalculationNode())
+
+        data.base.links.validate_acyclic(other)
+
+        with pytest.raises(ValueError, match='cycle'):
+            data.base.links.validate_acyclic(calculation)
+
+        with pytest.raises(ValueError, match='cycle'):
+            data.base.links.validate_incoming(calculation, LinkType.CREATE, 'output')
+
     def test_add_incoming_create(self):
         """Nodes can only have a single incoming CREATE link, independent of the source node."""
         source_one = CalculationNode()
@@ -969,6 +989,93 @@ class TestNodeCaching:
         calc = CalculationNode()
         calc.base.caching.is_valid_cache = False
 
+    def test_get_same_node_valid_cache_filters(self):
+        """Test that the cache lookup only returns finished processes that are a valid cache."""
+        from plumpy.process_states import ProcessState
+
+        from aiida.orm import CalcJobNode
+
+        def create_node(process_state=ProcessState.FINISHED, is_valid_cache=True):
+            node = CalcJobNode(process_type='aiida.calculations:core.arithmetic.add')
+            node.base.attributes.set('input_label', 'a')
+            node.set_process_state(process_state)
+            node.store()
+            node.base.caching.is_valid_cache = is_valid_cache
+            return node
+
+        node_invalid = create_node(is_valid_cache=False)
+        node_running = create_node(process_state=ProcessState.RUNNING)
+        assert node_invalid.base.caching.get_all_same_nodes() == []
+
+        node_valid = create_node()
+        assert node_running.base.caching.get_hash() == node_valid.base.caching.get_hash()
+        assert node_invalid.base.caching.get_all_same_nodes() == [node_valid]
+        assert node_running.base.caching._get_same_node() == node_valid  # pylint: disable=protected-access
+
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_get_same_nodes(self):
+        """Test that ``NodeCaching.get_same_nodes`` returns the same nodes as ``_get_same_node`` for each node."""
+        from plumpy.process_states import ProcessState
+
+        from aiida.orm import CalcJobNode
+        from aiida.orm.nodes.caching import NodeCaching
+
+        def create_node(input_label='a', process_state=ProcessState.FINISHED, is_valid_cache=True):
+            node = CalcJobNode(process_type='aiida.calculations:core.arithmetic.add')
+            node.base.attributes.set('input_label', input_label)
+            node.set_process_state(process_state)
+            node.store()
+            node.base.caching.is_valid_cache = is_valid_cache
+            return node
+
+        node_invalid = create_node(is_valid_cache=False)
+        node_running = create_node(process_state=ProcessState.RUNNING)
+        node_valid = create_node()
+        node_unique = create_node(input_label='b', is_valid_cache=False)
+        nodes = [node_invalid, node_running, node_unique, Int(1).store()]
+
+        same_nodes = NodeCaching.get_same_nodes(nodes)
+        assert same_nodes == [node_valid, node_valid, None, None]
+        assert same_nodes == [node.base.caching._get_same_node() for node in nodes]  # pylint: disable=protected-access
+        assert NodeCaching.get_same_nodes([]) == []
+
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_store_all_from_cache(self, monkeypatch):
+        """Test that ``Node.store_all`` stores the unstored sources from the cache with a single batched lookup."""
+        from plumpy.process_states import ProcessState
+
+        from aiida.manage.caching import enable_caching
+        from aiida.orm import CalcJobNode
+        from aiida.orm.nodes.caching import NodeCaching
+
+        def create_node():
+            node = CalcJobNode(process_type='aiida.calculations:core.arithmetic.add')
+            node.base.attributes.set('input_label', 'a')
+            node.set_process_state(ProcessState.FINISHED)
+            return node
+
+        cached = create_node().store()
+        source = create_node()
+        data = Data()
+        data.base.links.add_incoming(source, LinkType.CREATE, 'result')
+
+        calls = []
+        get_same_nodes = NodeCaching.get_same_nodes
+
+        def spy(nodes):
+            calls.append(list(nodes))
+            return get_same_nodes(nodes)
+
+        monkeypatch.setattr(NodeCaching, 'get_same_nodes', staticmethod(spy))
+
+        with enable_caching(identifier='aiida.calculations:core.arithmetic.add'):
+            data.store_all()
+
+        assert calls == [[source]]
+        assert source.is_stored
+        assert source.base.caching.get_cache_source() == cached.uuid
+        assert data.base.links.get_incoming().one().node.pk == source.pk
+
     def test_store_from_cache(self, tmp_path):
         """Regression test for storing a Node with (nested) repository content with caching."""
         data = Data()
@@ -998,6 +1105,53 @@ class TestNodeCaching:
             result = node.base.caching.get_hash(ignore_errors=False)
         assert result is None
 
+    def test_get_hash_memoized(self, monkeypatch):
+        """Test that the hash of a stored node is memoized, but that of an unstored node is not."""
+        node = Data()
+        node.base.attributes.set('key', 'value')
+        unstored_hash = node.base.caching._get_hash()  # pylint: disable=protected-access
+        node.store()
+        stored_hash = node.base.caching.get_hash()
+
+        def get_objects_to_hash(_):
+            pytest.fail('the hash should be memoized')
+
+        monkeypatch.setattr(node.base.caching.__class__, '_get_objects_to_hash', get_objects_to_hash)
+        assert load_node(node.pk).base.caching.get_hash() == stored_hash == unstored_hash
+
+        with pytest.raises(pytest.fail.Exception):
+            Data().base.caching._get_hash()  # pylint: disable=protected-access
+
+    def test_get_hash_memoized_rehash(self, monkeypatch):
+        """Test that ``rehash`` and ``clear_hash`` do not keep a stale memoized hash."""
+        from aiida.orm.nodes import caching
+
+        node = Data().store()
+        node.base.caching.rehash()
+        monkeypatch.setitem(caching._MEMOIZED_HASHES, node.base.caching._get_memo_key(), 'stale')  # pylint: disable=protected-access
+        assert node.base.caching.get_hash() == 'stale'
+
+        node.base.caching.rehash()
+        assert node.base.caching.get_hash() != 'stale'
+        assert node.base.extras.get(node.base.caching._HASH_EXTRA_KEY) == node.base.caching.get_hash()  # pylint: disable=protected-access
+
+        monkeypatch.setitem(caching._MEMOIZED_HASHES, node.base.caching._get_memo_key(), 'stale')  # pylint: disable=protected-access
+        node.base.caching.clear_hash()
+        assert node.base.caching.get_hash() != 'stale'
+
+    def test_get_hash_memoized_version(self, monkeypatch):
+        """Test that the memoized hash is keyed on the profile and on the package version that is part of the hash."""
+        import aiida
+
+        node = Data().store()
+        memo_key = node.base.caching._get_memo_key()  # pylint: disable=protected-access
+        assert memo_key[0] == node.backend.profile.name
+
+        stored_hash = node.base.caching.get_hash()
+        monkeypatch.setattr(aiida, '__version__', 'other')
+        assert node.base.caching._get_memo_key() != memo_key  # pylint: disable=protected-access
+        assert node.base.caching.get_hash() != stored_hash
+
     def test_uuid_equality_fallback(self):
         """Tests the fallback mechanism of checking equality by comparing uuids and hash."""
         node_0 = Data().store()
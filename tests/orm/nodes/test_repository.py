@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=redefined-outer-name,protected-access,no-member
 """Tests for the :mod:`aiida.orm.nodes.repository` module."""
+import io
 import pathlib
 
 import pytest
@@ -10,6 +11,7 @@ from aiida.common.warnings import AiidaDeprecationWarning
 from aiida.engine import ProcessState
 from aiida.manage.caching import enable_caching
 from aiida.orm import CalcJobNode, Data, load_node
+from aiida.repository import Repository
 from aiida.repository.backend import DiskObjectStoreRepositoryBackend, SandboxRepositoryBackend
 from aiida.repository.common import File, FileType
 
@@ -61,6 +63,37 @@ def test_store():
     assert node.base.repository.hash() == hash_unstored
 
 
+def test_put_objects_from_serialized():
+    """Test that objects already written to the repository backend of the profile are attached without copying."""
+    node = Data()
+    repository = Repository(backend=node.backend.get_repository())
+    repository.put_object_from_filelike(io.BytesIO(b'content'), 'relative/path')
+    serialized = repository.serialize()
+
+    node.base.repository.put_objects_from_serialized(serialized)
+    assert isinstance(node.base.repository._repository.backend, DiskObjectStoreRepositoryBackend)
+    assert node.base.repository.get_object_content('relative/path') == 'content'
+
+    node.store()
+    assert node.base.repository.serialize() == serialized
+    assert load_node(node.pk).base.repository.get_object_content('relative/path') == 'content'
+
+    with pytest.raises(exceptions.ModificationNotAllowed):
+        node.base.repository.put_objects_from_serialized(serialized)
+
+
+def test_put_objects_from_serialized_raises():
+    """Test that ``put_objects_from_serialized`` raises for a non-empty repository or objects that do not exist."""
+    node = Data()
+    node.base.repository.put_object_from_bytes(b'content', 'relative/path')
+
+    with pytest.raises(ValueError, match='the repository already contains objects'):
+        node.base.repository.put_objects_from_serialized({})
+
+    with pytest.raises(FileNotFoundError, match='do not exist in the repository backend'):
+        Data().base.repository.put_objects_from_serialized({'o': {'file': {'k': 'non-existent'}}})
+
+
 def test_load():
     """Test the repository after loading."""
     node = Data()
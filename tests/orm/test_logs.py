@@ -252,6 +252,57 @@ class TestBackendLog:
         assert logs[0].message == message
         assert logs[1].message == message2
 
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_buffered_db_log_handler(self):
+        """Test that the buffered db log handler writes records in batches, on a size trigger and when flushed."""
+        import time
+
+        from aiida.orm.utils.log import BufferedDBLogHandler, create_logger_adapter, flush_db_log_handlers
+
+        handler = BufferedDBLogHandler(flush_size=3, flush_interval=3600)
+        logger = logging.getLogger('tests.orm.test_logs.buffered')
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+
+        try:
+            node = orm.CalculationNode().store()
+            adapter = create_logger_adapter(logger, node)
+
+            # Records are buffered until the handler is explicitly flushed
+            adapter.info('first')
+            adapter.info('second')
+            assert len(Log.collection.all()) == 0
+
+            flush_db_log_handlers()
+            logs = Log.collection.find(order_by=[{'id': 'asc'}])
+            assert [log.message for log in logs] == ['first', 'second']
+            assert all(log.dbnode_id == node.pk for log in logs)
+
+            # Reaching the buffer size triggers a flush by the background thread
+            for index in range(3):
+                adapter.info('batch %d', index)
+
+            for _ in range(100):
+                if Log.collection.count() == 5:
+                    break
+                time.sleep(0.05)
+
+            assert Log.collection.count() == 5
+
+            # Closing the handler writes the remaining records
+            try:
+                raise ValueError('buffered')
+            except ValueError:
+                adapter.exception('caught an exception')
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        logs = Log.collection.find({'message': {'like': '%ValueError: buffered%'}})
+        assert len(logs) == 1
+        assert logs[0].loggername == 'tests.orm.test_logs.buffered'
+
     def test_log_querybuilder(self):
         """ Test querying for logs by joining on nodes in the QueryBuilder """
         from aiida.orm import QueryBuilder
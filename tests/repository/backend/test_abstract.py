@@ -97,6 +97,15 @@ def test_put_object_from_filelike(repository, generate_directory):
         repository.put_object_from_filelike(handle)
 
 
+def test_put_objects_from_filelikes(repository):
+    """Test the ``Repository.put_objects_from_filelikes`` method."""
+    with pytest.raises(TypeError):
+        repository.put_objects_from_filelikes([io.BytesIO(b'content'), io.StringIO('content')])
+
+    assert repository.put_objects_from_filelikes([]) == []
+    assert repository.put_objects_from_filelikes([io.BytesIO(b'a'), io.BytesIO(b'b')]) == ['key', 'key']
+
+
 def test_put_object_from_file(repository, generate_directory):
     """Test the ``Repository.put_object_from_file`` method for valid filepath types."""
     directory = generate_directory({'file_a': b'content'})
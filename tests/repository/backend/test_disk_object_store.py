@@ -3,6 +3,7 @@
 """Tests for the :mod:`aiida.repository.backend.disk_object_store` module."""
 import io
 import pathlib
+import threading
 
 import pytest
 
@@ -93,6 +94,88 @@ def test_put_object_from_filelike(repository, generate_directory):
     assert isinstance(key, str)
 
 
+@pytest.mark.parametrize('max_workers', (None, 1, 4))
+def test_put_objects_from_filelikes(tmp_path, max_workers):
+    """Test the ``Repository.put_objects_from_filelikes`` method."""
+    from disk_objectstore import Container
+    repository = DiskObjectStoreRepositoryBackend(container=Container(tmp_path), max_workers=max_workers)
+    repository.initialise()
+
+    contents = [f'content_{index}'.encode() for index in range(50)] + [b'content_0']
+    keys = repository.put_objects_from_filelikes([io.BytesIO(content) for content in contents])
+
+    assert len(keys) == len(contents)
+    assert keys[0] == keys[-1]
+    assert [repository.get_object_content(key) for key in keys] == contents
+
+
+@pytest.mark.parametrize('pack_fsync', (True, False))
+def test_put_objects_direct_to_pack(tmp_path, pack_fsync):
+    """Test that objects are written directly to pack files if ``direct_to_pack=True``."""
+    from disk_objectstore import Container
+    container = Container(tmp_path)
+    repository = DiskObjectStoreRepositoryBackend(container=container, direct_to_pack=True, pack_fsync=pack_fsync)
+    repository.initialise()
+
+    contents = [f'content_{index}'.encode() for index in range(10)]
+    keys = repository.put_objects_from_filelikes([io.BytesIO(content) for content in contents])
+    keys.append(repository.put_object_from_filelike(io.BytesIO(b'content_single')))
+
+    assert [repository.get_object_content(key) for key in keys] == contents + [b'content_single']
+    assert container.count_objects()['loose'] == 0
+    assert container.count_objects()['packed'] == 11
+
+
+def test_put_objects_direct_to_pack_locked(tmp_path):
+    """Test that objects are written as loose objects if the pack files are locked by another writer."""
+    from disk_objectstore import Container
+    container = Container(tmp_path)
+    repository = DiskObjectStoreRepositoryBackend(container=container, direct_to_pack=True)
+    repository.initialise()
+
+    with repository._pack_ingestion_lock() as acquired:  # pylint: disable=protected-access
+        assert acquired
+        other = DiskObjectStoreRepositoryBackend(container=Container(tmp_path), direct_to_pack=True)
+        keys = other.put_objects_from_filelikes([io.BytesIO(b'content_a'), io.BytesIO(b'content_b')])
+
+    assert [repository.get_object_content(key) for key in keys] == [b'content_a', b'content_b']
+    assert container.count_objects()['loose'] == 2
+    assert container.count_objects()['packed'] == 0
+
+
+def test_put_objects_direct_to_pack_without_fcntl(tmp_path, monkeypatch):
+    """Test that objects are written as loose objects on platforms that do not provide the ``fcntl`` module."""
+    import sys
+
+    from disk_objectstore import Container
+    monkeypatch.setitem(sys.modules, 'fcntl', None)
+    container = Container(tmp_path)
+    repository = DiskObjectStoreRepositoryBackend(container=container, direct_to_pack=True)
+    repository.initialise()
+
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
+    assert repository.get_object_content(key) == b'content'
+    assert container.count_objects()['loose'] == 1
+
+    repository.maintain(live=False)
+    assert container.count_objects()['packed'] == 1
+
+
+def test_put_objects_direct_to_pack_size_target(tmp_path):
+    """Test that the ``pack_size_target`` overrides the target size of the pack files of the container."""
+    from disk_objectstore import Container
+    container = Container(tmp_path)
+    repository = DiskObjectStoreRepositoryBackend(container=container, direct_to_pack=True, pack_size_target=5)
+    repository.initialise()
+
+    for index in range(3):
+        repository.put_object_from_filelike(io.BytesIO(f'content_{index}'.encode()))
+
+    assert container.count_objects()['packed'] == 3
+    assert container.count_objects()['pack_files'] == 3
+    assert container.pack_size_target != 5
+
+
 def test_has_object(repository, generate_directory):
     """Test the ``Repository.has_object`` method."""
     repository.initialise()
@@ -188,6 +271,21 @@ def test_get_object_hash(repository, generate_directory):
     assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
 
 
+def test_get_object_hashes(repository, generate_directory):
+    """Test the ``Repository.get_object_hashes`` returns the expected value."""
+    repository.initialise()
+    directory = generate_directory({'file_a': b'content'})
+
+    with open(directory / 'file_a', 'rb') as handle:
+        key = repository.put_object_from_filelike(handle)
+
+    expected = 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
+    assert repository.get_object_hashes([key]) == {key: expected}
+
+    with pytest.raises(FileNotFoundError):
+        repository.get_object_hashes([key, 'non-existent'])
+
+
 def test_list_objects(repository, generate_directory):
     """Test the ``Repository.delete_object`` method."""
     repository.initialise()
@@ -304,3 +402,23 @@ def test_maintain_live_overload(populated_repository, kwargs):
 
     with pytest.raises(ValueError):
         populated_repository.maintain(live=True, **kwargs)
+
+
+def test_maintain_waits_for_pack_ingestion(populated_repository):
+    """Test that packing the loose objects waits until objects that are being written directly to packs are written."""
+    maintained = threading.Event()
+
+    def maintain():
+        populated_repository.maintain(live=True)
+        maintained.set()
+
+    thread = threading.Thread(target=maintain)
+
+    with populated_repository._pack_ingestion_lock() as acquired:  # pylint: disable=protected-access
+        assert acquired
+        thread.start()
+        assert not maintained.wait(timeout=0.5)
+
+    thread.join(timeout=10)
+    assert maintained.is_set()
+    assert populated_repository.get_info(detailed=True)['Objects']['packed'] == 4
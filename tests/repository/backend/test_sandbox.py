@@ -163,6 +163,19 @@ def test_get_object_hash(repository, generate_directory):
     assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
 
 
+def test_get_object_hash_not_read(repository, generate_directory, monkeypatch):
+    """Test the ``Repository.get_object_hash`` does not read the object, since its hash is computed when stored."""
+    repository.initialise()
+    directory = generate_directory({'file_a': b'content'})
+
+    with open(directory / 'file_a', 'rb') as handle:
+        key = repository.put_object_from_filelike(handle)
+
+    monkeypatch.setattr(repository, 'open', lambda key: pytest.fail('object should not be read'))
+    expected = 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
+    assert repository.get_object_hashes([key]) == {key: expected}
+
+
 def test_list_objects(repository, generate_directory):
     """Test the ``Repository.delete_object`` method."""
     repository.initialise()
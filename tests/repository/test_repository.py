@@ -430,6 +430,39 @@ def test_put_object_from_tree(repository, generate_directory):
     assert repository.get_object_content('relative/sub/file_c') == b'content_c'
 
 
+def test_put_object_from_tree_batches(repository, generate_directory, monkeypatch):
+    """Test the ``Repository.put_object_from_tree`` method stores the files in batches through the backend."""
+    monkeypatch.setattr(Repository, '_put_object_batch_size', 2)
+    directory = generate_directory({
+        'file_a': b'content_a',
+        'file_b': b'content_b',
+        'relative': {
+            'file_c': b'content_c',
+            'file_d': b'content_d',
+            'sub': {
+                'file_e': b'content_e'
+            }
+        }
+    })
+
+    batch_sizes = []
+    put_objects_from_filelikes = repository.backend.put_objects_from_filelikes
+
+    def mock_put_objects_from_filelikes(handles):
+        batch_sizes.append(len(handles))
+        return put_objects_from_filelikes(handles)
+
+    monkeypatch.setattr(repository.backend, 'put_objects_from_filelikes', mock_put_objects_from_filelikes)
+    repository.put_object_from_tree(str(directory))
+
+    assert sorted(batch_sizes) == [1, 2, 2]
+    assert repository.get_object_content('file_a') == b'content_a'
+    assert repository.get_object_content('file_b') == b'content_b'
+    assert repository.get_object_content('relative/file_c') == b'content_c'
+    assert repository.get_object_content('relative/file_d') == b'content_d'
+    assert repository.get_object_content('relative/sub/file_e') == b'content_e'
+
+
 def test_put_object_from_tree_path(repository, generate_directory):
     """Test the ``Repository.put_object_from_tree`` method."""
     directory = generate_directory({'empty': {'folder': {}}})
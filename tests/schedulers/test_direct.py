@@ -9,6 +9,8 @@
 ###########################################################################
 # pylint: disable=redefined-outer-name
 """Tests for the ``DirectScheduler`` plugin."""
+import time
+
 import pytest
 
 from aiida.common.datastructures import CodeRunMode
@@ -72,3 +74,35 @@ def test_submit_script_with_num_cores_per_mpiproc(scheduler, template):
     )
     result = scheduler.get_submit_script(template)
     assert f'export OMP_NUM_THREADS={num_cores_per_mpiproc}' in result
+
+
+def test_submit_from_scripts(scheduler, tmp_path):
+    """Test that ``submit_from_scripts`` submits each script in its own working directory with a single command."""
+    from aiida.transports.plugins.local import LocalTransport
+
+    submissions = []
+
+    for name in ('first', 'second directory', 'missing', 'last'):
+        workdir = tmp_path / name
+        if name != 'missing':
+            workdir.mkdir()
+            (workdir / 'submit.sh').write_text(f'echo {name} > output')
+        submissions.append((str(workdir), 'submit.sh'))
+
+    with LocalTransport() as transport:
+        scheduler.set_transport(transport)
+        results = scheduler.submit_from_scripts(submissions)
+
+    assert len(results) == 4
+    assert all(result.isdigit() for index, result in enumerate(results) if index != 2)
+    assert isinstance(results[2], SchedulerError)
+    assert 'missing' in str(results[2])
+
+    # The jobs run in the background, so wait for them to write their output
+    for name in ('first', 'second directory', 'last'):
+        output = tmp_path / name / 'output'
+        for _ in range(50):
+            if output.exists() and output.read_text():
+                break
+            time.sleep(0.1)
+        assert output.read_text() == f'{name}\n'
@@ -10,6 +10,7 @@
 # pylint: disable=line-too-long
 """Tests for the SLURM scheduler plugin."""
 import datetime
+import json
 import logging
 import unittest
 import uuid
@@ -37,6 +38,39 @@ JOBS_QUEUED = 2
 USERS_RUNNING = ['user5', 'user6']
 JOBS_RUNNING = ['862538', '861352', '863553', '863554']
 
+# Output of `squeue --json`, with only the parsed fields. The first job is reported like SLURM 23.02 and newer do, with
+# a list of states and numbers as dictionaries, the others like older versions do.
+JSON_SQUEUE_TO_TEST = json.dumps({
+    'jobs': [
+        {
+            'job_id': 863553, 'job_state': ['RUNNING'], 'state_reason': 'None', 'user_name': 'user5',
+            'node_count': {'set': True, 'infinite': False, 'number': 1},
+            'cpus': {'set': True, 'infinite': False, 'number': 32}, 'nodes': 'nid00471', 'partition': 'normal',
+            'time_limit': {'set': True, 'infinite': False, 'number': 30},
+            'start_time': {'set': True, 'infinite': False, 'number': 1369302251},
+            'submit_time': {'set': True, 'infinite': False, 'number': 1369298531}, 'name': 'bash'
+        },
+        {
+            'job_id': 863554, 'job_state': ['RUNNING', 'COMPLETING'], 'state_reason': 'None', 'user_name': 'user5',
+            'node_count': {'set': True, 'infinite': False, 'number': 1},
+            'cpus': {'set': True, 'infinite': False, 'number': 32}, 'nodes': 'nid00471', 'partition': 'normal',
+            'time_limit': {'set': False, 'infinite': True, 'number': 0},
+            'start_time': {'set': True, 'infinite': False, 'number': 1369302251},
+            'submit_time': {'set': True, 'infinite': False, 'number': 1369298531}, 'name': 'bash'
+        },
+        {
+            'job_id': 863313, 'job_state': 'PENDING', 'state_reason': 'JobHeldUser', 'user_name': 'user4',
+            'node_count': 1, 'cpus': 1, 'nodes': '', 'partition': 'normal', 'time_limit': 60, 'start_time': 0,
+            'submit_time': 1369261692, 'name': 'test'
+        },
+        {
+            'job_id': 863100, 'job_state': 'PENDING', 'state_reason': 'Resources', 'user_name': 'user2',
+            'node_count': 32, 'cpus': 1024, 'nodes': '', 'partition': 'normal', 'time_limit': 4294967294,
+            'start_time': 1369313084, 'submit_time': 1369189439, 'name': 'eq_solve_e4.slm'
+        },
+    ]
+})
+
 
 def test_resource_validation():
     """Tests to verify that resources are correctly validated."""
@@ -149,6 +183,66 @@ class TestParserSqueue(unittest.TestCase):
             scheduler._parse_joblist_output(0, TEXT_SQUEUE_TO_TEST, 'error message')  # pylint: disable=protected-access
 
 
+    def test_parse_joblist_output_filtered(self):
+        """
+        Test that _parse_joblist_output_filtered only parses the requested jobs
+        """
+        scheduler = SlurmScheduler()
+        job_ids = {'863553', '862540', '999999'}
+
+        job_list = scheduler._parse_joblist_output_filtered(0, TEXT_SQUEUE_TO_TEST, '', job_ids)  # pylint: disable=protected-access
+        job_dict = {j.job_id: j for j in scheduler._parse_joblist_output(0, TEXT_SQUEUE_TO_TEST, '')}  # pylint: disable=protected-access
+
+        assert sorted(j.job_id for j in job_list) == ['862540', '863553']
+        for job in job_list:
+            assert job.get_dict() == job_dict[job.job_id].get_dict()
+
+
+def test_parse_squeue_json_output():
+    """Test that `_parse_joblist_output` parses the output of `squeue --json` of old and new versions of SLURM."""
+    scheduler = SlurmScheduler()
+
+    job_list = scheduler._parse_joblist_output(0, JSON_SQUEUE_TO_TEST, '')  # pylint: disable=protected-access
+    job_dict = {j.job_id: j for j in job_list}
+
+    assert sorted(job_dict) == ['863100', '863313', '863553', '863554']
+    assert job_dict['863553'].job_state == JobState.RUNNING
+    assert job_dict['863554'].job_state == JobState.RUNNING
+    assert job_dict['863313'].job_state == JobState.QUEUED_HELD
+    assert job_dict['863100'].job_state == JobState.QUEUED
+
+    assert job_dict['863553'].job_owner == 'user5'
+    assert job_dict['863553'].num_machines == 1
+    assert job_dict['863553'].num_mpiprocs == 32
+    assert job_dict['863553'].queue_name == 'normal'
+    assert job_dict['863553'].title == 'bash'
+    assert job_dict['863553'].requested_wallclock_time_seconds == 30 * 60
+    assert job_dict['863553'].dispatch_time == datetime.datetime.fromtimestamp(1369302251)
+    assert job_dict['863553'].submission_time == datetime.datetime.fromtimestamp(1369298531)
+    assert job_dict['863553'].wallclock_time_seconds > 0
+
+    assert job_dict['863554'].requested_wallclock_time_seconds == 2**31 - 1
+    assert job_dict['863313'].requested_wallclock_time_seconds == 60 * 60
+    assert job_dict['863313'].dispatch_time is None
+    assert job_dict['863100'].requested_wallclock_time_seconds is None
+    assert job_dict['863100'].num_mpiprocs == 1024
+
+    job_list = scheduler._parse_joblist_output_filtered(0, JSON_SQUEUE_TO_TEST, '', {'863313', '1'})  # pylint: disable=protected-access
+    assert [j.job_id for j in job_list] == ['863313']
+
+    with pytest.raises(SchedulerError, match='Unable to parse the JSON output of squeue'):
+        scheduler._parse_joblist_output(0, '{"errors": []}', '')  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize('job', ({'job_id': 1, 'job_state': []}, {'job_id': 1}))
+def test_parse_squeue_json_output_no_state(job):
+    """Test that a job with an empty or missing ``job_state`` in the output of ``squeue --json`` is undetermined."""
+    scheduler = SlurmScheduler()
+
+    job_list = scheduler._parse_joblist_output(0, json.dumps({'jobs': [job]}), '')  # pylint: disable=protected-access
+    assert [j.job_state for j in job_list] == [JobState.UNDETERMINED]
+
+
 @pytest.mark.parametrize(
     'value,expected', [('2', 2 * 60), ('02', 2 * 60), ('02:3', 2 * 60 + 3), ('02:03', 2 * 60 + 3),
                        ('1:02:03', 3600 + 2 * 60 + 3), ('01:02:03', 3600 + 2 * 60 + 3), ('1-3', 86400 + 3 * 3600),
@@ -414,6 +508,18 @@ class TestJoblistCommand:
         assert '123,456' in command
         assert '456,456' not in command
 
+    def test_joblist_structured_output(self):
+        """Test that the JSON output is requested if the structured output is enabled."""
+        scheduler = SlurmScheduler()
+
+        command = scheduler._get_joblist_command(jobs=['123', '456'])  # pylint: disable=protected-access
+        assert '--json' not in command
+
+        scheduler.set_structured_output(True)
+        command = scheduler._get_joblist_command(jobs=['123', '456'])  # pylint: disable=protected-access
+        assert command.startswith('squeue --json')
+        assert '--jobs=123,456' in command
+
 
 def test_parse_out_of_memory():
     """Test that for job that failed due to OOM `parse_output` return the `ERROR_SCHEDULER_OUT_OF_MEMORY` code."""
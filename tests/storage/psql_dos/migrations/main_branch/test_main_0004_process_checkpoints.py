@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Test ``main_0004_process_checkpoints.py``."""
+from aiida.common import timezone
+from aiida.common.utils import get_new_uuid
+from aiida.storage.psql_dos.migrator import PsqlDosMigrator
+
+
+def test_migration(perform_migrations: PsqlDosMigrator):
+    """Test the migration moves the ``checkpoints`` attribute of process nodes to the ``db_dbcheckpoint`` table."""
+    perform_migrations.migrate_up('main@main_0003')
+
+    user_model = perform_migrations.get_current_table('db_dbuser')
+    node_model = perform_migrations.get_current_table('db_dbnode')
+
+    with perform_migrations.session() as session:
+        user = user_model(email='test', first_name='test', last_name='test', institution='test')
+        session.add(user)
+        session.commit()
+
+        def create_node(node_type, attributes):
+            return node_model(
+                uuid=get_new_uuid(),
+                user_id=user.id,
+                ctime=timezone.now(),
+                mtime=timezone.now(),
+                label='test',
+                description='',
+                node_type=node_type,
+                attributes=attributes,
+                repository_metadata={},
+                extras={},
+            )
+
+        workflow = create_node('process.workflow.workchain.WorkChainNode.', {'checkpoints': 'yaml', 'sealed': False})
+        calculation = create_node('process.calculation.calcfunction.CalcFunctionNode.', {'sealed': True})
+        data = create_node('data.core.dict.Dict.', {'checkpoints': 'value'})
+        session.add_all((workflow, calculation, data))
+        session.commit()
+
+        workflow_id = workflow.id
+        calculation_id = calculation.id
+        data_id = data.id
+
+    # Perform the migration that is being tested.
+    perform_migrations.migrate_up('main@main_0004')
+
+    node_model = perform_migrations.get_current_table('db_dbnode')
+    checkpoint_model = perform_migrations.get_current_table('db_dbcheckpoint')
+
+    # Check that only the checkpoint of the process node was moved.
+    with perform_migrations.session() as session:
+        checkpoints = {row.dbnode_id: row.checkpoint for row in session.query(checkpoint_model).all()}
+        assert checkpoints == {workflow_id: 'yaml'}
+
+        assert session.query(node_model).filter(node_model.id == workflow_id).one().attributes == {'sealed': False}
+        assert session.query(node_model).filter(node_model.id == calculation_id).one().attributes == {'sealed': True}
+        assert session.query(node_model).filter(node_model.id == data_id).one().attributes == {'checkpoints': 'value'}
+
+    # Check that the downgrade moves the checkpoint back to the attributes.
+    perform_migrations.migrate_down('main@main_0003')
+
+    node_model = perform_migrations.get_current_table('db_dbnode')
+
+    with perform_migrations.session() as session:
+        workflow = session.query(node_model).filter(node_model.id == workflow_id).one()
+        assert workflow.attributes == {'checkpoints': 'yaml', 'sealed': False}
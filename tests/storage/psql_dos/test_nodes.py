@@ -116,3 +116,67 @@ class TestNodeBasicSQLA:
         # Check again that the node is in the db
         res = session.query(DbNode.uuid).filter(DbNode.uuid == node_uuid).all()
         assert len(res) == 1, f'There should be a node in the session/DB with the UUID {node_uuid}'
+
+
+@pytest.fixture
+def node_updates(backend):
+    """Return the list of parameters of the ``UPDATE`` statements on the node table, which is filled while in use."""
+    from sqlalchemy import event
+
+    engine = backend.get_session().bind
+    updates = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):  # pylint: disable=unused-argument
+        if statement.startswith('UPDATE db_dbnode'):
+            updates.append(parameters)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    yield updates
+    event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def test_set_attribute_partial(node_updates):
+    """Test that setting attributes of a stored node only sends the changed attributes to the database."""
+    node = Data()
+    node.base.attributes.set_many({'large': 'a' * 10000, 'key': 'value'})
+    node.store()
+    node_updates.clear()
+
+    node.backend_entity.set_attribute('key', 'changed')
+    node.backend_entity.set_attribute_many({'other': None, 'nested': {'a': [1, 2]}})
+
+    assert len(node_updates) == 2
+    assert all('a' * 10000 not in str(parameters) for parameters in node_updates)
+    assert load_node(node.pk).base.attributes.all == {
+        'large': 'a' * 10000,
+        'key': 'changed',
+        'other': None,
+        'nested': {
+            'a': [1, 2]
+        },
+    }
+
+
+def test_batch_attributes(node_updates):
+    """Test that the attribute changes within ``batch_attributes`` are written with a single statement when exiting."""
+    node = Data().store()
+    backend_node = node.backend_entity
+    node_updates.clear()
+
+    with backend_node.batch_attributes():
+        backend_node.set_attribute('a', 1)
+        with backend_node.batch_attributes():
+            backend_node.set_attribute_many({'b': 2, 'c': 3})
+        backend_node.set_attribute('a', 4)
+        assert backend_node.attributes == {'a': 4, 'b': 2, 'c': 3}
+        assert not node_updates
+
+    assert len(node_updates) == 1
+    assert load_node(node.pk).base.attributes.all == {'a': 4, 'b': 2, 'c': 3}
+
+    # Changes that cannot be combined, such as deletions, first write the pending changes
+    with backend_node.batch_attributes():
+        backend_node.set_attribute('d', 5)
+        backend_node.delete_attribute('a')
+
+    assert load_node(node.pk).base.attributes.all == {'b': 2, 'c': 3, 'd': 5}
@@ -48,14 +48,21 @@ def test_strip_checkpoints(tmp_path):
     process.seal()
     process.store()
 
+    # Create a `ProcessNode` whose checkpoint is set after storing, which the storage may keep out of the attributes
+    process_stored = orm.WorkflowNode().store()
+    process_stored.set_checkpoint('checkpoint')
+    process_stored.seal()
+
     # Export with checkpoints
     export_file = tmp_path / 'export1.aiida'
-    create_archive([process], filename=export_file, strip_checkpoints=False)
+    create_archive([process, process_stored], filename=export_file, strip_checkpoints=False)
     with get_format().open(export_file, 'r') as archive:
         assert archive.get(orm.ProcessNode, uuid=process.uuid).checkpoint == {'foo': 'bar'}
+        assert archive.get(orm.ProcessNode, uuid=process_stored.uuid).checkpoint == 'checkpoint'
 
     # Export without checkpoints
     export_file = tmp_path / 'export2.aiida'
-    create_archive([process], filename=export_file, strip_checkpoints=True)
+    create_archive([process, process_stored], filename=export_file, strip_checkpoints=True)
     with get_format().open(export_file, 'r') as archive:
         assert archive.get(orm.ProcessNode, uuid=process.uuid).checkpoint is None
+        assert archive.get(orm.ProcessNode, uuid=process_stored.uuid).checkpoint is None
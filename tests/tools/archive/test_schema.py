@@ -65,13 +65,13 @@ def diff_schemas(psql_insp: Inspector, sqlite_insp: Inspector):  # pylint: disab
     diffs: dict = {}
 
     for table_name in sqlite_insp.get_table_names():
-        if not table_name.startswith('db_') or table_name == 'db_dbsetting':
-            continue  # not an aiida table
+        if not table_name.startswith('db_') or table_name in ('db_dbsetting', 'db_dbcheckpoint'):
+            continue  # not an aiida table or not part of the archive
         if table_name not in psql_insp.get_table_names():
             diffs[table_name] = 'additional'
     for table_name in psql_insp.get_table_names():
-        if not table_name.startswith('db_') or table_name == 'db_dbsetting':
-            continue  # not an aiida table
+        if not table_name.startswith('db_') or table_name in ('db_dbsetting', 'db_dbcheckpoint'):
+            continue  # not an aiida table or not part of the archive
         if table_name not in sqlite_insp.get_table_names():
             diffs[table_name] = 'missing'
             continue
@@ -8,13 +8,16 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Tests for aiida.tools.graph.graph_traversers"""
+import itertools
+
 import pytest
 
 from aiida.common.links import LinkType
+from aiida.storage.sqlite_temp import SqliteTempBackend
 from aiida.tools.graph.graph_traversers import get_nodes_delete, traverse_graph
 
 
-def create_minimal_graph():
+def create_minimal_graph(backend=None):
     """
     Creates a minimal graph which has one parent workflow (W2) that calls
     a child workflow (W1) which calls a calculation function (C0). There
@@ -49,12 +52,12 @@ def create_minimal_graph():
     """
     from aiida import orm
 
-    data_i = orm.Data().store()
-    data_o = orm.Data().store()
+    data_i = orm.Data(backend=backend).store()
+    data_o = orm.Data(backend=backend).store()
 
-    calc_0 = orm.CalculationNode()
-    work_1 = orm.WorkflowNode()
-    work_2 = orm.WorkflowNode()
+    calc_0 = orm.CalculationNode(backend=backend)
+    work_1 = orm.WorkflowNode(backend=backend)
+    work_2 = orm.WorkflowNode(backend=backend)
 
     calc_0.base.links.add_incoming(data_i, link_type=LinkType.INPUT_CALC, link_label='inpcalc')
     work_1.base.links.add_incoming(data_i, link_type=LinkType.INPUT_WORK, link_label='inpwork')
@@ -383,6 +386,38 @@ class TestTraverseGraph:
         assert obtained_results['nodes'] == set()
         assert obtained_results['links'] == set()
 
+    @pytest.mark.parametrize('storage', ('profile', 'sqlite_temp'))
+    def test_traversal_storage(self, storage):
+        """Test that the traversal by the storage gives the same nodes and links as the rule engine."""
+        backend = SqliteTempBackend(SqliteTempBackend.create_profile(debug=False)) if storage == 'sqlite_temp' else None
+        nodes_dict = create_minimal_graph(backend)
+        link_types = [LinkType.INPUT_CALC, LinkType.CREATE, LinkType.INPUT_WORK, LinkType.RETURN, LinkType.CALL_WORK]
+
+        for node, links_forward, links_backward in itertools.product(
+            nodes_dict.values(), itertools.combinations(link_types, 2), itertools.combinations(link_types, 2)
+        ):
+            kwargs = {
+                'get_links': True,
+                'links_forward': links_forward,
+                'links_backward': links_backward,
+                'backend': backend,
+            }
+            expected = traverse_graph([node.pk], storage_traversal=False, **kwargs)
+            obtained = traverse_graph([node.pk], **kwargs)
+            assert obtained == expected
+
+    def test_traversal_storage_fallback(self, monkeypatch):
+        """Test that the rule engine is used if the storage does not support traversing the graph."""
+        from aiida.manage import get_manager
+        from aiida.orm.implementation import StorageBackend
+
+        nodes_dict = create_minimal_graph()
+        storage = get_manager().get_profile_storage()
+        monkeypatch.setattr(type(storage), 'traverse_graph', StorageBackend.traverse_graph)
+
+        obtained = traverse_graph([nodes_dict['data_i'].pk], links_forward=[LinkType.INPUT_CALC, LinkType.CREATE])
+        assert obtained['nodes'] == {nodes_dict['data_i'].pk, nodes_dict['calc_0'].pk, nodes_dict['data_o'].pk}
+
     def test_delete_aux(self):
         """Tests for the get_nodes_delete function"""
 
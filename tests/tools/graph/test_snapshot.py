@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=redefined-outer-name
+"""Tests for :mod:`aiida.tools.graph.snapshot`."""
+import pytest
+
+from aiida import orm
+from aiida.common.exceptions import NotExistent
+from aiida.common.links import GraphTraversalRules, LinkType
+from aiida.orm.utils.links import LinkQuadruple
+from aiida.tools.graph.graph_traversers import traverse_graph, validate_traversal_rules
+from aiida.tools.graph.snapshot import GraphSnapshot
+
+
+@pytest.fixture
+def graph():
+    """Create a workflow that calls a calculation, which creates an output from an input, and return its nodes.
+
+    The workflow takes the input and returns the output of the calculation.
+    """
+    data_i = orm.Data().store()
+    workflow = orm.WorkflowNode()
+    workflow.base.links.add_incoming(data_i, link_type=LinkType.INPUT_WORK, link_label='input')
+    workflow.store()
+
+    calculation = orm.CalculationNode()
+    calculation.base.links.add_incoming(data_i, link_type=LinkType.INPUT_CALC, link_label='input')
+    calculation.base.links.add_incoming(workflow, link_type=LinkType.CALL_CALC, link_label='call')
+    calculation.store()
+
+    data_o = orm.Data()
+    data_o.base.links.add_incoming(calculation, link_type=LinkType.CREATE, link_label='output')
+    data_o.store()
+    data_o.base.links.add_incoming(workflow, link_type=LinkType.RETURN, link_label='output')
+
+    return {'data_i': data_i.pk, 'workflow': workflow.pk, 'calculation': calculation.pk, 'data_o': data_o.pk}
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_closure(graph):
+    """Test the ancestors, descendants and neighbourhood of nodes."""
+    snapshot = GraphSnapshot()
+
+    assert snapshot.node_ids.tolist() == sorted(graph.values())
+    assert snapshot.number_of_links == 5
+    data_i, workflow, calculation, data_o = graph['data_i'], graph['workflow'], graph['calculation'], graph['data_o']
+
+    assert snapshot.get_ancestors([data_o]).tolist() == sorted([data_i, workflow, calculation])
+    assert snapshot.get_ancestors([data_o], link_types=[LinkType.CREATE]).tolist() == [calculation]
+    assert snapshot.get_ancestors([data_o], max_hops=1).tolist() == sorted([workflow, calculation])
+    assert snapshot.get_descendants([data_i], link_types=[LinkType.INPUT_CALC, LinkType.CREATE]).tolist() == sorted([
+        calculation, data_o
+    ])
+    assert snapshot.get_descendants([data_o]).tolist() == []
+    assert snapshot.get_neighbourhood([data_o], link_types=[LinkType.CREATE]).tolist() == sorted([calculation, data_o])
+    assert snapshot.get_neighbourhood([calculation], hops=2).tolist() == sorted(graph.values())
+
+    with pytest.raises(NotExistent):
+        snapshot.get_ancestors([-1])
+
+    with pytest.raises(TypeError):
+        snapshot.get_ancestors([data_o], link_types=['create'])
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+@pytest.mark.parametrize('ruleset', (GraphTraversalRules.DELETE, GraphTraversalRules.EXPORT))
+def test_traverse(graph, ruleset):
+    """Test that the traversal with a set of rules gives the same nodes as :func:`traverse_graph`."""
+    snapshot = GraphSnapshot()
+    rules = validate_traversal_rules(ruleset)
+
+    for pk in graph.values():
+        for max_iterations in (None, 1):
+            kwargs = {
+                'links_forward': rules['forward'],
+                'links_backward': rules['backward'],
+                'max_iterations': max_iterations,
+            }
+            expected = traverse_graph([pk], storage_traversal=False, **kwargs)['nodes']
+            assert set(snapshot.traverse([pk], **kwargs).tolist()) == expected
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_get_incoming_outgoing(graph):
+    """Test returning the links of a node."""
+    snapshot = GraphSnapshot()
+
+    assert set(snapshot.get_incoming(graph['data_o'])) == {
+        LinkQuadruple(graph['calculation'], graph['data_o'], LinkType.CREATE, 'output'),
+        LinkQuadruple(graph['workflow'], graph['data_o'], LinkType.RETURN, 'output'),
+    }
+    assert snapshot.get_outgoing(graph['workflow'], link_types=[LinkType.CALL_CALC]) == [
+        LinkQuadruple(graph['workflow'], graph['calculation'], LinkType.CALL_CALC, 'call'),
+    ]
+    assert snapshot.get_outgoing(graph['data_o']) == []
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_refresh(graph):
+    """Test that refreshing the snapshot adds the new nodes and links."""
+    snapshot = GraphSnapshot()
+    assert snapshot.refresh() == 0
+
+    # A node that is constructed before the refresh but stored afterwards has an older ``ctime``
+    data_early = orm.Data()
+    isolated = orm.Data().store()
+
+    workflow = orm.WorkflowNode()
+    workflow.base.links.add_incoming(data_early, link_type=LinkType.INPUT_WORK, link_label='input')
+    data_early.store()
+    workflow.store()
+    orm.load_node(graph['data_o']).base.links.add_incoming(workflow, link_type=LinkType.RETURN, link_label='output')
+
+    assert snapshot.refresh() == 2
+    assert snapshot.node_ids.tolist() == sorted([*graph.values(), data_early.pk, isolated.pk, workflow.pk])
+    ancestors = snapshot.get_ancestors([graph['data_o']], link_types=[LinkType.RETURN])
+    assert ancestors.tolist() == sorted([graph['workflow'], workflow.pk])
+    assert snapshot.get_descendants([data_early.pk]).tolist() == sorted([workflow.pk, graph['data_o']])
+    assert snapshot.get_neighbourhood([isolated.pk], hops=3).tolist() == [isolated.pk]
@@ -24,10 +24,12 @@ import string
 import tempfile
 import time
 import unittest
+from unittest import mock
 import uuid
 
 import psutil
 
+from aiida.common.escaping import escape_for_bash
 from aiida.plugins import SchedulerFactory
 
 # TODO : test for copy with pattern
@@ -509,6 +511,52 @@ class TestDirectoryManipulation(unittest.TestCase):
             self.assertEqual(new_dir, transport.getcwd())
 
 
+    @run_for_all_plugins
+    def test_expand_paths(self, custom_transport):
+        """Test that ``expand_paths`` gives the same results with and without batching the expansion."""
+        with custom_transport as transport:
+            location = transport.normalize(os.path.join('/', 'tmp'))
+            directory = 'temp_dir_test_expand_paths'
+            transport.chdir(location)
+
+            while transport.isdir(directory):
+                # I append a random letter/number until it is unique
+                directory += random.choice(string.ascii_uppercase + string.digits)
+
+            transport.mkdir(directory)
+            transport.chdir(directory)
+            transport.makedirs('path/sub')
+            transport.makedirs('with space')
+            for filename in ('a.txt', '.hidden', 'path/b.txt', 'path/sub/c.txt', 'with space/d e.txt'):
+                transport.exec_command_wait(f'touch {escape_for_bash(filename)}')
+
+            pathnames = [
+                'a.txt', '*.txt', 'path/*', '*/*.txt', 'missing', 'missing*', 'with space/*', 'with space', '.*',
+                os.path.join(location, directory, 'path', 's*')
+            ]
+            expected = {
+                'a.txt': [('a.txt', False)],
+                '*.txt': [('a.txt', False)],
+                'path/*': [('path/b.txt', False), ('path/sub', True)],
+                '*/*.txt': [('path/b.txt', False), ('with space/d e.txt', False)],
+                'missing': [],
+                'missing*': [],
+                'with space/*': [('with space/d e.txt', False)],
+                'with space': [('with space', True)],
+                '.*': [('.hidden', False)],
+                pathnames[-1]: [(os.path.join(location, directory, 'path', 'sub'), True)],
+            }
+
+            try:
+                for batched in (True, False):
+                    with mock.patch.object(transport, 'SUPPORTS_BATCHED_GLOB', batched):
+                        expanded = transport.expand_paths(pathnames)
+                    self.assertEqual({key: sorted(value) for key, value in expanded.items()}, expected)
+            finally:
+                transport.chdir('..')
+                transport.rmtree(directory)
+
+
 class TestPutGetFile(unittest.TestCase):
     """
     Test to verify whether the put and get functions behave correctly on files.
@@ -693,6 +741,42 @@ class TestPutGetFile(unittest.TestCase):
             transport.rmdir(directory)
 
 
+    @run_for_all_plugins
+    def test_get_object_stream(self, custom_transport):
+        """Test reading the content of a remote file through ``get_object_stream``."""
+        local_dir = os.path.join('/', 'tmp')
+        remote_dir = local_dir
+        directory = 'tmp_try'
+
+        with custom_transport as transport:
+            transport.chdir(remote_dir)
+            while transport.isdir(directory):
+                # I append a random letter/number until it is unique
+                directory += random.choice(string.ascii_uppercase + string.digits)
+
+            transport.mkdir(directory)
+            transport.chdir(directory)
+
+            local_file_name = os.path.join(local_dir, directory, 'file.txt')
+            remote_file_name = 'file_remote.txt'
+
+            content = b'some bytes with non-unicode -> \xFA' * 10000
+            with open(local_file_name, 'wb') as fhandle:
+                fhandle.write(content)
+
+            transport.putfile(local_file_name, remote_file_name)
+
+            with transport.get_object_stream(remote_file_name) as handle:
+                self.assertIsInstance(handle, io.BufferedIOBase)
+                self.assertEqual(handle.read(), content)
+
+            os.remove(local_file_name)
+            transport.remove(remote_file_name)
+
+            transport.chdir('..')
+            transport.rmdir(directory)
+
+
 class TestPutGetTree(unittest.TestCase):
     """
     Test to verify whether the put and get functions behave correctly on folders.
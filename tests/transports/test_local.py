@@ -61,3 +61,26 @@ def test_gotocomputer():
             """echo '  ** /remote_dir/' ; echo '  ** seems to have been deleted, I logout...' ; fi" """
         )
         assert cmd_str == expected_str
+
+
+def test_expand_paths_dot_entries(monkeypatch):
+    """Test that ``expand_paths`` drops the ``.`` and ``..`` entries that wildcards match in bash before version 5.2.
+
+    The output of the remote command is emulated, so the test does not depend on the version of the local bash.
+    """
+    fields = [
+        'd', '.', 'd', '..', 'f', '.hidden', 'p', '',  # .*
+        'd', 'path/.', 'd', 'path/..', 'f', 'path/.b', 'p', '',  # path/.*
+        'd', '..', 'p', '',  # ..
+        'f', 'path/../a.txt', 'p', '',  # path/../*.txt
+    ]
+    stdout = f'{LocalTransport._EXPAND_PATHS_MARKER}\0'.encode() + '\0'.join(fields).encode() + b'\0'  # pylint: disable=protected-access
+    monkeypatch.setattr(LocalTransport, 'exec_command_wait_bytes', lambda *args, **kwargs: (0, stdout, b''))
+
+    with LocalTransport() as transport:
+        assert transport.expand_paths(['.*', 'path/.*', '..', 'path/../*.txt']) == {
+            '.*': [('.hidden', False)],
+            'path/.*': [('path/.b', False)],
+            '..': [('..', True)],
+            'path/../*.txt': [('path/../a.txt', False)],
+        }
@@ -9,9 +9,13 @@
 ###########################################################################
 """Test the `SshTransport` plugin on localhost."""
 import logging
+import shutil
+import time
 import unittest
+from unittest import mock
 
 import paramiko
+import pytest
 
 from aiida.transports.plugins.ssh import SshTransport
 from aiida.transports.transport import TransportInternalError
@@ -142,3 +146,147 @@ def test_gotocomputer_proxyjump():
             """echo '  ** /remote_dir/' ; echo '  ** seems to have been deleted, I logout...' ; fi" """
         )
         assert cmd_str == expected_str
+
+
+@pytest.mark.parametrize('transfer_concurrency', (1, 3))
+def test_gettree_puttree_concurrency(tmp_path, transfer_concurrency):
+    """Test that ``puttree`` and ``gettree`` copy all files for any ``transfer_concurrency``."""
+    source = tmp_path / 'source'
+    (source / 'sub' / 'nested').mkdir(parents=True)
+    for index, relpath in enumerate(('a.txt', 'b.txt', 'sub/c.txt', 'sub/d.txt', 'sub/nested/e.txt')):
+        (source / relpath).write_text(f'content {index}' * (index + 1))
+
+    with SshTransport(
+        machine='localhost',
+        timeout=30,
+        load_system_host_keys=True,
+        key_policy='AutoAddPolicy',
+        transfer_concurrency=transfer_concurrency
+    ) as transport:
+        transport.chdir(str(tmp_path))
+        transport.puttree(str(source), 'remote')
+        transport.gettree('remote', str(tmp_path / 'retrieved'))
+
+    for filepath in source.rglob('*'):
+        if filepath.is_file():
+            assert (tmp_path / 'retrieved' / filepath.relative_to(source)).read_text() == filepath.read_text()
+
+
+def test_transfer_files_concurrent(tmp_path, aiida_caplog):
+    """Test that ``_transfer_files`` distributes the files over multiple SFTP channels, which are closed afterwards."""
+
+    class MockSFTPClient:
+        """Mock of ``paramiko.SFTPClient`` that copies local files."""
+
+        def __init__(self):
+            self.closed = False
+            self.transferred = 0
+
+        @staticmethod
+        def getcwd():
+            return str(tmp_path)
+
+        def get(self, remotepath, localpath):
+            self.transferred += 1
+            shutil.copyfile(remotepath, localpath)
+
+        def close(self):
+            self.closed = True
+
+    channels = []
+
+    def open_sftp():
+        channels.append(MockSFTPClient())
+        return channels[-1]
+
+    (tmp_path / 'source').mkdir()
+    (tmp_path / 'target').mkdir()
+    transfers = []
+    for index in range(10):
+        (tmp_path / 'source' / f'file_{index}').write_text(f'content {index}')
+        transfers.append((f'source/file_{index}', str(tmp_path / 'target' / f'file_{index}')))
+
+    transport = SshTransport(machine='localhost', transfer_concurrency=4)
+    transport._is_open = True  # pylint: disable=protected-access
+    transport._sftp = MockSFTPClient()  # pylint: disable=protected-access
+    transport._client = mock.Mock(open_sftp=open_sftp)  # pylint: disable=protected-access
+
+    with aiida_caplog.at_level(logging.DEBUG, logger='aiida'):
+        transport._transfer_files(transfers)  # pylint: disable=protected-access
+
+    for index in range(10):
+        assert (tmp_path / 'target' / f'file_{index}').read_text() == f'content {index}'
+
+    assert len(channels) == 4
+    assert all(channel.closed for channel in channels)
+    assert sum(channel.transferred for channel in channels) == 10
+    assert 'get of 10 files with concurrency 4' in aiida_caplog.text
+    assert aiida_caplog.text.count('transferred ') == 10
+
+
+def test_transfer_files_concurrent_failure(tmp_path):
+    """Test that ``_transfer_files`` cancels the pending transfers once a transfer fails."""
+    transferred = []
+
+    class MockSFTPClient:
+        """Mock of ``paramiko.SFTPClient`` that fails to get the first file."""
+
+        @staticmethod
+        def getcwd():
+            return str(tmp_path)
+
+        @staticmethod
+        def get(remotepath, localpath):
+            if remotepath.endswith('file_0'):
+                raise IOError('transfer failed')
+            time.sleep(0.05)
+            transferred.append(remotepath)
+            shutil.copyfile(remotepath, localpath)
+
+        def close(self):
+            pass
+
+    (tmp_path / 'source').mkdir()
+    (tmp_path / 'target').mkdir()
+    transfers = []
+    for index in range(10):
+        (tmp_path / 'source' / f'file_{index}').write_text(f'content {index}')
+        transfers.append((f'source/file_{index}', str(tmp_path / 'target' / f'file_{index}')))
+
+    transport = SshTransport(machine='localhost', transfer_concurrency=2)
+    transport._is_open = True  # pylint: disable=protected-access
+    transport._sftp = MockSFTPClient()  # pylint: disable=protected-access
+    transport._client = mock.Mock(open_sftp=MockSFTPClient)  # pylint: disable=protected-access
+
+    with pytest.raises(IOError, match='transfer failed'):
+        transport._transfer_files(transfers)  # pylint: disable=protected-access
+
+    assert len(transferred) < 9
+
+
+def test_transfer_files_overridden(tmp_path):
+    """Test that ``_transfer_files`` transfers the files through ``getfile`` if a subclass overrides it."""
+    calls = []
+
+    class SubclassTransport(SshTransport):
+        """Subclass that overrides ``getfile``."""
+
+        def getfile(self, remotepath, localpath, *args, **kwargs):  # pylint: disable=arguments-differ
+            calls.append((remotepath, localpath))
+            shutil.copyfile(remotepath, localpath)
+
+    (tmp_path / 'source').mkdir()
+    (tmp_path / 'target').mkdir()
+    transfers = []
+    for index in range(3):
+        (tmp_path / 'source' / f'file_{index}').write_text(f'content {index}')
+        transfers.append((f'source/file_{index}', str(tmp_path / 'target' / f'file_{index}')))
+
+    transport = SubclassTransport(machine='localhost', transfer_concurrency=4)
+    transport._is_open = True  # pylint: disable=protected-access
+    transport._sftp = mock.Mock(getcwd=lambda: str(tmp_path))  # pylint: disable=protected-access
+    transport._client = mock.Mock()  # pylint: disable=protected-access
+    transport._transfer_files(transfers)  # pylint: disable=protected-access
+
+    assert calls == [(str(tmp_path / source), target) for source, target in transfers]
+    assert not transport._client.open_sftp.called  # pylint: disable=protected-access
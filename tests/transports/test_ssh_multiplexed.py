@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=redefined-outer-name,protected-access
+"""Test the `SshMultiplexedTransport` plugin on localhost."""
+import io
+import os
+import stat
+import tempfile
+from unittest import mock
+
+import pytest
+
+from aiida.transports.plugins.ssh_multiplexed import SshMultiplexedTransport
+
+# This will be used by test_all_plugins
+
+plugin_transport = SshMultiplexedTransport(machine='localhost', timeout=30)
+
+FAKE_SSH = """#!/bin/bash
+# Emulates the OpenSSH client: the master connection is represented by the marker file and commands run locally
+marker='{marker}'
+echo "$@" >> "$marker.log"
+case " $* " in
+    *" -O check "*) test -e "$marker"; exit $? ;;
+    *" ControlMaster=yes "*) touch "$marker"; exit 0 ;;
+esac
+exec bash -c "${{@: -1}}"
+"""
+
+
+@pytest.fixture
+def fake_ssh(tmp_path, monkeypatch):
+    """Use a fake ``ssh`` client that runs commands locally and return the path of the master connection marker."""
+    marker = tmp_path / 'master'
+    executable = tmp_path / 'ssh'
+    executable.write_text(FAKE_SSH.format(marker=marker))
+    executable.chmod(executable.stat().st_mode | stat.S_IEXEC)
+
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    monkeypatch.setattr(SshMultiplexedTransport, '_SSH_EXECUTABLE', str(executable))
+    monkeypatch.setattr(SshMultiplexedTransport, '_connection_statistics', {})
+
+    sftp = mock.MagicMock()
+    sftp.getcwd.return_value = str(tmp_path)
+    monkeypatch.setattr(SshMultiplexedTransport, '_open_sftp', lambda self: sftp)
+
+    return marker
+
+
+def test_get_ssh_command():
+    """Test that the connection options are converted to the options of the OpenSSH client."""
+    transport = SshMultiplexedTransport(
+        machine='cluster', username='user', port=2222, key_filename='/keys/id', proxy_jump='jump', compress=True
+    )
+    command = transport._get_ssh_command('-O', 'check')
+
+    assert command[0] == 'ssh'
+    assert command[-3:] == ['-O', 'check', 'cluster']
+    assert f'ControlPath={transport._control_path}' in command
+    assert 'BatchMode=yes' in command
+    assert ' '.join(command[1:-3]).endswith('-l user -p 2222 -i /keys/id -J jump -C')
+    assert 'BatchMode=yes' not in transport._get_ssh_command(batch_mode=False)
+    assert transport.connection_string == 'user@cluster:2222'
+
+
+def test_control_path():
+    """Test that transports share the control path if and only if they have the same connection options."""
+    transport = SshMultiplexedTransport(machine='cluster', username='user')
+
+    assert SshMultiplexedTransport(machine='cluster', username='user')._control_path == transport._control_path
+    assert SshMultiplexedTransport(machine='cluster', username='other')._control_path != transport._control_path
+    assert SshMultiplexedTransport(machine='other', username='user')._control_path != transport._control_path
+
+
+def test_shared_master_connection(fake_ssh):
+    """Test that the master connection is opened by the first transport and reused by the others."""
+    with SshMultiplexedTransport(machine='localhost', control_persist=60):
+        assert fake_ssh.exists()
+
+    with SshMultiplexedTransport(machine='localhost', control_persist=60):
+        pass
+
+    assert SshMultiplexedTransport.get_connection_statistics() == {'localhost': {'opened': 1, 'reused': 1}}
+
+    invocations = fake_ssh.with_name('master.log').read_text().splitlines()
+    assert len([line for line in invocations if 'ControlMaster=yes' in line]) == 1
+    assert 'ControlPersist=60' in invocations[1]
+
+    # The master connection is opened again once it is no longer alive
+    os.remove(fake_ssh)
+
+    with SshMultiplexedTransport(machine='localhost'):
+        pass
+
+    assert SshMultiplexedTransport.get_connection_statistics() == {'localhost': {'opened': 2, 'reused': 1}}
+
+
+def test_exec_command_wait(fake_ssh, tmp_path):  # pylint: disable=unused-argument
+    """Test executing commands in the current working directory, with large inputs and outputs."""
+    content = os.urandom(2**20)
+
+    with SshMultiplexedTransport(machine='localhost') as transport:
+        assert transport.exec_command_wait('pwd') == (0, f'{tmp_path}\n', '')
+        assert transport.exec_command_wait('echo error >&2; exit 3') == (3, '', 'error\n')
+        assert transport.exec_command_wait_bytes('cat', stdin=io.BytesIO(content)) == (0, content, b'')
+        assert transport.exec_command_wait('cat', stdin='text') == (0, 'text', '')